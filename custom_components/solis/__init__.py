@@ -4,6 +4,7 @@ import asyncio
 import logging
 import os
 from datetime import datetime, timedelta, timezone
+from functools import partial
 
 import homeassistant.helpers.config_validation as cv
 import voluptuous as vol
@@ -15,21 +16,42 @@ from homeassistant.helpers.issue_registry import IssueSeverity, async_create_iss
 from homeassistant.helpers.typing import ConfigType
 from homeassistant.util import dt as dt_util
 
+from .api_utils import JSON_DECODER_AUTO
 from .const import (
+    CONF_BULK_POLLING,
     CONF_CONTROL,
+    CONF_CONTROL_CONCURRENCY,
+    CONF_DEDICATED_SESSION,
+    CONF_DNS_CACHE_TTL,
+    CONF_JSON_DECODER,
+    CONF_KEEPALIVE_TIMEOUT,
     CONF_KEY_ID,
+    CONF_MAX_CONCURRENCY,
     CONF_PASSWORD,
     CONF_PLANT_ID,
+    CONF_POOL_SIZE,
     CONF_PORTAL_DOMAIN,
+    CONF_REFRESH_CONTROL,
     CONF_REFRESH_NOK,
     CONF_REFRESH_OK,
+    CONF_REQUESTS_PER_SECOND,
     CONF_SECRET,
     CONF_USERNAME,
+    DEFAULT_DNS_CACHE_TTL,
+    DEFAULT_KEEPALIVE_TIMEOUT,
+    DEFAULT_MAX_CONCURRENCY,
+    DEFAULT_POOL_SIZE,
     DOMAIN,
 )
 from .ginlong_base import PortalConfig
+from .portal_session import async_acquire_session, async_release_session
 from .service import InverterService
-from .soliscloud_api import SoliscloudConfig
+from .soliscloud_api import (
+    DEFAULT_CONTROL_CONCURRENCY,
+    DEFAULT_REFRESH_CONTROL,
+    DEFAULT_REQUESTS_PER_SECOND,
+    SoliscloudConfig,
+)
 
 _LOGGER = logging.getLogger(__name__)
 
@@ -101,6 +123,10 @@ async def async_setup_entry(hass: HomeAssistant, entry: ConfigEntry) -> bool:
         portal_secret,
         portal_plantid,
         portal_password,
+        requests_per_second=config.get(CONF_REQUESTS_PER_SECOND, DEFAULT_REQUESTS_PER_SECOND),
+        control_concurrency=config.get(CONF_CONTROL_CONCURRENCY, DEFAULT_CONTROL_CONCURRENCY),
+        refresh_control=config.get(CONF_REFRESH_CONTROL, DEFAULT_REFRESH_CONTROL),
+        json_decoder=config.get(CONF_JSON_DECODER, JSON_DECODER_AUTO),
     )
 
     # Initialize the Ginlong data service.
@@ -112,13 +138,26 @@ async def async_setup_entry(hass: HomeAssistant, entry: ConfigEntry) -> bool:
         refresh_error = config[CONF_REFRESH_NOK]
     except KeyError:
         pass
-    service: InverterService = InverterService(portal_config, hass, refresh_ok, refresh_error)
+    max_concurrency = config.get(CONF_MAX_CONCURRENCY, DEFAULT_MAX_CONCURRENCY)
+    bulk_polling = config.get(CONF_BULK_POLLING, False)
+    session = None
+    if config.get(CONF_DEDICATED_SESSION, False):
+        session = async_acquire_session(
+            hass,
+            portal_domain,
+            config.get(CONF_POOL_SIZE, DEFAULT_POOL_SIZE),
+            config.get(CONF_KEEPALIVE_TIMEOUT, DEFAULT_KEEPALIVE_TIMEOUT),
+            config.get(CONF_DNS_CACHE_TTL, DEFAULT_DNS_CACHE_TTL),
+        )
+        # Runs after async_unload_entry has logged out
+        entry.async_on_unload(partial(async_release_session, hass, portal_domain))
+    service: InverterService = InverterService(
+        portal_config, hass, refresh_ok, refresh_error, max_concurrency, bulk_polling, session
+    )
     hass.data[DOMAIN][entry.entry_id] = service
 
     # Forward the setup to the sensor platform.
     await hass.config_entries.async_forward_entry_setups(entry, [Platform.SENSOR])
-    # while not service.discovery_complete:
-    #     asyncio.sleep(1)
     _LOGGER.debug("Sensor setup complete")
     if portal_control:
         await hass.config_entries.async_forward_entry_setups(entry, CONTROL_PLATFORMS)
@@ -0,0 +1,243 @@
+"""Helpers for talking to the Ginlong portals
+For more information: https://github.com/hultenvp/solis-sensor/
+"""
+
+from __future__ import annotations
+
+import asyncio
+import json
+import logging
+import random
+import time
+from typing import Any, Awaitable, Callable, Hashable
+
+try:
+    import orjson
+except ImportError:
+    orjson = None
+
+_LOGGER = logging.getLogger(__name__)
+
+# VERSION
+VERSION = "0.1.0"
+
+# Rate never drops below this fraction of the configured budget
+MIN_RATE_FACTOR = 0.1
+# Healthy responses needed to recover from one back-off
+RECOVERY_STEPS = 20
+
+# Retry defaults
+RETRY_ATTEMPTS = 3
+RETRY_BASE_DELAY = 0.5  # seconds
+RETRY_MAX_DELAY = 8.0  # seconds
+
+# Circuit breaker defaults
+BREAKER_FAILURE_THRESHOLD = 3  # Consecutive failed requests before opening
+BREAKER_RESET_TIMEOUT = 60  # seconds
+BREAKER_MAX_RESET_TIMEOUT = 900  # seconds
+
+# Circuit breaker states
+BREAKER_CLOSED = "closed"
+BREAKER_OPEN = "open"
+BREAKER_HALF_OPEN = "half_open"
+
+# Response decoders
+JSON_DECODER_AUTO = "auto"
+JSON_DECODER_ORJSON = "orjson"
+JSON_DECODER_STDLIB = "json"
+
+
+class AdaptiveRateLimiter:
+    """
+    Token bucket limiting the number of requests per second.
+
+    The rate is halved every time the portal signals it is overloaded and
+    grows back linearly to the configured budget while responses are healthy.
+    """
+
+    def __init__(self, requests_per_second: float, burst: int = 1) -> None:
+        self._max_rate: float = requests_per_second
+        self._min_rate: float = requests_per_second * MIN_RATE_FACTOR
+        self._rate: float = requests_per_second
+        self._burst: int = max(1, burst)
+        self._tokens: float = float(self._burst)
+        self._last_refill: float = time.monotonic()
+        self._lock = asyncio.Lock()
+
+    @property
+    def rate(self) -> float:
+        """Return the current number of requests per second."""
+        return self._rate
+
+    def _refill(self) -> None:
+        now = time.monotonic()
+        self._tokens = min(self._burst, self._tokens + (now - self._last_refill) * self._rate)
+        self._last_refill = now
+
+    async def acquire(self) -> None:
+        """Wait until a request may be sent."""
+        # Holding the lock while sleeping hands out tokens in FIFO order
+        async with self._lock:
+            self._refill()
+            while self._tokens < 1:
+                await asyncio.sleep((1 - self._tokens) / self._rate)
+                self._refill()
+            self._tokens -= 1
+
+    def throttled(self) -> None:
+        """Back off after the portal signalled it is overloaded."""
+        self._refill()
+        self._rate = max(self._min_rate, self._rate / 2)
+        self._tokens = min(self._tokens, 0)
+        _LOGGER.debug("Portal is throttling, slowing down to %.2f requests/s", self._rate)
+
+    def succeeded(self) -> None:
+        """Speed up again after a healthy response."""
+        if self._rate < self._max_rate:
+            self._refill()
+            self._rate = min(self._max_rate, self._rate + self._max_rate / RECOVERY_STEPS)
+            if self._rate == self._max_rate:
+                _LOGGER.debug("Portal recovered, back at %.2f requests/s", self._rate)
+
+
+class RetryPolicy:
+    """
+    Capped exponential backoff with full jitter.
+
+    The n-th retry waits a random time between 0 and
+    min(max_delay, base_delay * 2^n) seconds, which spreads the retries of
+    many clients hitting the same hiccup.
+    """
+
+    def __init__(
+        self,
+        attempts: int = RETRY_ATTEMPTS,
+        base_delay: float = RETRY_BASE_DELAY,
+        max_delay: float = RETRY_MAX_DELAY,
+    ) -> None:
+        self._attempts: int = max(1, attempts)
+        self._base_delay: float = base_delay
+        self._max_delay: float = max_delay
+
+    @property
+    def attempts(self) -> int:
+        """Return the maximum number of attempts, including the first."""
+        return self._attempts
+
+    def backoff(self, retry: int) -> float:
+        """Return the delay before the given retry (0 based)."""
+        return random.uniform(0, min(self._max_delay, self._base_delay * 2**retry))
+
+
+class CircuitBreaker:
+    """
+    Stop sending requests to a portal that keeps failing.
+
+    closed: all requests pass, consecutive failures are counted.
+    open: requests are refused until the reset timeout has passed.
+    half_open: a single probe request is let through, its outcome closes or
+    re-opens the circuit. Every failed probe doubles the reset timeout.
+    """
+
+    def __init__(
+        self,
+        failure_threshold: int = BREAKER_FAILURE_THRESHOLD,
+        reset_timeout: float = BREAKER_RESET_TIMEOUT,
+        max_reset_timeout: float = BREAKER_MAX_RESET_TIMEOUT,
+    ) -> None:
+        self._failure_threshold: int = max(1, failure_threshold)
+        self._base_reset_timeout: float = reset_timeout
+        self._max_reset_timeout: float = max_reset_timeout
+        self._reset_timeout: float = reset_timeout
+        self._state: str = BREAKER_CLOSED
+        self._failures: int = 0
+        self._opened_at: float = 0
+
+    @property
+    def state(self) -> str:
+        """Return the state of the circuit."""
+        return self._state
+
+    @property
+    def available(self) -> bool:
+        """Returns if a request would be let through."""
+        if self._state == BREAKER_CLOSED:
+            return True
+        # Also covers a probe that never reported back
+        return time.monotonic() - self._opened_at >= self._reset_timeout
+
+    def allow(self) -> bool:
+        """Returns if a request may be sent, the first one after the timeout is the probe."""
+        if self._state == BREAKER_CLOSED:
+            return True
+        if self.available:
+            self._state = BREAKER_HALF_OPEN
+            self._opened_at = time.monotonic()
+            _LOGGER.debug("Circuit half-open, probing portal")
+            return True
+        return False
+
+    def succeeded(self) -> None:
+        """Record a request that reached a healthy portal."""
+        if self._state != BREAKER_CLOSED:
+            _LOGGER.info("Portal is reachable again, resuming requests")
+        self._state = BREAKER_CLOSED
+        self._failures = 0
+        self._reset_timeout = self._base_reset_timeout
+
+    def failed(self) -> None:
+        """Record a request that failed because the portal is unhealthy."""
+        self._failures += 1
+        if self._state == BREAKER_HALF_OPEN:
+            self._reset_timeout = min(self._max_reset_timeout, self._reset_timeout * 2)
+        elif self._failures < self._failure_threshold:
+            return
+        self._state = BREAKER_OPEN
+        self._opened_at = time.monotonic()
+        _LOGGER.warning("Portal is not responding, pausing requests for %d seconds", self._reset_timeout)
+
+
+class SingleFlight:
+    """
+    Coalesce identical calls that are in flight at the same time.
+
+    The first caller for a key runs the call, callers arriving before it
+    completes await the same result instead of starting their own.
+    """
+
+    def __init__(self) -> None:
+        self._calls: dict[Hashable, asyncio.Future] = {}
+
+    async def run(self, key: Hashable, func: Callable[[], Awaitable[Any]]) -> Any:
+        """Run func for key, or join the call already in flight."""
+        call = self._calls.get(key)
+        if call is None:
+            call = asyncio.ensure_future(func())
+            self._calls[key] = call
+            call.add_done_callback(lambda _: self._forget(key, call))
+        else:
+            _LOGGER.debug("Joining request in flight: %s", key)
+        # A cancelled caller must not cancel the call for the others
+        return await asyncio.shield(call)
+
+    def _forget(self, key: Hashable, call: asyncio.Future) -> None:
+        if self._calls.get(key) is call:
+            del self._calls[key]
+
+
+def json_decoder(name: str = JSON_DECODER_AUTO) -> Callable[[bytes], Any]:
+    """
+    Return a function decoding a raw response body.
+
+    'auto' picks orjson when it is installed (it ships with Home Assistant)
+    and falls back to the standard library otherwise.
+    """
+    if name not in (JSON_DECODER_AUTO, JSON_DECODER_ORJSON, JSON_DECODER_STDLIB):
+        raise ValueError(f"Unknown JSON decoder: {name}")
+    if name == JSON_DECODER_STDLIB:
+        return json.loads
+    if orjson is None:
+        if name == JSON_DECODER_ORJSON:
+            _LOGGER.warning("orjson is not installed, falling back to json")
+        return json.loads
+    return orjson.loads
@@ -1,4 +1,3 @@
-import asyncio
 import logging
 from datetime import datetime
 
@@ -8,11 +7,9 @@ from homeassistant.core import HomeAssistant
 
 from .const import DOMAIN
 from .control_const import (
-    ALL_CONTROLS,
-    RETRIES,
-    RETRY_WAIT,
     SolisBaseControlEntity,
     SolisButtonEntityDescription,
+    async_add_control_entities,
 )
 from .service import InverterService, ServiceSubscriber
 
@@ -28,41 +25,23 @@ async def async_setup_entry(hass: HomeAssistant, config_entry: ConfigEntry, asyn
     service = hass.data[DOMAIN][config_entry.entry_id]
 
     _LOGGER.info(f"Waiting for discovery of controls for plant {plant_id}")
-    await asyncio.sleep(RETRY_WAIT)
-    attempts = 0
-    while (attempts < RETRIES) and (not service.has_controls):
-        _LOGGER.debug(f"    Attempt {attempts} failed")
-        await asyncio.sleep(RETRY_WAIT)
-        attempts += 1
-
-    _LOGGER.debug(f"    Attempt {attempts} succeeded")
+    # Don't block the setup, entities are added as soon as discovery completes
+    config_entry.async_create_background_task(
+        hass,
+        _async_add_controls(service, config_entry, async_add_entities),
+        f"{DOMAIN} button controls {plant_id}",
+    )
+    return True
 
-    if service.has_controls:
-        entities = []
-        _LOGGER.debug(f"Plant ID {plant_id} has controls:")
-        for inverter_sn in service.controls:
-            for cid, index, entity, button, intial_value in service.controls[inverter_sn]["button"]:
-                entities.append(
-                    SolisButtonEntity(
-                        service,
-                        config_entry.data["name"],
-                        inverter_sn,
-                        cid,
-                        entity,
-                        index,
-                    )
-                )
 
-        if len(entities) > 0:
-            _LOGGER.debug(f"Creating {len(entities)} Button entities")
-            async_add_entities(entities)
-        else:
-            _LOGGER.debug(f"No Button controls found for Plant ID {plant_id}")
+async def _async_add_controls(service: InverterService, config_entry: ConfigEntry, async_add_entities) -> None:
+    """Add the entities once discovery completed, revalidation can add or remove them later"""
+    name = config_entry.data["name"]
 
-    else:
-        _LOGGER.debug(f"No controls found for Plant ID {plant_id}")
+    def create_entity(inverter_sn, cid, index, description, button, initial_value):
+        return SolisButtonEntity(service, name, inverter_sn, cid, description, index)
 
-    return True
+    await async_add_control_entities(service, "button", create_entity, async_add_entities)
 
 
 class SolisButtonEntity(SolisBaseControlEntity, ServiceSubscriber, ButtonEntity):
@@ -78,10 +57,14 @@ class SolisButtonEntity(SolisBaseControlEntity, ServiceSubscriber, ButtonEntity)
         super().__init__(service, config_name, inverter_sn, cid, button_info)
         self._index = index
         self._joiner = button_info.joiner
-        self._entities = service.subscriptions.get(inverter_sn, {}).get(cid, [])
         # Subscribe to the service with the cid as the index
         # service.subscribe(self, inverter_sn, str(cid))
 
+    @property
+    def _entities(self) -> list:
+        # Looked up on use, the grouped entities can be added or replaced after this button
+        return self._service.subscriptions.get(self._inverter_sn, {}).get(str(self._cid), [])
+
     def do_update(self, value, last_updated):
         # When the data from the API changes this method will be called with value as the new value
         # return super().do_update(value, last_updated)
@@ -14,20 +14,45 @@ from homeassistant.helpers.aiohttp_client import async_get_clientsession
 from homeassistant.helpers.selector import selector
 
 from .const import (
+    CONF_BULK_POLLING,
     CONF_CONTROL,
+    CONF_CONTROL_CONCURRENCY,
+    CONF_DEDICATED_SESSION,
+    CONF_DNS_CACHE_TTL,
+    CONF_JSON_DECODER,
+    CONF_KEEPALIVE_TIMEOUT,
     CONF_KEY_ID,
+    CONF_MAX_CONCURRENCY,
     CONF_PASSWORD,
     CONF_PLANT_ID,
+    CONF_POOL_SIZE,
     CONF_PORTAL_DOMAIN,
+    CONF_REFRESH_CONTROL,
     CONF_REFRESH_NOK,
     CONF_REFRESH_OK,
+    CONF_REQUESTS_PER_SECOND,
     CONF_SECRET,
     CONF_USERNAME,
+    DEFAULT_DNS_CACHE_TTL,
     DEFAULT_DOMAIN,
+    DEFAULT_KEEPALIVE_TIMEOUT,
+    DEFAULT_MAX_CONCURRENCY,
+    DEFAULT_POOL_SIZE,
     DOMAIN,
     SENSOR_PREFIX,
 )
-from .soliscloud_api import SoliscloudAPI, SoliscloudConfig
+from .api_utils import (
+    JSON_DECODER_AUTO,
+    JSON_DECODER_ORJSON,
+    JSON_DECODER_STDLIB,
+)
+from .soliscloud_api import (
+    DEFAULT_CONTROL_CONCURRENCY,
+    DEFAULT_REFRESH_CONTROL,
+    DEFAULT_REQUESTS_PER_SECOND,
+    SoliscloudAPI,
+    SoliscloudConfig,
+)
 
 _LOGGER = logging.getLogger(__name__)
 
@@ -75,6 +100,28 @@ class SolisOptionsFlowHandler(OptionsFlow):
             updated_config[CONF_REFRESH_NOK] = user_input.get(
                 CONF_REFRESH_NOK, updated_config.get(CONF_REFRESH_NOK, 60)
             )
+            updated_config[CONF_REFRESH_CONTROL] = user_input.get(
+                CONF_REFRESH_CONTROL, updated_config.get(CONF_REFRESH_CONTROL, DEFAULT_REFRESH_CONTROL))
+
+            advanced_section = user_input.get("Advanced") or {}
+            updated_config[CONF_MAX_CONCURRENCY] = advanced_section.get(
+                CONF_MAX_CONCURRENCY, updated_config.get(CONF_MAX_CONCURRENCY, DEFAULT_MAX_CONCURRENCY))
+            updated_config[CONF_REQUESTS_PER_SECOND] = advanced_section.get(
+                CONF_REQUESTS_PER_SECOND, updated_config.get(CONF_REQUESTS_PER_SECOND, DEFAULT_REQUESTS_PER_SECOND))
+            updated_config[CONF_BULK_POLLING] = advanced_section.get(
+                CONF_BULK_POLLING, updated_config.get(CONF_BULK_POLLING, False))
+            updated_config[CONF_CONTROL_CONCURRENCY] = advanced_section.get(
+                CONF_CONTROL_CONCURRENCY, updated_config.get(CONF_CONTROL_CONCURRENCY, DEFAULT_CONTROL_CONCURRENCY))
+            updated_config[CONF_DEDICATED_SESSION] = advanced_section.get(
+                CONF_DEDICATED_SESSION, updated_config.get(CONF_DEDICATED_SESSION, False))
+            updated_config[CONF_POOL_SIZE] = advanced_section.get(
+                CONF_POOL_SIZE, updated_config.get(CONF_POOL_SIZE, DEFAULT_POOL_SIZE))
+            updated_config[CONF_KEEPALIVE_TIMEOUT] = advanced_section.get(
+                CONF_KEEPALIVE_TIMEOUT, updated_config.get(CONF_KEEPALIVE_TIMEOUT, DEFAULT_KEEPALIVE_TIMEOUT))
+            updated_config[CONF_DNS_CACHE_TTL] = advanced_section.get(
+                CONF_DNS_CACHE_TTL, updated_config.get(CONF_DNS_CACHE_TTL, DEFAULT_DNS_CACHE_TTL))
+            updated_config[CONF_JSON_DECODER] = advanced_section.get(
+                CONF_JSON_DECODER, updated_config.get(CONF_JSON_DECODER, JSON_DECODER_AUTO))
 
             self.hass.config_entries.async_update_entry(
                 self.config_entry,
@@ -97,6 +144,8 @@ class SolisOptionsFlowHandler(OptionsFlow):
                 CONF_REFRESH_OK, 300)): cv.positive_int,
             vol.Required(CONF_REFRESH_NOK, default=self.config_entry.data.get(
                 CONF_REFRESH_NOK, 60)): cv.positive_int,
+            vol.Required(CONF_REFRESH_CONTROL, default=self.config_entry.data.get(
+                CONF_REFRESH_CONTROL, DEFAULT_REFRESH_CONTROL)): cv.positive_int,
             vol.Required("Control"): data_entry_flow.section(
                 vol.Schema(
                     {
@@ -109,6 +158,33 @@ class SolisOptionsFlowHandler(OptionsFlow):
                 # Whether or not the section is initially collapsed (default = False)
                 {"collapsed": False},
             ),
+            vol.Required("Advanced"): data_entry_flow.section(
+                vol.Schema(
+                    {
+                        vol.Required(CONF_MAX_CONCURRENCY, default=self.config_entry.data.get(
+                            CONF_MAX_CONCURRENCY, DEFAULT_MAX_CONCURRENCY)): cv.positive_int,
+                        vol.Required(CONF_REQUESTS_PER_SECOND, default=self.config_entry.data.get(
+                            CONF_REQUESTS_PER_SECOND, DEFAULT_REQUESTS_PER_SECOND)): vol.All(
+                                vol.Coerce(float), vol.Range(min=0.1)),
+                        vol.Required(CONF_BULK_POLLING, default=self.config_entry.data.get(
+                            CONF_BULK_POLLING, False)): bool,
+                        vol.Required(CONF_CONTROL_CONCURRENCY, default=self.config_entry.data.get(
+                            CONF_CONTROL_CONCURRENCY, DEFAULT_CONTROL_CONCURRENCY)): cv.positive_int,
+                        vol.Required(CONF_DEDICATED_SESSION, default=self.config_entry.data.get(
+                            CONF_DEDICATED_SESSION, False)): bool,
+                        vol.Required(CONF_POOL_SIZE, default=self.config_entry.data.get(
+                            CONF_POOL_SIZE, DEFAULT_POOL_SIZE)): cv.positive_int,
+                        vol.Required(CONF_KEEPALIVE_TIMEOUT, default=self.config_entry.data.get(
+                            CONF_KEEPALIVE_TIMEOUT, DEFAULT_KEEPALIVE_TIMEOUT)): cv.positive_int,
+                        vol.Required(CONF_DNS_CACHE_TTL, default=self.config_entry.data.get(
+                            CONF_DNS_CACHE_TTL, DEFAULT_DNS_CACHE_TTL)): cv.positive_int,
+                        vol.Required(CONF_JSON_DECODER, default=self.config_entry.data.get(
+                            CONF_JSON_DECODER, JSON_DECODER_AUTO)): vol.In(
+                                [JSON_DECODER_AUTO, JSON_DECODER_ORJSON, JSON_DECODER_STDLIB]),
+                    }
+                ),
+                {"collapsed": True},
+            ),
         }
 
         return self.async_show_form(
@@ -194,6 +270,7 @@ class SolisConfigFlow(ConfigFlow, domain=DOMAIN):
             vol.Required(CONF_PLANT_ID, default=None): cv.string,
             vol.Required(CONF_REFRESH_OK, default=300): cv.positive_int,
             vol.Required(CONF_REFRESH_NOK, default=60): cv.positive_int,
+            vol.Required(CONF_REFRESH_CONTROL, default=DEFAULT_REFRESH_CONTROL): cv.positive_int,
             vol.Required("Control"): data_entry_flow.section(
                 vol.Schema(
                     {
@@ -42,10 +42,24 @@ CONF_PLANT_ID = "portal_plant_id"
 CONF_CONTROL = "portal_control_api"
 CONF_REFRESH_OK = "refresh_ok"
 CONF_REFRESH_NOK = "refresh_nok"
+CONF_REFRESH_CONTROL = "refresh_control"
+CONF_MAX_CONCURRENCY = "max_concurrency"
+CONF_REQUESTS_PER_SECOND = "requests_per_second"
+CONF_BULK_POLLING = "bulk_polling"
+CONF_CONTROL_CONCURRENCY = "control_concurrency"
+CONF_DEDICATED_SESSION = "dedicated_session"
+CONF_POOL_SIZE = "pool_size"
+CONF_KEEPALIVE_TIMEOUT = "keepalive_timeout"
+CONF_DNS_CACHE_TTL = "dns_cache_ttl"
+CONF_JSON_DECODER = "json_decoder"
 
 DOMAIN = "solis"
 SENSOR_PREFIX = "Solis"
 DEFAULT_DOMAIN = "https://v3.soliscloud.com:13333"
+DEFAULT_MAX_CONCURRENCY = 3
+DEFAULT_POOL_SIZE = 10
+DEFAULT_KEEPALIVE_TIMEOUT = 60
+DEFAULT_DNS_CACHE_TTL = 300
 
 # Supported sensor types:
 # Key: ['label', unit, icon, device class, state class, api_attribute_name]
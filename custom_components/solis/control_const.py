@@ -1,3 +1,4 @@
+import functools
 import logging
 from dataclasses import dataclass
 from datetime import datetime
@@ -8,13 +9,11 @@ from homeassistant.components.select import SelectEntityDescription
 from homeassistant.components.sensor import SensorDeviceClass
 from homeassistant.components.time import TimeEntityDescription
 from homeassistant.const import PERCENTAGE, UnitOfElectricCurrent, UnitOfPower
+from homeassistant.exceptions import HomeAssistantError
 from homeassistant.helpers.entity import DeviceInfo
 
 from .const import API_NAME, DOMAIN, EMPTY_ATTR, SERIAL
 
-RETRIES = 100
-RETRY_WAIT = 10
-
 _LOGGER = logging.getLogger(__name__)
 
 
@@ -27,6 +26,7 @@ class SolisBaseControlEntity:
         self._attributes = dict(EMPTY_ATTR)
         self._attributes[SERIAL] = inverter_sn
         self._attributes[API_NAME] = service.api_name
+        self._service = service
         self._api = service.api
         self._platform_name = config_name
         self._name = f"{config_name.title()} {info.name}"
@@ -67,9 +67,19 @@ class SolisBaseControlEntity:
             name=f"Solis_Inverter_{self._attributes[SERIAL]}",
         )
 
+    async def async_will_remove_from_hass(self) -> None:
+        """Stop receiving updates once removed, e.g. after the HMI firmware changed"""
+        self._service.unsubscribe(self, self._inverter_sn, str(self._cid))
+
+    def state_changed_locally(self) -> None:
+        """The state was set here, have the next poll restore it when it does not reach the inverter"""
+        self._service.forget_published(self._inverter_sn, str(self._cid))
+
     async def write_control_data(self, value: str) -> bool:
-        data = await self._api.write_control_data(self._attributes[SERIAL], self.cid, value)
-        return data
+        """Write value to the inverter, raises HomeAssistantError if it is not confirmed"""
+        if not await self._service.write_control_data(self._attributes[SERIAL], self.cid, value):
+            raise HomeAssistantError(f"Inverter {self._inverter_sn} did not accept {value} for {self._name}")
+        return True
 
     def split(self, value):
         if len(self._splitter) > 0:
@@ -86,6 +96,38 @@ class SolisBaseControlEntity:
             return value
 
 
+async def async_add_control_entities(service, platform: str, create_entity, async_add_entities) -> None:
+    """
+    Add the entities of platform once discovery completed, then keep them in line
+    with the controls found when discovery is revalidated.
+    create_entity(inverter_sn, cid, index, description, button, initial_value) returns the entity.
+    """
+    await service.async_wait_for_discovery()
+    entities: dict[tuple[str, str, str], SolisBaseControlEntity] = {}
+
+    async def update_entities(added: dict, removed: dict) -> None:
+        for inverter_sn, controls in removed.items():
+            for cid, _, description, _, _ in controls[platform]:
+                entity = entities.pop((inverter_sn, cid, description.key), None)
+                if entity is not None:
+                    await entity.async_remove()
+        new_entities = []
+        for inverter_sn, controls in added.items():
+            for cid, index, description, button, initial_value in controls[platform]:
+                entity = create_entity(inverter_sn, cid, index, description, button, initial_value)
+                entities[(inverter_sn, cid, description.key)] = entity
+                new_entities.append(entity)
+        if new_entities:
+            _LOGGER.debug(f"Creating {len(new_entities)} {platform} entities")
+            async_add_entities(new_entities)
+
+    if service.has_controls:
+        await update_entities(service.controls, {})
+    else:
+        _LOGGER.debug(f"No {platform} controls found for Plant ID {service.api.plant_id}")
+    service.subscribe_controls(update_entities)
+
+
 @dataclass
 class SolisSelectEntityDescription(SelectEntityDescription):
     option_dict: dict = None
@@ -107,8 +149,6 @@ class SolisButtonEntityDescription(ButtonEntityDescription):
     joiner: str = ","
 
 
-# Control types dict[bool: dict] where key is HMI flag
-
 CONTROL_TYPES = {
     "time": SolisTimeEntityDescription,
     "number": SolisNumberEntityDescription,
@@ -116,1001 +156,1030 @@ CONTROL_TYPES = {
     "button": SolisButtonEntityDescription,
 }
 
-ALL_CONTROLS = {
-    True: {
-        # 103 is still available with 4B00 but it doesn't do anything included here for testing only
-        # "103": [
-        #     SolisNumberEntityDescription(
-        #         name="Timed Charge Current 1",
-        #         key="timed_charge_current_1",
-        #         native_unit_of_measurement=UnitOfElectricCurrent.AMPERE,
-        #         device_class=SensorDeviceClass.CURRENT,
-        #         icon="mdi:current-dc",
-        #         native_min_value=0,
-        #         native_max_value=100,
-        #         native_step=1,
-        #         splitter=(",", "-"),
-        #     ),
-        #     SolisNumberEntityDescription(
-        #         name="Timed Discharge Current 1",
-        #         key="timed_discharge_current_1",
-        #         native_unit_of_measurement=UnitOfElectricCurrent.AMPERE,
-        #         device_class=SensorDeviceClass.CURRENT,
-        #         icon="mdi:current-dc",
-        #         native_min_value=0,
-        #         native_max_value=100,
-        #         native_step=1,
-        #         splitter=(",", "-"),
-        #     ),
-        #     SolisTimeEntityDescription(
-        #         name="Timed Charge Start 1",
-        #         key="timed_charge_start_1",
-        #         icon="mdi:clock",
-        #         splitter=(",", "-"),
-        #     ),
-        #     SolisTimeEntityDescription(
-        #         name="Timed Charge End 1",
-        #         key="timed_charge_end_1",
-        #         icon="mdi:clock",
-        #         splitter=(",", "-"),
-        #     ),
-        #     SolisTimeEntityDescription(
-        #         name="Timed Discharge Start 1",
-        #         key="timed_discharge_start_1",
-        #         icon="mdi:clock",
-        #         splitter=(",", "-"),
-        #     ),
-        #     SolisTimeEntityDescription(
-        #         name="Timed Discharge End 1",
-        #         key="timed_discharge_end_1",
-        #         icon="mdi:clock",
-        #         splitter=(",", "-"),
-        #     ),
-        #     SolisNumberEntityDescription(
-        #         name="Timed Charge Current 2",
-        #         key="timed_charge_current_2",
-        #         native_unit_of_measurement=UnitOfElectricCurrent.AMPERE,
-        #         device_class=SensorDeviceClass.CURRENT,
-        #         icon="mdi:current-dc",
-        #         native_min_value=0,
-        #         native_max_value=100,
-        #         native_step=1,
-        #         splitter=(",", "-"),
-        #     ),
-        #     SolisNumberEntityDescription(
-        #         name="Timed Discharge Current 2",
-        #         key="timed_discharge_current_2",
-        #         native_unit_of_measurement=UnitOfElectricCurrent.AMPERE,
-        #         device_class=SensorDeviceClass.CURRENT,
-        #         icon="mdi:current-dc",
-        #         native_min_value=0,
-        #         native_max_value=100,
-        #         native_step=1,
-        #         splitter=(",", "-"),
-        #     ),
-        #     SolisTimeEntityDescription(
-        #         name="Timed Charge Start 2",
-        #         key="timed_charge_start_2",
-        #         icon="mdi:clock",
-        #         splitter=(",", "-"),
-        #     ),
-        #     SolisTimeEntityDescription(
-        #         name="Timed Charge End 2",
-        #         key="timed_charge_end_2",
-        #         icon="mdi:clock",
-        #         splitter=(",", "-"),
-        #     ),
-        #     SolisTimeEntityDescription(
-        #         name="Timed Discharge Start 2",
-        #         key="timed_discharge_start_2",
-        #         icon="mdi:clock",
-        #         splitter=(",", "-"),
-        #     ),
-        #     SolisTimeEntityDescription(
-        #         name="Timed Discharge End 2",
-        #         key="timed_discharge_end_2",
-        #         icon="mdi:clock",
-        #         splitter=(",", "-"),
-        #     ),
-        #     SolisNumberEntityDescription(
-        #         name="Timed Charge Current 3",
-        #         key="timed_charge_current_3",
-        #         native_unit_of_measurement=UnitOfElectricCurrent.AMPERE,
-        #         device_class=SensorDeviceClass.CURRENT,
-        #         icon="mdi:current-dc",
-        #         native_min_value=0,
-        #         native_max_value=100,
-        #         native_step=1,
-        #         splitter=(",", "-"),
-        #     ),
-        #     SolisNumberEntityDescription(
-        #         name="Timed Discharge Current 3",
-        #         key="timed_discharge_current_3",
-        #         native_unit_of_measurement=UnitOfElectricCurrent.AMPERE,
-        #         device_class=SensorDeviceClass.CURRENT,
-        #         icon="mdi:current-dc",
-        #         native_min_value=0,
-        #         native_max_value=100,
-        #         native_step=1,
-        #         splitter=(",", "-"),
-        #     ),
-        #     SolisTimeEntityDescription(
-        #         name="Timed Charge Start 3",
-        #         key="timed_charge_start_3",
-        #         icon="mdi:clock",
-        #         splitter=(",", "-"),
-        #     ),
-        #     SolisTimeEntityDescription(
-        #         name="Timed Charge End 3",
-        #         key="timed_charge_end_3",
-        #         icon="mdi:clock",
-        #         splitter=(",", "-"),
-        #     ),
-        #     SolisTimeEntityDescription(
-        #         name="Timed Discharge Start 3",
-        #         key="timed_discharge_start_3",
-        #         icon="mdi:clock",
-        #         splitter=(",", "-"),
-        #     ),
-        #     SolisTimeEntityDescription(
-        #         name="Timed Discharge End 3",
-        #         key="timed_discharge_end_3",
-        #         icon="mdi:clock",
-        #         splitter=(",", "-"),
-        #     ),
-        #     SolisButtonEntityDescription(
-        #         name="Update Timed Charge/Discharge",
-        #         key="update_timed_charge_discharge",
-        #     ),
-        # ],
-        "15": [
-            SolisNumberEntityDescription(
-                name="Power limit setting",
-                key="power_limit_setting",
-                native_unit_of_measurement=PERCENTAGE,
-                device_class=NumberDeviceClass.POWER_FACTOR,
-                icon="mdi:transmission-tower-export",
-                native_min_value=0,
-                native_max_value=110,
-                native_step=1,
-            )
-        ],
-        "157": [
-            SolisNumberEntityDescription(
-                name="Backup SOC",
-                key="backup_soc",
-                native_unit_of_measurement=PERCENTAGE,
-                device_class=NumberDeviceClass.BATTERY,
-                icon="mdi:battery-sync",
-                native_min_value=10,
-                native_max_value=100,
-                native_step=1,
-            )
-        ],
-        "158": [
-            SolisNumberEntityDescription(
-                name="Overdischarge SOC",
-                key="overdischarge_soc",
-                native_unit_of_measurement=PERCENTAGE,
-                device_class=NumberDeviceClass.BATTERY,
-                icon="mdi:battery-sync",
-                native_min_value=10,
-                native_max_value=100,
-                native_step=1,
-            )
-        ],
-        "160": [
-            SolisNumberEntityDescription(
-                name="Force Charge SOC",
-                key="force_charge_soc",
-                native_unit_of_measurement=PERCENTAGE,
-                device_class=NumberDeviceClass.BATTERY,
-                icon="mdi:battery-sync",
-                native_min_value=10,
-                native_max_value=100,
-                native_step=1,
-            )
-        ],
-        "230": [
-            SolisNumberEntityDescription(
-                name="System Export Power Limit Value",
-                key="sytem_export_power_limit_value",
-                native_unit_of_measurement=UnitOfPower.WATT,
-                device_class=NumberDeviceClass.POWER,
-                icon="mdi:transmission-tower-export",
-                native_min_value=0,
-                native_max_value=1000000000,  # 1 GW
-                native_step=1,
-            )
-        ],
-        "636": [
-            SolisSelectEntityDescription(
-                name="Energy Storage Control Switch",
-                key="energy_storage_control_switch",
-                option_dict={
-                    "33": "Self-Use Mode - Allow Grid Charging",
-                    "49": "Self-Use Mode - Allow Grid Charging, Backup Mode On",
-                    "1": "Self-Use Mode - No Grid Charging",
-                    "17": "Self-Use Mode - No Grid Charging, Backup Mode On",
-                    "96": "Feed-In Priority Mode - Allow Grid Charging",
-                    "112": "Feed-In Priority Mode - Allow Grid Charging, Backup Mode On",
-                    "64": "Feed-In Priority Mode - No Grid Charging",
-                    "80": "Feed-In Priority Mode - No Grid Charging, Backup Mode On",
-                    "5": "Off-Grid Mode",
-                },
-                icon="mdi:dip-switch",
-            )
-        ],
-        "696": [
-            SolisNumberEntityDescription(
-                name="Feed in Power Limit",
-                key="feed_in_power_limit",
-                icon="mdi:transmission-tower-export",
-                native_unit_of_measurement=UnitOfPower.WATT,
-                device_class=NumberDeviceClass.POWER,
-                native_min_value=0,
-                native_max_value=24000,
-                native_step=100,
-            )
-        ],
-        "5161": [
-            SolisSelectEntityDescription(
-                name="Inverter energy export on/off Control Switch",
-                key="inverter_energy_export_on_off_control_switch",
-                option_dict={
-                    "190": "ON",
-                    "222": "OFF",
-                },
-                icon="mdi:dip-switch",
-            )
-        ],
-        "5928": [
-            SolisNumberEntityDescription(
-                name="Timed Charge SOC 1",
-                key="timed_charge_soc_1",
-                native_unit_of_measurement=PERCENTAGE,
-                device_class=NumberDeviceClass.BATTERY,
-                icon="mdi:battery-sync",
-                native_min_value=10,
-                native_max_value=100,
-                native_step=1,
-            )
-        ],
-        "5948": [
-            SolisNumberEntityDescription(
-                name="Timed Charge Current 1",
-                key="timed_charge_current_1",
-                native_unit_of_measurement=UnitOfElectricCurrent.AMPERE,
-                device_class=SensorDeviceClass.CURRENT,
-                icon="mdi:battery-sync",
-                native_min_value=0,
-                native_max_value=100,
-                native_step=1,
-            )
-        ],
-        "5946": [
-            SolisTimeEntityDescription(
-                name="Timed Charge Start 1",
-                key="timed_charge_start_1",
-                icon="mdi:clock",
-                splitter=("-"),
-            ),
-            SolisTimeEntityDescription(
-                name="Timed Charge End 1",
-                key="timed_charge_end_1",
-                icon="mdi:clock",
-                splitter=("-"),
-            ),
-            SolisButtonEntityDescription(
-                name="Update Timed Charge 1",
-                key="update_timed_charge_1",
-            ),
-        ],
-        "5965": [
-            SolisNumberEntityDescription(
-                name="Timed Discharge SOC 1",
-                key="timed_discharge_soc_1",
-                native_unit_of_measurement=PERCENTAGE,
-                device_class=NumberDeviceClass.BATTERY,
-                icon="mdi:battery-sync",
-                native_min_value=10,
-                native_max_value=100,
-                native_step=1,
-            )
-        ],
-        "5967": [
-            SolisNumberEntityDescription(
-                name="Timed Discharge Current 1",
-                key="timed_discharge_current_1",
-                native_unit_of_measurement=UnitOfElectricCurrent.AMPERE,
-                device_class=SensorDeviceClass.CURRENT,
-                icon="mdi:battery-sync",
-                native_min_value=0,
-                native_max_value=100,
-                native_step=1,
-            )
-        ],
-        "5964": [
-            SolisTimeEntityDescription(
-                name="Timed Discharge Start 1",
-                key="timed_discharge_start_1",
-                icon="mdi:clock",
-                splitter=("-"),
-            ),
-            SolisTimeEntityDescription(
-                name="Timed Discharge End 1",
-                key="timed_discharge_end_1",
-                icon="mdi:clock",
-                splitter=("-"),
-            ),
-            SolisButtonEntityDescription(
-                name="Update Timed Discharge 1",
-                key="update_timed_discharge_1",
-            ),
-        ],
-        # ======================= Slot 2 =================================
-        "5929": [
-            SolisNumberEntityDescription(
-                name="Timed Charge SOC 2",
-                key="timed_charge_soc_2",
-                native_unit_of_measurement=PERCENTAGE,
-                device_class=NumberDeviceClass.BATTERY,
-                icon="mdi:battery-sync",
-                native_min_value=10,
-                native_max_value=100,
-                native_step=1,
-            )
-        ],
-        "5951": [
-            SolisNumberEntityDescription(
-                name="Timed Charge Current 2",
-                key="timed_charge_current_2",
-                native_unit_of_measurement=UnitOfElectricCurrent.AMPERE,
-                device_class=SensorDeviceClass.CURRENT,
-                icon="mdi:battery-sync",
-                native_min_value=0,
-                native_max_value=100,
-                native_step=1,
-            )
-        ],
-        "5949": [
-            SolisTimeEntityDescription(
-                name="Timed Charge Start 2",
-                key="timed_charge_start_2",
-                icon="mdi:clock",
-                splitter=("-"),
-            ),
-            SolisTimeEntityDescription(
-                name="Timed Charge End 2",
-                key="timed_charge_end_2",
-                icon="mdi:clock",
-                splitter=("-"),
-            ),
-            SolisButtonEntityDescription(
-                name="Update Timed Charge 2",
-                key="update_timed_charge_2",
-            ),
-        ],
-        "5969": [
-            SolisNumberEntityDescription(
-                name="Timed Discharge SOC 2",
-                key="timed_discharge_soc_2",
-                native_unit_of_measurement=PERCENTAGE,
-                device_class=NumberDeviceClass.BATTERY,
-                icon="mdi:battery-sync",
-                native_min_value=10,
-                native_max_value=100,
-                native_step=1,
-            )
-        ],
-        "5971": [
-            SolisNumberEntityDescription(
-                name="Timed Discharge Current 2",
-                key="timed_discharge_current_2",
-                native_unit_of_measurement=UnitOfElectricCurrent.AMPERE,
-                device_class=SensorDeviceClass.CURRENT,
-                icon="mdi:battery-sync",
-                native_min_value=0,
-                native_max_value=100,
-                native_step=1,
-            )
-        ],
-        "5968": [
-            SolisTimeEntityDescription(
-                name="Timed Discharge Start 2",
-                key="timed_discharge_start_2",
-                icon="mdi:clock",
-                splitter=("-"),
-            ),
-            SolisTimeEntityDescription(
-                name="Timed Discharge End 2",
-                key="timed_discharge_end_2",
-                icon="mdi:clock",
-                splitter=("-"),
-            ),
-            SolisButtonEntityDescription(
-                name="Update Timed Discharge 2",
-                key="update_timed_discharge_2",
-            ),
-        ],
-        # ======================= Slot 3 =================================
-        "5930": [
-            SolisNumberEntityDescription(
-                name="Timed Charge SOC 3",
-                key="timed_charge_soc_3",
-                native_unit_of_measurement=PERCENTAGE,
-                device_class=NumberDeviceClass.BATTERY,
-                icon="mdi:battery-sync",
-                native_min_value=10,
-                native_max_value=100,
-                native_step=1,
-            )
-        ],
-        "5954": [
-            SolisNumberEntityDescription(
-                name="Timed Charge Current 3",
-                key="timed_charge_current_3",
-                native_unit_of_measurement=UnitOfElectricCurrent.AMPERE,
-                device_class=SensorDeviceClass.CURRENT,
-                icon="mdi:battery-sync",
-                native_min_value=0,
-                native_max_value=100,
-                native_step=1,
-            )
-        ],
-        "5952": [
-            SolisTimeEntityDescription(
-                name="Timed Charge Start 3",
-                key="timed_charge_start_3",
-                icon="mdi:clock",
-                splitter=("-"),
-            ),
-            SolisTimeEntityDescription(
-                name="Timed Charge End 3",
-                key="timed_charge_end_3",
-                icon="mdi:clock",
-                splitter=("-"),
-            ),
-            SolisButtonEntityDescription(
-                name="Update Timed Charge 3",
-                key="update_timed_charge_3",
-            ),
-        ],
-        "5973": [
-            SolisNumberEntityDescription(
-                name="Timed Discharge SOC 3",
-                key="timed_discharge_soc_3",
-                native_unit_of_measurement=PERCENTAGE,
-                device_class=NumberDeviceClass.BATTERY,
-                icon="mdi:battery-sync",
-                native_min_value=10,
-                native_max_value=100,
-                native_step=1,
-            )
-        ],
-        "5975": [
-            SolisNumberEntityDescription(
-                name="Timed Discharge Current 3",
-                key="timed_discharge_current_3",
-                native_unit_of_measurement=UnitOfElectricCurrent.AMPERE,
-                device_class=SensorDeviceClass.CURRENT,
-                icon="mdi:battery-sync",
-                native_min_value=0,
-                native_max_value=100,
-                native_step=1,
-            )
-        ],
-        "5972": [
-            SolisTimeEntityDescription(
-                name="Timed Discharge Start 3",
-                key="timed_discharge_start_3",
-                icon="mdi:clock",
-                splitter=("-"),
-            ),
-            SolisTimeEntityDescription(
-                name="Timed Discharge End 3",
-                key="timed_discharge_end_3",
-                icon="mdi:clock",
-                splitter=("-"),
-            ),
-            SolisButtonEntityDescription(
-                name="Update Timed Discharge 3",
-                key="update_timed_discharge_3",
-            ),
-        ],
-        # ======================= Slot 4 =================================
-        "5931": [
-            SolisNumberEntityDescription(
-                name="Timed Charge SOC 4",
-                key="timed_charge_soc_4",
-                native_unit_of_measurement=PERCENTAGE,
-                device_class=NumberDeviceClass.BATTERY,
-                icon="mdi:battery-sync",
-                native_min_value=10,
-                native_max_value=100,
-                native_step=1,
-            )
-        ],
-        "5957": [
-            SolisNumberEntityDescription(
-                name="Timed Charge Current 4",
-                key="timed_charge_current_4",
-                native_unit_of_measurement=UnitOfElectricCurrent.AMPERE,
-                device_class=SensorDeviceClass.CURRENT,
-                icon="mdi:battery-sync",
-                native_min_value=0,
-                native_max_value=100,
-                native_step=1,
-            )
-        ],
-        "5955": [
-            SolisTimeEntityDescription(
-                name="Timed Charge Start 4",
-                key="timed_charge_start_4",
-                icon="mdi:clock",
-                splitter=("-"),
-            ),
-            SolisTimeEntityDescription(
-                name="Timed Charge End 4",
-                key="timed_charge_end_4",
-                icon="mdi:clock",
-                splitter=("-"),
-            ),
-            SolisButtonEntityDescription(
-                name="Update Timed Charge 4",
-                key="update_timed_charge_4",
-            ),
-        ],
-        "5977": [
-            SolisNumberEntityDescription(
-                name="Timed Discharge SOC 4",
-                key="timed_discharge_soc_4",
-                native_unit_of_measurement=PERCENTAGE,
-                device_class=NumberDeviceClass.BATTERY,
-                icon="mdi:battery-sync",
-                native_min_value=10,
-                native_max_value=100,
-                native_step=1,
-            )
-        ],
-        "5979": [
-            SolisNumberEntityDescription(
-                name="Timed Discharge Current 4",
-                key="timed_discharge_current_4",
-                native_unit_of_measurement=UnitOfElectricCurrent.AMPERE,
-                device_class=SensorDeviceClass.CURRENT,
-                icon="mdi:battery-sync",
-                native_min_value=0,
-                native_max_value=100,
-                native_step=1,
-            )
-        ],
-        "5976": [
-            SolisTimeEntityDescription(
-                name="Timed Discharge Start 4",
-                key="timed_discharge_start_4",
-                icon="mdi:clock",
-                splitter=("-"),
-            ),
-            SolisTimeEntityDescription(
-                name="Timed Discharge End 4",
-                key="timed_discharge_end_4",
-                icon="mdi:clock",
-                splitter=("-"),
-            ),
-            SolisButtonEntityDescription(
-                name="Update Timed Discharge 4",
-                key="update_timed_discharge_4",
-            ),
-        ],
-        # ======================= Slot 5 =================================
-        "5932": [
-            SolisNumberEntityDescription(
-                name="Timed Charge SOC 5",
-                key="timed_charge_soc_5",
-                native_unit_of_measurement=PERCENTAGE,
-                device_class=NumberDeviceClass.BATTERY,
-                icon="mdi:battery-sync",
-                native_min_value=10,
-                native_max_value=100,
-                native_step=1,
-            )
-        ],
-        "5960": [
-            SolisNumberEntityDescription(
-                name="Timed Charge Current 5",
-                key="timed_charge_current_5",
-                native_unit_of_measurement=UnitOfElectricCurrent.AMPERE,
-                device_class=SensorDeviceClass.CURRENT,
-                icon="mdi:battery-sync",
-                native_min_value=0,
-                native_max_value=100,
-                native_step=1,
-            )
-        ],
-        "5958": [
-            SolisTimeEntityDescription(
-                name="Timed Charge Start 5",
-                key="timed_charge_start_5",
-                icon="mdi:clock",
-                splitter=("-"),
-            ),
-            SolisTimeEntityDescription(
-                name="Timed Charge End 5",
-                key="timed_charge_end_5",
-                icon="mdi:clock",
-                splitter=("-"),
-            ),
-            SolisButtonEntityDescription(
-                name="Update Timed Charge 5",
-                key="update_timed_charge_5",
-            ),
-        ],
-        "5981": [
-            SolisNumberEntityDescription(
-                name="Timed Discharge SOC 5",
-                key="timed_discharge_soc_5",
-                native_unit_of_measurement=PERCENTAGE,
-                device_class=NumberDeviceClass.BATTERY,
-                icon="mdi:battery-sync",
-                native_min_value=10,
-                native_max_value=100,
-                native_step=1,
-            )
-        ],
-        "5983": [
-            SolisNumberEntityDescription(
-                name="Timed Discharge Current 5",
-                key="timed_discharge_current_5",
-                native_unit_of_measurement=UnitOfElectricCurrent.AMPERE,
-                device_class=SensorDeviceClass.CURRENT,
-                icon="mdi:battery-sync",
-                native_min_value=0,
-                native_max_value=100,
-                native_step=1,
-            )
-        ],
-        "5980": [
-            SolisTimeEntityDescription(
-                name="Timed Discharge Start 5",
-                key="timed_discharge_start_5",
-                icon="mdi:clock",
-                splitter=("-"),
-            ),
-            SolisTimeEntityDescription(
-                name="Timed Discharge End 5",
-                key="timed_discharge_end_5",
-                icon="mdi:clock",
-                splitter=("-"),
-            ),
-            SolisButtonEntityDescription(
-                name="Update Timed Discharge 5",
-                key="update_timed_discharge_5",
-            ),
-        ],
-        # ======================= Slot 6 =================================
-        "5933": [
-            SolisNumberEntityDescription(
-                name="Timed Charge SOC 6",
-                key="timed_charge_soc_6",
-                native_unit_of_measurement=PERCENTAGE,
-                device_class=NumberDeviceClass.BATTERY,
-                icon="mdi:battery-sync",
-                native_min_value=10,
-                native_max_value=100,
-                native_step=1,
-            )
-        ],
-        "5963": [
-            SolisNumberEntityDescription(
-                name="Timed Charge Current 6",
-                key="timed_charge_current_6",
-                native_unit_of_measurement=UnitOfElectricCurrent.AMPERE,
-                device_class=SensorDeviceClass.CURRENT,
-                icon="mdi:battery-sync",
-                native_min_value=0,
-                native_max_value=100,
-                native_step=1,
-            )
-        ],
-        "5961": [
-            SolisTimeEntityDescription(
-                name="Timed Charge Start 6",
-                key="timed_charge_start_6",
-                icon="mdi:clock",
-                splitter=("-"),
-            ),
-            SolisTimeEntityDescription(
-                name="Timed Charge End 6",
-                key="timed_charge_end_6",
-                icon="mdi:clock",
-                splitter=("-"),
-            ),
-            SolisButtonEntityDescription(
-                name="Update Timed Charge 6",
-                key="update_timed_charge_6",
-            ),
-        ],
-        "5984": [
-            SolisNumberEntityDescription(
-                name="Timed Discharge SOC 6",
-                key="timed_discharge_soc_6",
-                native_unit_of_measurement=PERCENTAGE,
-                device_class=NumberDeviceClass.BATTERY,
-                icon="mdi:battery-sync",
-                native_min_value=10,
-                native_max_value=100,
-                native_step=1,
-            )
-        ],
-        "5986": [
-            SolisNumberEntityDescription(
-                name="Timed Discharge Current 6",
-                key="timed_discharge_current_6",
-                native_unit_of_measurement=UnitOfElectricCurrent.AMPERE,
-                device_class=SensorDeviceClass.CURRENT,
-                icon="mdi:battery-sync",
-                native_min_value=0,
-                native_max_value=100,
-                native_step=1,
-            )
-        ],
-        "5987": [
-            SolisTimeEntityDescription(
-                name="Timed Discharge Start 6",
-                key="timed_discharge_start_6",
-                icon="mdi:clock",
-                splitter=("-"),
-            ),
-            SolisTimeEntityDescription(
-                name="Timed Discharge End 6",
-                key="timed_discharge_end_6",
-                icon="mdi:clock",
-                splitter=("-"),
-            ),
-            SolisButtonEntityDescription(
-                name="Update Timed Discharge 6",
-                key="update_timed_discharge_6",
-            ),
-        ],
-    },
-    False: {
-        "15": [
-            SolisNumberEntityDescription(
-                name="Power limit setting (% of rated power)",
-                key="power_limit_setting",
-                native_unit_of_measurement=PERCENTAGE,
-                device_class=NumberDeviceClass.POWER_FACTOR,
-                icon="mdi:transmission-tower-export",
-                native_min_value=0,
-                native_max_value=110,
-                native_step=1,
-            )
-        ],
-        "103": [
-            SolisNumberEntityDescription(
-                name="Timed Charge Current 1",
-                key="timed_charge_current_1",
-                native_unit_of_measurement=UnitOfElectricCurrent.AMPERE,
-                device_class=SensorDeviceClass.CURRENT,
-                icon="mdi:current-dc",
-                native_min_value=0,
-                native_max_value=100,
-                native_step=1,
-                splitter=(",", "-"),
-            ),
-            SolisNumberEntityDescription(
-                name="Timed Discharge Current 1",
-                key="timed_discharge_current_1",
-                native_unit_of_measurement=UnitOfElectricCurrent.AMPERE,
-                device_class=SensorDeviceClass.CURRENT,
-                icon="mdi:current-dc",
-                native_min_value=0,
-                native_max_value=100,
-                native_step=1,
-                splitter=(",", "-"),
-            ),
-            SolisTimeEntityDescription(
-                name="Timed Charge Start 1",
-                key="timed_charge_start_1",
-                icon="mdi:clock",
-                splitter=(",", "-"),
-            ),
-            SolisTimeEntityDescription(
-                name="Timed Charge End 1",
-                key="timed_charge_end_1",
-                icon="mdi:clock",
-                splitter=(",", "-"),
-            ),
-            SolisTimeEntityDescription(
-                name="Timed Discharge Start 1",
-                key="timed_discharge_start_1",
-                icon="mdi:clock",
-                splitter=(",", "-"),
-            ),
-            SolisTimeEntityDescription(
-                name="Timed Discharge End 1",
-                key="timed_discharge_end_1",
-                icon="mdi:clock",
-                splitter=(",", "-"),
-            ),
-            SolisNumberEntityDescription(
-                name="Timed Charge Current 2",
-                key="timed_charge_current_2",
-                native_unit_of_measurement=UnitOfElectricCurrent.AMPERE,
-                device_class=SensorDeviceClass.CURRENT,
-                icon="mdi:current-dc",
-                native_min_value=0,
-                native_max_value=100,
-                native_step=1,
-                splitter=(",", "-"),
-            ),
-            SolisNumberEntityDescription(
-                name="Timed Discharge Current 2",
-                key="timed_discharge_current_2",
-                native_unit_of_measurement=UnitOfElectricCurrent.AMPERE,
-                device_class=SensorDeviceClass.CURRENT,
-                icon="mdi:current-dc",
-                native_min_value=0,
-                native_max_value=100,
-                native_step=1,
-                splitter=(",", "-"),
-            ),
-            SolisTimeEntityDescription(
-                name="Timed Charge Start 2",
-                key="timed_charge_start_2",
-                icon="mdi:clock",
-                splitter=(",", "-"),
-            ),
-            SolisTimeEntityDescription(
-                name="Timed Charge End 2",
-                key="timed_charge_end_2",
-                icon="mdi:clock",
-                splitter=(",", "-"),
-            ),
-            SolisTimeEntityDescription(
-                name="Timed Discharge Start 2",
-                key="timed_discharge_start_2",
-                icon="mdi:clock",
-                splitter=(",", "-"),
-            ),
-            SolisTimeEntityDescription(
-                name="Timed Discharge End 2",
-                key="timed_discharge_end_2",
-                icon="mdi:clock",
-                splitter=(",", "-"),
-            ),
-            SolisNumberEntityDescription(
-                name="Timed Charge Current 3",
-                key="timed_charge_current_3",
-                native_unit_of_measurement=UnitOfElectricCurrent.AMPERE,
-                device_class=SensorDeviceClass.CURRENT,
-                icon="mdi:current-dc",
-                native_min_value=0,
-                native_max_value=100,
-                native_step=1,
-                splitter=(",", "-"),
-            ),
-            SolisNumberEntityDescription(
-                name="Timed Discharge Current 3",
-                key="timed_discharge_current_3",
-                native_unit_of_measurement=UnitOfElectricCurrent.AMPERE,
-                device_class=SensorDeviceClass.CURRENT,
-                icon="mdi:current-dc",
-                native_min_value=0,
-                native_max_value=100,
-                native_step=1,
-                splitter=(",", "-"),
-            ),
-            SolisTimeEntityDescription(
-                name="Timed Charge Start 3",
-                key="timed_charge_start_3",
-                icon="mdi:clock",
-                splitter=(",", "-"),
-            ),
-            SolisTimeEntityDescription(
-                name="Timed Charge End 3",
-                key="timed_charge_end_3",
-                icon="mdi:clock",
-                splitter=(",", "-"),
-            ),
-            SolisTimeEntityDescription(
-                name="Timed Discharge Start 3",
-                key="timed_discharge_start_3",
-                icon="mdi:clock",
-                splitter=(",", "-"),
-            ),
-            SolisTimeEntityDescription(
-                name="Timed Discharge End 3",
-                key="timed_discharge_end_3",
-                icon="mdi:clock",
-                splitter=(",", "-"),
-            ),
-            SolisButtonEntityDescription(
-                name="Update Timed Charge/Discharge",
-                key="update_timed_charge_discharge",
-            ),
-        ],
-        "157": [
-            SolisNumberEntityDescription(
-                name="Backup SOC",
-                key="backup_soc",
-                native_unit_of_measurement=PERCENTAGE,
-                device_class=NumberDeviceClass.BATTERY,
-                icon="mdi:battery-sync",
-                native_min_value=10,
-                native_max_value=100,
-                native_step=1,
-            )
-        ],
-        "158": [
-            SolisNumberEntityDescription(
-                name="Overdischarge SOC",
-                key="overdischarge_soc",
-                native_unit_of_measurement=PERCENTAGE,
-                device_class=NumberDeviceClass.BATTERY,
-                icon="mdi:battery-sync",
-                native_min_value=10,
-                native_max_value=100,
-                native_step=1,
-            )
-        ],
-        "160": [
-            SolisNumberEntityDescription(
-                name="Force Charge SOC",
-                key="force_charge_soc",
-                native_unit_of_measurement=PERCENTAGE,
-                device_class=NumberDeviceClass.BATTERY,
-                icon="mdi:battery-sync",
-                native_min_value=10,
-                native_max_value=100,
-                native_step=1,
-            )
-        ],
-        "636": [
-            SolisSelectEntityDescription(
-                name="Energy Storage Control Switch",
-                key="energy_storage_control_switch",
-                option_dict={
-                    "1": "Self-Use - No Grid Charging",
-                    "3": "Timed Charge/Discharge - No Grid Charging",
-                    "17": "Backup/Reserve - No Grid Charging",
-                    "33": "Self-Use - No Timed Charge/Discharge",
-                    "35": "Self-Use",
-                    "37": "Off-Grid Mode",
-                    "41": "Battery Awaken",
-                    "43": "Battery Awaken + Timed Charge/Discharge",
-                    "49": "Backup/Reserve - No Timed Charge/Discharge",
-                    "51": "Backup/Reserve",
-                    "64": "Feed-in priority - No Grid Charging",
-                    "96": "Feed-in priority - No Timed Charge/Discharge",
-                    "98": "Feed-in priority",
-                },
-                icon="mdi:dip-switch",
-            )
-        ],
-        "696": [
-            SolisNumberEntityDescription(
-                name="Feed in Power Limit",
-                key="feed_in_power_limit",
-                icon="mdi:transmission-tower-export",
-                native_unit_of_measurement=UnitOfPower.WATT,
-                device_class=NumberDeviceClass.POWER,
-                native_min_value=0,
-                native_max_value=24000,
-                native_step=100,
-            )
-        ],
-        "5162": [
-            SolisSelectEntityDescription(
-                name="Inverter energy export on/off Control Switch",
-                key="inverter_energy_export_on_off_control_switch",
-                option_dict={
-                    "190": "ON",
-                    "222": "OFF",
-                },
-                icon="mdi:dip-switch",
-            )
-        ],
-    },
-}
+
+def _all_controls() -> dict[bool, dict[str, list]]:
+    """Control types dict[bool: dict] where key is HMI flag"""
+    return {
+        True: {
+            # 103 is still available with 4B00 but it doesn't do anything included here for testing only
+            # "103": [
+            #     SolisNumberEntityDescription(
+            #         name="Timed Charge Current 1",
+            #         key="timed_charge_current_1",
+            #         native_unit_of_measurement=UnitOfElectricCurrent.AMPERE,
+            #         device_class=SensorDeviceClass.CURRENT,
+            #         icon="mdi:current-dc",
+            #         native_min_value=0,
+            #         native_max_value=100,
+            #         native_step=1,
+            #         splitter=(",", "-"),
+            #     ),
+            #     SolisNumberEntityDescription(
+            #         name="Timed Discharge Current 1",
+            #         key="timed_discharge_current_1",
+            #         native_unit_of_measurement=UnitOfElectricCurrent.AMPERE,
+            #         device_class=SensorDeviceClass.CURRENT,
+            #         icon="mdi:current-dc",
+            #         native_min_value=0,
+            #         native_max_value=100,
+            #         native_step=1,
+            #         splitter=(",", "-"),
+            #     ),
+            #     SolisTimeEntityDescription(
+            #         name="Timed Charge Start 1",
+            #         key="timed_charge_start_1",
+            #         icon="mdi:clock",
+            #         splitter=(",", "-"),
+            #     ),
+            #     SolisTimeEntityDescription(
+            #         name="Timed Charge End 1",
+            #         key="timed_charge_end_1",
+            #         icon="mdi:clock",
+            #         splitter=(",", "-"),
+            #     ),
+            #     SolisTimeEntityDescription(
+            #         name="Timed Discharge Start 1",
+            #         key="timed_discharge_start_1",
+            #         icon="mdi:clock",
+            #         splitter=(",", "-"),
+            #     ),
+            #     SolisTimeEntityDescription(
+            #         name="Timed Discharge End 1",
+            #         key="timed_discharge_end_1",
+            #         icon="mdi:clock",
+            #         splitter=(",", "-"),
+            #     ),
+            #     SolisNumberEntityDescription(
+            #         name="Timed Charge Current 2",
+            #         key="timed_charge_current_2",
+            #         native_unit_of_measurement=UnitOfElectricCurrent.AMPERE,
+            #         device_class=SensorDeviceClass.CURRENT,
+            #         icon="mdi:current-dc",
+            #         native_min_value=0,
+            #         native_max_value=100,
+            #         native_step=1,
+            #         splitter=(",", "-"),
+            #     ),
+            #     SolisNumberEntityDescription(
+            #         name="Timed Discharge Current 2",
+            #         key="timed_discharge_current_2",
+            #         native_unit_of_measurement=UnitOfElectricCurrent.AMPERE,
+            #         device_class=SensorDeviceClass.CURRENT,
+            #         icon="mdi:current-dc",
+            #         native_min_value=0,
+            #         native_max_value=100,
+            #         native_step=1,
+            #         splitter=(",", "-"),
+            #     ),
+            #     SolisTimeEntityDescription(
+            #         name="Timed Charge Start 2",
+            #         key="timed_charge_start_2",
+            #         icon="mdi:clock",
+            #         splitter=(",", "-"),
+            #     ),
+            #     SolisTimeEntityDescription(
+            #         name="Timed Charge End 2",
+            #         key="timed_charge_end_2",
+            #         icon="mdi:clock",
+            #         splitter=(",", "-"),
+            #     ),
+            #     SolisTimeEntityDescription(
+            #         name="Timed Discharge Start 2",
+            #         key="timed_discharge_start_2",
+            #         icon="mdi:clock",
+            #         splitter=(",", "-"),
+            #     ),
+            #     SolisTimeEntityDescription(
+            #         name="Timed Discharge End 2",
+            #         key="timed_discharge_end_2",
+            #         icon="mdi:clock",
+            #         splitter=(",", "-"),
+            #     ),
+            #     SolisNumberEntityDescription(
+            #         name="Timed Charge Current 3",
+            #         key="timed_charge_current_3",
+            #         native_unit_of_measurement=UnitOfElectricCurrent.AMPERE,
+            #         device_class=SensorDeviceClass.CURRENT,
+            #         icon="mdi:current-dc",
+            #         native_min_value=0,
+            #         native_max_value=100,
+            #         native_step=1,
+            #         splitter=(",", "-"),
+            #     ),
+            #     SolisNumberEntityDescription(
+            #         name="Timed Discharge Current 3",
+            #         key="timed_discharge_current_3",
+            #         native_unit_of_measurement=UnitOfElectricCurrent.AMPERE,
+            #         device_class=SensorDeviceClass.CURRENT,
+            #         icon="mdi:current-dc",
+            #         native_min_value=0,
+            #         native_max_value=100,
+            #         native_step=1,
+            #         splitter=(",", "-"),
+            #     ),
+            #     SolisTimeEntityDescription(
+            #         name="Timed Charge Start 3",
+            #         key="timed_charge_start_3",
+            #         icon="mdi:clock",
+            #         splitter=(",", "-"),
+            #     ),
+            #     SolisTimeEntityDescription(
+            #         name="Timed Charge End 3",
+            #         key="timed_charge_end_3",
+            #         icon="mdi:clock",
+            #         splitter=(",", "-"),
+            #     ),
+            #     SolisTimeEntityDescription(
+            #         name="Timed Discharge Start 3",
+            #         key="timed_discharge_start_3",
+            #         icon="mdi:clock",
+            #         splitter=(",", "-"),
+            #     ),
+            #     SolisTimeEntityDescription(
+            #         name="Timed Discharge End 3",
+            #         key="timed_discharge_end_3",
+            #         icon="mdi:clock",
+            #         splitter=(",", "-"),
+            #     ),
+            #     SolisButtonEntityDescription(
+            #         name="Update Timed Charge/Discharge",
+            #         key="update_timed_charge_discharge",
+            #     ),
+            # ],
+            "15": [
+                SolisNumberEntityDescription(
+                    name="Power limit setting",
+                    key="power_limit_setting",
+                    native_unit_of_measurement=PERCENTAGE,
+                    device_class=NumberDeviceClass.POWER_FACTOR,
+                    icon="mdi:transmission-tower-export",
+                    native_min_value=0,
+                    native_max_value=110,
+                    native_step=1,
+                )
+            ],
+            "157": [
+                SolisNumberEntityDescription(
+                    name="Backup SOC",
+                    key="backup_soc",
+                    native_unit_of_measurement=PERCENTAGE,
+                    device_class=NumberDeviceClass.BATTERY,
+                    icon="mdi:battery-sync",
+                    native_min_value=10,
+                    native_max_value=100,
+                    native_step=1,
+                )
+            ],
+            "158": [
+                SolisNumberEntityDescription(
+                    name="Overdischarge SOC",
+                    key="overdischarge_soc",
+                    native_unit_of_measurement=PERCENTAGE,
+                    device_class=NumberDeviceClass.BATTERY,
+                    icon="mdi:battery-sync",
+                    native_min_value=10,
+                    native_max_value=100,
+                    native_step=1,
+                )
+            ],
+            "160": [
+                SolisNumberEntityDescription(
+                    name="Force Charge SOC",
+                    key="force_charge_soc",
+                    native_unit_of_measurement=PERCENTAGE,
+                    device_class=NumberDeviceClass.BATTERY,
+                    icon="mdi:battery-sync",
+                    native_min_value=10,
+                    native_max_value=100,
+                    native_step=1,
+                )
+            ],
+            "230": [
+                SolisNumberEntityDescription(
+                    name="System Export Power Limit Value",
+                    key="sytem_export_power_limit_value",
+                    native_unit_of_measurement=UnitOfPower.WATT,
+                    device_class=NumberDeviceClass.POWER,
+                    icon="mdi:transmission-tower-export",
+                    native_min_value=0,
+                    native_max_value=1000000000,  # 1 GW
+                    native_step=1,
+                )
+            ],
+            "636": [
+                SolisSelectEntityDescription(
+                    name="Energy Storage Control Switch",
+                    key="energy_storage_control_switch",
+                    option_dict={
+                        "33": "Self-Use Mode - Allow Grid Charging",
+                        "49": "Self-Use Mode - Allow Grid Charging, Backup Mode On",
+                        "1": "Self-Use Mode - No Grid Charging",
+                        "17": "Self-Use Mode - No Grid Charging, Backup Mode On",
+                        "96": "Feed-In Priority Mode - Allow Grid Charging",
+                        "112": "Feed-In Priority Mode - Allow Grid Charging, Backup Mode On",
+                        "64": "Feed-In Priority Mode - No Grid Charging",
+                        "80": "Feed-In Priority Mode - No Grid Charging, Backup Mode On",
+                        "5": "Off-Grid Mode",
+                    },
+                    icon="mdi:dip-switch",
+                )
+            ],
+            "696": [
+                SolisNumberEntityDescription(
+                    name="Feed in Power Limit",
+                    key="feed_in_power_limit",
+                    icon="mdi:transmission-tower-export",
+                    native_unit_of_measurement=UnitOfPower.WATT,
+                    device_class=NumberDeviceClass.POWER,
+                    native_min_value=0,
+                    native_max_value=24000,
+                    native_step=100,
+                )
+            ],
+            "5161": [
+                SolisSelectEntityDescription(
+                    name="Inverter energy export on/off Control Switch",
+                    key="inverter_energy_export_on_off_control_switch",
+                    option_dict={
+                        "190": "ON",
+                        "222": "OFF",
+                    },
+                    icon="mdi:dip-switch",
+                )
+            ],
+            "5928": [
+                SolisNumberEntityDescription(
+                    name="Timed Charge SOC 1",
+                    key="timed_charge_soc_1",
+                    native_unit_of_measurement=PERCENTAGE,
+                    device_class=NumberDeviceClass.BATTERY,
+                    icon="mdi:battery-sync",
+                    native_min_value=10,
+                    native_max_value=100,
+                    native_step=1,
+                )
+            ],
+            "5948": [
+                SolisNumberEntityDescription(
+                    name="Timed Charge Current 1",
+                    key="timed_charge_current_1",
+                    native_unit_of_measurement=UnitOfElectricCurrent.AMPERE,
+                    device_class=SensorDeviceClass.CURRENT,
+                    icon="mdi:battery-sync",
+                    native_min_value=0,
+                    native_max_value=100,
+                    native_step=1,
+                )
+            ],
+            "5946": [
+                SolisTimeEntityDescription(
+                    name="Timed Charge Start 1",
+                    key="timed_charge_start_1",
+                    icon="mdi:clock",
+                    splitter=("-"),
+                ),
+                SolisTimeEntityDescription(
+                    name="Timed Charge End 1",
+                    key="timed_charge_end_1",
+                    icon="mdi:clock",
+                    splitter=("-"),
+                ),
+                SolisButtonEntityDescription(
+                    name="Update Timed Charge 1",
+                    key="update_timed_charge_1",
+                ),
+            ],
+            "5965": [
+                SolisNumberEntityDescription(
+                    name="Timed Discharge SOC 1",
+                    key="timed_discharge_soc_1",
+                    native_unit_of_measurement=PERCENTAGE,
+                    device_class=NumberDeviceClass.BATTERY,
+                    icon="mdi:battery-sync",
+                    native_min_value=10,
+                    native_max_value=100,
+                    native_step=1,
+                )
+            ],
+            "5967": [
+                SolisNumberEntityDescription(
+                    name="Timed Discharge Current 1",
+                    key="timed_discharge_current_1",
+                    native_unit_of_measurement=UnitOfElectricCurrent.AMPERE,
+                    device_class=SensorDeviceClass.CURRENT,
+                    icon="mdi:battery-sync",
+                    native_min_value=0,
+                    native_max_value=100,
+                    native_step=1,
+                )
+            ],
+            "5964": [
+                SolisTimeEntityDescription(
+                    name="Timed Discharge Start 1",
+                    key="timed_discharge_start_1",
+                    icon="mdi:clock",
+                    splitter=("-"),
+                ),
+                SolisTimeEntityDescription(
+                    name="Timed Discharge End 1",
+                    key="timed_discharge_end_1",
+                    icon="mdi:clock",
+                    splitter=("-"),
+                ),
+                SolisButtonEntityDescription(
+                    name="Update Timed Discharge 1",
+                    key="update_timed_discharge_1",
+                ),
+            ],
+            # ======================= Slot 2 =================================
+            "5929": [
+                SolisNumberEntityDescription(
+                    name="Timed Charge SOC 2",
+                    key="timed_charge_soc_2",
+                    native_unit_of_measurement=PERCENTAGE,
+                    device_class=NumberDeviceClass.BATTERY,
+                    icon="mdi:battery-sync",
+                    native_min_value=10,
+                    native_max_value=100,
+                    native_step=1,
+                )
+            ],
+            "5951": [
+                SolisNumberEntityDescription(
+                    name="Timed Charge Current 2",
+                    key="timed_charge_current_2",
+                    native_unit_of_measurement=UnitOfElectricCurrent.AMPERE,
+                    device_class=SensorDeviceClass.CURRENT,
+                    icon="mdi:battery-sync",
+                    native_min_value=0,
+                    native_max_value=100,
+                    native_step=1,
+                )
+            ],
+            "5949": [
+                SolisTimeEntityDescription(
+                    name="Timed Charge Start 2",
+                    key="timed_charge_start_2",
+                    icon="mdi:clock",
+                    splitter=("-"),
+                ),
+                SolisTimeEntityDescription(
+                    name="Timed Charge End 2",
+                    key="timed_charge_end_2",
+                    icon="mdi:clock",
+                    splitter=("-"),
+                ),
+                SolisButtonEntityDescription(
+                    name="Update Timed Charge 2",
+                    key="update_timed_charge_2",
+                ),
+            ],
+            "5969": [
+                SolisNumberEntityDescription(
+                    name="Timed Discharge SOC 2",
+                    key="timed_discharge_soc_2",
+                    native_unit_of_measurement=PERCENTAGE,
+                    device_class=NumberDeviceClass.BATTERY,
+                    icon="mdi:battery-sync",
+                    native_min_value=10,
+                    native_max_value=100,
+                    native_step=1,
+                )
+            ],
+            "5971": [
+                SolisNumberEntityDescription(
+                    name="Timed Discharge Current 2",
+                    key="timed_discharge_current_2",
+                    native_unit_of_measurement=UnitOfElectricCurrent.AMPERE,
+                    device_class=SensorDeviceClass.CURRENT,
+                    icon="mdi:battery-sync",
+                    native_min_value=0,
+                    native_max_value=100,
+                    native_step=1,
+                )
+            ],
+            "5968": [
+                SolisTimeEntityDescription(
+                    name="Timed Discharge Start 2",
+                    key="timed_discharge_start_2",
+                    icon="mdi:clock",
+                    splitter=("-"),
+                ),
+                SolisTimeEntityDescription(
+                    name="Timed Discharge End 2",
+                    key="timed_discharge_end_2",
+                    icon="mdi:clock",
+                    splitter=("-"),
+                ),
+                SolisButtonEntityDescription(
+                    name="Update Timed Discharge 2",
+                    key="update_timed_discharge_2",
+                ),
+            ],
+            # ======================= Slot 3 =================================
+            "5930": [
+                SolisNumberEntityDescription(
+                    name="Timed Charge SOC 3",
+                    key="timed_charge_soc_3",
+                    native_unit_of_measurement=PERCENTAGE,
+                    device_class=NumberDeviceClass.BATTERY,
+                    icon="mdi:battery-sync",
+                    native_min_value=10,
+                    native_max_value=100,
+                    native_step=1,
+                )
+            ],
+            "5954": [
+                SolisNumberEntityDescription(
+                    name="Timed Charge Current 3",
+                    key="timed_charge_current_3",
+                    native_unit_of_measurement=UnitOfElectricCurrent.AMPERE,
+                    device_class=SensorDeviceClass.CURRENT,
+                    icon="mdi:battery-sync",
+                    native_min_value=0,
+                    native_max_value=100,
+                    native_step=1,
+                )
+            ],
+            "5952": [
+                SolisTimeEntityDescription(
+                    name="Timed Charge Start 3",
+                    key="timed_charge_start_3",
+                    icon="mdi:clock",
+                    splitter=("-"),
+                ),
+                SolisTimeEntityDescription(
+                    name="Timed Charge End 3",
+                    key="timed_charge_end_3",
+                    icon="mdi:clock",
+                    splitter=("-"),
+                ),
+                SolisButtonEntityDescription(
+                    name="Update Timed Charge 3",
+                    key="update_timed_charge_3",
+                ),
+            ],
+            "5973": [
+                SolisNumberEntityDescription(
+                    name="Timed Discharge SOC 3",
+                    key="timed_discharge_soc_3",
+                    native_unit_of_measurement=PERCENTAGE,
+                    device_class=NumberDeviceClass.BATTERY,
+                    icon="mdi:battery-sync",
+                    native_min_value=10,
+                    native_max_value=100,
+                    native_step=1,
+                )
+            ],
+            "5975": [
+                SolisNumberEntityDescription(
+                    name="Timed Discharge Current 3",
+                    key="timed_discharge_current_3",
+                    native_unit_of_measurement=UnitOfElectricCurrent.AMPERE,
+                    device_class=SensorDeviceClass.CURRENT,
+                    icon="mdi:battery-sync",
+                    native_min_value=0,
+                    native_max_value=100,
+                    native_step=1,
+                )
+            ],
+            "5972": [
+                SolisTimeEntityDescription(
+                    name="Timed Discharge Start 3",
+                    key="timed_discharge_start_3",
+                    icon="mdi:clock",
+                    splitter=("-"),
+                ),
+                SolisTimeEntityDescription(
+                    name="Timed Discharge End 3",
+                    key="timed_discharge_end_3",
+                    icon="mdi:clock",
+                    splitter=("-"),
+                ),
+                SolisButtonEntityDescription(
+                    name="Update Timed Discharge 3",
+                    key="update_timed_discharge_3",
+                ),
+            ],
+            # ======================= Slot 4 =================================
+            "5931": [
+                SolisNumberEntityDescription(
+                    name="Timed Charge SOC 4",
+                    key="timed_charge_soc_4",
+                    native_unit_of_measurement=PERCENTAGE,
+                    device_class=NumberDeviceClass.BATTERY,
+                    icon="mdi:battery-sync",
+                    native_min_value=10,
+                    native_max_value=100,
+                    native_step=1,
+                )
+            ],
+            "5957": [
+                SolisNumberEntityDescription(
+                    name="Timed Charge Current 4",
+                    key="timed_charge_current_4",
+                    native_unit_of_measurement=UnitOfElectricCurrent.AMPERE,
+                    device_class=SensorDeviceClass.CURRENT,
+                    icon="mdi:battery-sync",
+                    native_min_value=0,
+                    native_max_value=100,
+                    native_step=1,
+                )
+            ],
+            "5955": [
+                SolisTimeEntityDescription(
+                    name="Timed Charge Start 4",
+                    key="timed_charge_start_4",
+                    icon="mdi:clock",
+                    splitter=("-"),
+                ),
+                SolisTimeEntityDescription(
+                    name="Timed Charge End 4",
+                    key="timed_charge_end_4",
+                    icon="mdi:clock",
+                    splitter=("-"),
+                ),
+                SolisButtonEntityDescription(
+                    name="Update Timed Charge 4",
+                    key="update_timed_charge_4",
+                ),
+            ],
+            "5977": [
+                SolisNumberEntityDescription(
+                    name="Timed Discharge SOC 4",
+                    key="timed_discharge_soc_4",
+                    native_unit_of_measurement=PERCENTAGE,
+                    device_class=NumberDeviceClass.BATTERY,
+                    icon="mdi:battery-sync",
+                    native_min_value=10,
+                    native_max_value=100,
+                    native_step=1,
+                )
+            ],
+            "5979": [
+                SolisNumberEntityDescription(
+                    name="Timed Discharge Current 4",
+                    key="timed_discharge_current_4",
+                    native_unit_of_measurement=UnitOfElectricCurrent.AMPERE,
+                    device_class=SensorDeviceClass.CURRENT,
+                    icon="mdi:battery-sync",
+                    native_min_value=0,
+                    native_max_value=100,
+                    native_step=1,
+                )
+            ],
+            "5976": [
+                SolisTimeEntityDescription(
+                    name="Timed Discharge Start 4",
+                    key="timed_discharge_start_4",
+                    icon="mdi:clock",
+                    splitter=("-"),
+                ),
+                SolisTimeEntityDescription(
+                    name="Timed Discharge End 4",
+                    key="timed_discharge_end_4",
+                    icon="mdi:clock",
+                    splitter=("-"),
+                ),
+                SolisButtonEntityDescription(
+                    name="Update Timed Discharge 4",
+                    key="update_timed_discharge_4",
+                ),
+            ],
+            # ======================= Slot 5 =================================
+            "5932": [
+                SolisNumberEntityDescription(
+                    name="Timed Charge SOC 5",
+                    key="timed_charge_soc_5",
+                    native_unit_of_measurement=PERCENTAGE,
+                    device_class=NumberDeviceClass.BATTERY,
+                    icon="mdi:battery-sync",
+                    native_min_value=10,
+                    native_max_value=100,
+                    native_step=1,
+                )
+            ],
+            "5960": [
+                SolisNumberEntityDescription(
+                    name="Timed Charge Current 5",
+                    key="timed_charge_current_5",
+                    native_unit_of_measurement=UnitOfElectricCurrent.AMPERE,
+                    device_class=SensorDeviceClass.CURRENT,
+                    icon="mdi:battery-sync",
+                    native_min_value=0,
+                    native_max_value=100,
+                    native_step=1,
+                )
+            ],
+            "5958": [
+                SolisTimeEntityDescription(
+                    name="Timed Charge Start 5",
+                    key="timed_charge_start_5",
+                    icon="mdi:clock",
+                    splitter=("-"),
+                ),
+                SolisTimeEntityDescription(
+                    name="Timed Charge End 5",
+                    key="timed_charge_end_5",
+                    icon="mdi:clock",
+                    splitter=("-"),
+                ),
+                SolisButtonEntityDescription(
+                    name="Update Timed Charge 5",
+                    key="update_timed_charge_5",
+                ),
+            ],
+            "5981": [
+                SolisNumberEntityDescription(
+                    name="Timed Discharge SOC 5",
+                    key="timed_discharge_soc_5",
+                    native_unit_of_measurement=PERCENTAGE,
+                    device_class=NumberDeviceClass.BATTERY,
+                    icon="mdi:battery-sync",
+                    native_min_value=10,
+                    native_max_value=100,
+                    native_step=1,
+                )
+            ],
+            "5983": [
+                SolisNumberEntityDescription(
+                    name="Timed Discharge Current 5",
+                    key="timed_discharge_current_5",
+                    native_unit_of_measurement=UnitOfElectricCurrent.AMPERE,
+                    device_class=SensorDeviceClass.CURRENT,
+                    icon="mdi:battery-sync",
+                    native_min_value=0,
+                    native_max_value=100,
+                    native_step=1,
+                )
+            ],
+            "5980": [
+                SolisTimeEntityDescription(
+                    name="Timed Discharge Start 5",
+                    key="timed_discharge_start_5",
+                    icon="mdi:clock",
+                    splitter=("-"),
+                ),
+                SolisTimeEntityDescription(
+                    name="Timed Discharge End 5",
+                    key="timed_discharge_end_5",
+                    icon="mdi:clock",
+                    splitter=("-"),
+                ),
+                SolisButtonEntityDescription(
+                    name="Update Timed Discharge 5",
+                    key="update_timed_discharge_5",
+                ),
+            ],
+            # ======================= Slot 6 =================================
+            "5933": [
+                SolisNumberEntityDescription(
+                    name="Timed Charge SOC 6",
+                    key="timed_charge_soc_6",
+                    native_unit_of_measurement=PERCENTAGE,
+                    device_class=NumberDeviceClass.BATTERY,
+                    icon="mdi:battery-sync",
+                    native_min_value=10,
+                    native_max_value=100,
+                    native_step=1,
+                )
+            ],
+            "5963": [
+                SolisNumberEntityDescription(
+                    name="Timed Charge Current 6",
+                    key="timed_charge_current_6",
+                    native_unit_of_measurement=UnitOfElectricCurrent.AMPERE,
+                    device_class=SensorDeviceClass.CURRENT,
+                    icon="mdi:battery-sync",
+                    native_min_value=0,
+                    native_max_value=100,
+                    native_step=1,
+                )
+            ],
+            "5961": [
+                SolisTimeEntityDescription(
+                    name="Timed Charge Start 6",
+                    key="timed_charge_start_6",
+                    icon="mdi:clock",
+                    splitter=("-"),
+                ),
+                SolisTimeEntityDescription(
+                    name="Timed Charge End 6",
+                    key="timed_charge_end_6",
+                    icon="mdi:clock",
+                    splitter=("-"),
+                ),
+                SolisButtonEntityDescription(
+                    name="Update Timed Charge 6",
+                    key="update_timed_charge_6",
+                ),
+            ],
+            "5984": [
+                SolisNumberEntityDescription(
+                    name="Timed Discharge SOC 6",
+                    key="timed_discharge_soc_6",
+                    native_unit_of_measurement=PERCENTAGE,
+                    device_class=NumberDeviceClass.BATTERY,
+                    icon="mdi:battery-sync",
+                    native_min_value=10,
+                    native_max_value=100,
+                    native_step=1,
+                )
+            ],
+            "5986": [
+                SolisNumberEntityDescription(
+                    name="Timed Discharge Current 6",
+                    key="timed_discharge_current_6",
+                    native_unit_of_measurement=UnitOfElectricCurrent.AMPERE,
+                    device_class=SensorDeviceClass.CURRENT,
+                    icon="mdi:battery-sync",
+                    native_min_value=0,
+                    native_max_value=100,
+                    native_step=1,
+                )
+            ],
+            "5987": [
+                SolisTimeEntityDescription(
+                    name="Timed Discharge Start 6",
+                    key="timed_discharge_start_6",
+                    icon="mdi:clock",
+                    splitter=("-"),
+                ),
+                SolisTimeEntityDescription(
+                    name="Timed Discharge End 6",
+                    key="timed_discharge_end_6",
+                    icon="mdi:clock",
+                    splitter=("-"),
+                ),
+                SolisButtonEntityDescription(
+                    name="Update Timed Discharge 6",
+                    key="update_timed_discharge_6",
+                ),
+            ],
+        },
+        False: {
+            "15": [
+                SolisNumberEntityDescription(
+                    name="Power limit setting (% of rated power)",
+                    key="power_limit_setting",
+                    native_unit_of_measurement=PERCENTAGE,
+                    device_class=NumberDeviceClass.POWER_FACTOR,
+                    icon="mdi:transmission-tower-export",
+                    native_min_value=0,
+                    native_max_value=110,
+                    native_step=1,
+                )
+            ],
+            "103": [
+                SolisNumberEntityDescription(
+                    name="Timed Charge Current 1",
+                    key="timed_charge_current_1",
+                    native_unit_of_measurement=UnitOfElectricCurrent.AMPERE,
+                    device_class=SensorDeviceClass.CURRENT,
+                    icon="mdi:current-dc",
+                    native_min_value=0,
+                    native_max_value=100,
+                    native_step=1,
+                    splitter=(",", "-"),
+                ),
+                SolisNumberEntityDescription(
+                    name="Timed Discharge Current 1",
+                    key="timed_discharge_current_1",
+                    native_unit_of_measurement=UnitOfElectricCurrent.AMPERE,
+                    device_class=SensorDeviceClass.CURRENT,
+                    icon="mdi:current-dc",
+                    native_min_value=0,
+                    native_max_value=100,
+                    native_step=1,
+                    splitter=(",", "-"),
+                ),
+                SolisTimeEntityDescription(
+                    name="Timed Charge Start 1",
+                    key="timed_charge_start_1",
+                    icon="mdi:clock",
+                    splitter=(",", "-"),
+                ),
+                SolisTimeEntityDescription(
+                    name="Timed Charge End 1",
+                    key="timed_charge_end_1",
+                    icon="mdi:clock",
+                    splitter=(",", "-"),
+                ),
+                SolisTimeEntityDescription(
+                    name="Timed Discharge Start 1",
+                    key="timed_discharge_start_1",
+                    icon="mdi:clock",
+                    splitter=(",", "-"),
+                ),
+                SolisTimeEntityDescription(
+                    name="Timed Discharge End 1",
+                    key="timed_discharge_end_1",
+                    icon="mdi:clock",
+                    splitter=(",", "-"),
+                ),
+                SolisNumberEntityDescription(
+                    name="Timed Charge Current 2",
+                    key="timed_charge_current_2",
+                    native_unit_of_measurement=UnitOfElectricCurrent.AMPERE,
+                    device_class=SensorDeviceClass.CURRENT,
+                    icon="mdi:current-dc",
+                    native_min_value=0,
+                    native_max_value=100,
+                    native_step=1,
+                    splitter=(",", "-"),
+                ),
+                SolisNumberEntityDescription(
+                    name="Timed Discharge Current 2",
+                    key="timed_discharge_current_2",
+                    native_unit_of_measurement=UnitOfElectricCurrent.AMPERE,
+                    device_class=SensorDeviceClass.CURRENT,
+                    icon="mdi:current-dc",
+                    native_min_value=0,
+                    native_max_value=100,
+                    native_step=1,
+                    splitter=(",", "-"),
+                ),
+                SolisTimeEntityDescription(
+                    name="Timed Charge Start 2",
+                    key="timed_charge_start_2",
+                    icon="mdi:clock",
+                    splitter=(",", "-"),
+                ),
+                SolisTimeEntityDescription(
+                    name="Timed Charge End 2",
+                    key="timed_charge_end_2",
+                    icon="mdi:clock",
+                    splitter=(",", "-"),
+                ),
+                SolisTimeEntityDescription(
+                    name="Timed Discharge Start 2",
+                    key="timed_discharge_start_2",
+                    icon="mdi:clock",
+                    splitter=(",", "-"),
+                ),
+                SolisTimeEntityDescription(
+                    name="Timed Discharge End 2",
+                    key="timed_discharge_end_2",
+                    icon="mdi:clock",
+                    splitter=(",", "-"),
+                ),
+                SolisNumberEntityDescription(
+                    name="Timed Charge Current 3",
+                    key="timed_charge_current_3",
+                    native_unit_of_measurement=UnitOfElectricCurrent.AMPERE,
+                    device_class=SensorDeviceClass.CURRENT,
+                    icon="mdi:current-dc",
+                    native_min_value=0,
+                    native_max_value=100,
+                    native_step=1,
+                    splitter=(",", "-"),
+                ),
+                SolisNumberEntityDescription(
+                    name="Timed Discharge Current 3",
+                    key="timed_discharge_current_3",
+                    native_unit_of_measurement=UnitOfElectricCurrent.AMPERE,
+                    device_class=SensorDeviceClass.CURRENT,
+                    icon="mdi:current-dc",
+                    native_min_value=0,
+                    native_max_value=100,
+                    native_step=1,
+                    splitter=(",", "-"),
+                ),
+                SolisTimeEntityDescription(
+                    name="Timed Charge Start 3",
+                    key="timed_charge_start_3",
+                    icon="mdi:clock",
+                    splitter=(",", "-"),
+                ),
+                SolisTimeEntityDescription(
+                    name="Timed Charge End 3",
+                    key="timed_charge_end_3",
+                    icon="mdi:clock",
+                    splitter=(",", "-"),
+                ),
+                SolisTimeEntityDescription(
+                    name="Timed Discharge Start 3",
+                    key="timed_discharge_start_3",
+                    icon="mdi:clock",
+                    splitter=(",", "-"),
+                ),
+                SolisTimeEntityDescription(
+                    name="Timed Discharge End 3",
+                    key="timed_discharge_end_3",
+                    icon="mdi:clock",
+                    splitter=(",", "-"),
+                ),
+                SolisButtonEntityDescription(
+                    name="Update Timed Charge/Discharge",
+                    key="update_timed_charge_discharge",
+                ),
+            ],
+            "157": [
+                SolisNumberEntityDescription(
+                    name="Backup SOC",
+                    key="backup_soc",
+                    native_unit_of_measurement=PERCENTAGE,
+                    device_class=NumberDeviceClass.BATTERY,
+                    icon="mdi:battery-sync",
+                    native_min_value=10,
+                    native_max_value=100,
+                    native_step=1,
+                )
+            ],
+            "158": [
+                SolisNumberEntityDescription(
+                    name="Overdischarge SOC",
+                    key="overdischarge_soc",
+                    native_unit_of_measurement=PERCENTAGE,
+                    device_class=NumberDeviceClass.BATTERY,
+                    icon="mdi:battery-sync",
+                    native_min_value=10,
+                    native_max_value=100,
+                    native_step=1,
+                )
+            ],
+            "160": [
+                SolisNumberEntityDescription(
+                    name="Force Charge SOC",
+                    key="force_charge_soc",
+                    native_unit_of_measurement=PERCENTAGE,
+                    device_class=NumberDeviceClass.BATTERY,
+                    icon="mdi:battery-sync",
+                    native_min_value=10,
+                    native_max_value=100,
+                    native_step=1,
+                )
+            ],
+            "636": [
+                SolisSelectEntityDescription(
+                    name="Energy Storage Control Switch",
+                    key="energy_storage_control_switch",
+                    option_dict={
+                        "1": "Self-Use - No Grid Charging",
+                        "3": "Timed Charge/Discharge - No Grid Charging",
+                        "17": "Backup/Reserve - No Grid Charging",
+                        "33": "Self-Use - No Timed Charge/Discharge",
+                        "35": "Self-Use",
+                        "37": "Off-Grid Mode",
+                        "41": "Battery Awaken",
+                        "43": "Battery Awaken + Timed Charge/Discharge",
+                        "49": "Backup/Reserve - No Timed Charge/Discharge",
+                        "51": "Backup/Reserve",
+                        "64": "Feed-in priority - No Grid Charging",
+                        "96": "Feed-in priority - No Timed Charge/Discharge",
+                        "98": "Feed-in priority",
+                    },
+                    icon="mdi:dip-switch",
+                )
+            ],
+            "696": [
+                SolisNumberEntityDescription(
+                    name="Feed in Power Limit",
+                    key="feed_in_power_limit",
+                    icon="mdi:transmission-tower-export",
+                    native_unit_of_measurement=UnitOfPower.WATT,
+                    device_class=NumberDeviceClass.POWER,
+                    native_min_value=0,
+                    native_max_value=24000,
+                    native_step=100,
+                )
+            ],
+            "5162": [
+                SolisSelectEntityDescription(
+                    name="Inverter energy export on/off Control Switch",
+                    key="inverter_energy_export_on_off_control_switch",
+                    option_dict={
+                        "190": "ON",
+                        "222": "OFF",
+                    },
+                    icon="mdi:dip-switch",
+                )
+            ],
+        },
+    }
+
+
+class ControlCatalog:
+    """All control descriptions, indexed by HMI flag, platform and cid"""
+
+    def __init__(self, all_controls: dict[bool, dict[str, list]]) -> None:
+        platform_lookup = {CONTROL_TYPES[platform]: platform for platform in CONTROL_TYPES}
+        self.all_controls = all_controls
+        # {hmi flag: (cid, ...)}
+        self.cids: dict[bool, tuple[str, ...]] = {}
+        # {hmi flag: {platform: [(cid, index, description, button), ...]}}
+        self.platforms: dict[bool, dict[str, list[tuple]]] = {}
+        for hmi_flag, controls in all_controls.items():
+            self.cids[hmi_flag] = tuple(controls)
+            platforms: dict[str, list[tuple]] = {platform: [] for platform in CONTROL_TYPES}
+            for cid, descriptions in controls.items():
+                button = len(descriptions) > 1
+                for index, description in enumerate(descriptions):
+                    platforms[platform_lookup[type(description)]].append((cid, index, description, button))
+            self.platforms[hmi_flag] = platforms
+
+
+@functools.cache
+def control_catalog() -> ControlCatalog:
+    """Build the catalog on first use, sensor only setups never pay for it"""
+    return ControlCatalog(_all_controls())
@@ -42,36 +42,113 @@ class PortalConfig(ABC):
         return self._plant_id
 
 
+class GinlongSchema:
+    """
+    Slot index shared by all measurement snapshots.
+
+    Keys are numbered in order of first appearance, state is always slot 0
+    so iterating a snapshot yields it first.
+    """
+
+    def __init__(self) -> None:
+        self._slots: dict[str, int] = {}
+        self._keys: list[str] = []
+        self.slot(INVERTER_STATE)
+
+    def __len__(self) -> int:
+        return len(self._keys)
+
+    def slot(self, key: str) -> int:
+        """Return the slot of key, allocating a new one for an unknown key."""
+        index = self._slots.get(key)
+        if index is None:
+            index = self._slots[key] = len(self._keys)
+            self._keys.append(key)
+        return index
+
+    def find(self, key: str) -> int | None:
+        """Return the slot of key, None if no snapshot ever had it."""
+        return self._slots.get(key)
+
+    def key(self, index: int) -> str:
+        """Return the key stored in slot index."""
+        return self._keys[index]
+
+
+# Empty slot, None can be a valid measurement
+_MISSING = object()
+
+SCHEMA = GinlongSchema()
+
+
 class GinlongData:
     """Representing data measurement for one inverter from Ginlong API"""
 
-    def __init__(self, data: dict[str, str | int | float]) -> None:
-        """Initialize the data object"""
-        self._data = dict(data)
+    __slots__ = ("_schema", "_values", "_keys", "_unchanged")
+
+    def __init__(
+        self,
+        *sources: dict[str, str | int | float],
+        unchanged: bool = False,
+        schema: GinlongSchema = SCHEMA,
+    ) -> None:
+        """Initialize the data object, later sources override earlier ones"""
+        self._schema = schema
+        self._values: list = [_MISSING] * len(schema)
+        self._keys: list[str] | None = None
+        self._unchanged = unchanged
+        self.update(*sources)
+
+    @property
+    def unchanged(self) -> bool:
+        """True if the portal has no new measurement since the previous fetch."""
+        return self._unchanged
+
+    def update(self, *sources: dict[str, str | int | float]) -> None:
+        """Store the measurements of sources in place."""
+        values = self._values
+        slot = self._schema.slot
+        for source in sources:
+            for key, value in source.items():
+                index = slot(key)
+                if index >= len(values):
+                    values.extend([_MISSING] * (len(self._schema) - len(values)))
+                values[index] = value
+        self._keys = None
+
+    def get(self, key: str, default=None):
+        """Return the measurement for key, default if not available."""
+        index = self._schema.find(key)
+        if index is None or index >= len(self._values):
+            return default
+        value = self._values[index]
+        return default if value is _MISSING else value
+
+    def __contains__(self, key: str) -> bool:
+        return self.get(key, _MISSING) is not _MISSING
 
     def get_inverter_data(self) -> dict[str, str | int | float]:
         """Return all available measurements in a dict."""
-        return self._data
+        return {key: self._values[self._schema.slot(key)] for key in self.keys()}
 
     def keys(self) -> list[str]:
-        """Return keys of all measurements in a list, ensure state is first."""
-        available_measurements: list[str] = list(self._data.keys())
-        # Move state to beginning of list to avoid race conditions for the
-        # energy today fix.
-        available_measurements.remove(INVERTER_STATE)
-        available_measurements.insert(0, INVERTER_STATE)
-        return available_measurements
+        """Return keys of all measurements in a list, state is always first."""
+        # State first avoids race conditions for the energy today fix
+        if self._keys is None:
+            key = self._schema.key
+            self._keys = [key(index) for index, value in enumerate(self._values) if value is not _MISSING]
+        return self._keys
 
     def __getattr__(self, name):
         """Each measurement is represented as property."""
-        try:
-            return self._data[name]
-        except KeyError as key_error:
+        value = self.get(name, _MISSING) if not name.startswith("_") else _MISSING
+        if value is _MISSING:
             _LOGGER.debug("AttributeError, %s does not exist", name)
-            raise AttributeError(name) from key_error
+            raise AttributeError(name)
+        return value
 
     def __str__(self):
-        return "\n".join([f"{key:s}: {str(self._data[key]):s}" for key in self._data])
+        return "\n".join([f"{key:s}: {str(self.get(key)):s}" for key in self.keys()])
 
 
 class BaseAPI(ABC):
@@ -113,6 +190,30 @@ class BaseAPI(ABC):
     def is_online(self) -> bool:
         """Returns if we are logged in."""
 
+    @property
+    def available(self) -> bool:
+        """Returns if the portal is expected to answer requests."""
+        return True
+
+    async def probe(self) -> bool:
+        """Check an unhealthy portal answers again before polling, True if it does."""
+        return True
+
+    async def reload_config(self) -> None:
+        """Pick up configuration files changed since the last poll, if the API has any."""
+
+    async def refresh_session(self) -> bool:
+        """Recover from an auth error without a full login, if the API supports it."""
+        return False
+
+    def take_login_data(self) -> dict[str, GinlongData]:
+        """Hand out data fetched during login, if the API keeps it."""
+        return {}
+
+    def requires_relogin(self, inverter_serials: list[str]) -> bool:
+        """Returns if the failed polls of inverter_serials can only be resolved by logging in again."""
+        return len(inverter_serials) > 0
+
     @abstractmethod
     async def login(self, session: ClientSession) -> bool:
         """Login to service."""
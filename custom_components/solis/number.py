@@ -1,4 +1,3 @@
-import asyncio
 import logging
 import re
 from datetime import datetime
@@ -9,16 +8,13 @@ from homeassistant.core import HomeAssistant
 
 from .const import DOMAIN, LAST_UPDATED
 from .control_const import (
-    ALL_CONTROLS,
-    RETRIES,
-    RETRY_WAIT,
     SolisBaseControlEntity,
     SolisNumberEntityDescription,
+    async_add_control_entities,
 )
 from .service import InverterService, ServiceSubscriber
 
 _LOGGER = logging.getLogger(__name__)
-# RETRIES = 100
 
 
 async def async_setup_entry(hass: HomeAssistant, config_entry: ConfigEntry, async_add_entities):
@@ -30,43 +26,23 @@ async def async_setup_entry(hass: HomeAssistant, config_entry: ConfigEntry, asyn
     service = hass.data[DOMAIN][config_entry.entry_id]
 
     _LOGGER.info(f"Waiting for discovery of controls for plant {plant_id}")
-    await asyncio.sleep(RETRY_WAIT)
-    attempts = 0
-    while (attempts < RETRIES) and (not service.has_controls):
-        _LOGGER.debug(f"    Attempt {attempts} failed")
-        await asyncio.sleep(RETRY_WAIT)
-        attempts += 1
-
-    _LOGGER.debug(f"    Attempt {attempts} succeeded")
-
-    if service.has_controls:
-        entities = []
-        _LOGGER.debug(f"Plant ID {plant_id} has controls:")
-        for inverter_sn in service.controls:
-            for cid, index, entity, button, initial_value in service.controls[inverter_sn]["number"]:
-                entities.append(
-                    SolisNumberEntity(
-                        service,
-                        config_entry.data["name"],
-                        inverter_sn,
-                        cid,
-                        entity,
-                        index,
-                        button,
-                        initial_value,
-                    )
-                )
-
-        if len(entities) > 0:
-            _LOGGER.debug(f"Creating {len(entities)} number entities")
-            async_add_entities(entities)
-        else:
-            _LOGGER.debug(f"No number controls found for Plant ID {plant_id}")
+    # Don't block the setup, entities are added as soon as discovery completes
+    config_entry.async_create_background_task(
+        hass,
+        _async_add_controls(service, config_entry, async_add_entities),
+        f"{DOMAIN} number controls {plant_id}",
+    )
+    return True
 
-    else:
-        _LOGGER.debug(f"No controls found for Plant ID {plant_id}")
 
-    return True
+async def _async_add_controls(service: InverterService, config_entry: ConfigEntry, async_add_entities) -> None:
+    """Add the entities once discovery completed, revalidation can add or remove them later"""
+    name = config_entry.data["name"]
+
+    def create_entity(inverter_sn, cid, index, description, button, initial_value):
+        return SolisNumberEntity(service, name, inverter_sn, cid, description, index, button, initial_value)
+
+    await async_add_control_entities(service, "number", create_entity, async_add_entities)
 
 
 class SolisNumberEntity(SolisBaseControlEntity, ServiceSubscriber, NumberEntity):
@@ -131,6 +107,7 @@ class SolisNumberEntity(SolisBaseControlEntity, ServiceSubscriber, NumberEntity)
         self._attr_native_value = value
         self._attributes[LAST_UPDATED] = datetime.now()
         self.async_write_ha_state()
+        self.state_changed_locally()
         if not self._button:
             # Convert watts to hectowatts for API
             api_value = value
@@ -0,0 +1,91 @@
+"""Dedicated http sessions per portal domain
+Home Assistant's shared session pools connections for every integration. A
+dedicated session keeps its own connection pool, keep-alive and DNS cache for
+the portal host and is shared by all config entries using the same domain.
+Reusing kept-alive connections is what saves the TLS handshakes: aiohttp does
+not resume TLS sessions on new connections.
+
+For more information: https://github.com/hultenvp/solis-sensor/
+"""
+
+from __future__ import annotations
+
+import logging
+
+from aiohttp import ClientSession, TCPConnector
+from homeassistant.const import EVENT_HOMEASSISTANT_CLOSE
+from homeassistant.core import Event, HomeAssistant, callback
+from homeassistant.util.ssl import client_context
+
+from .const import DOMAIN
+
+_LOGGER = logging.getLogger(__name__)
+
+DATA_SESSIONS = f"{DOMAIN}_sessions"
+
+
+class _PortalSession:
+    """Session with the number of config entries using it"""
+
+    def __init__(self, session: ClientSession) -> None:
+        self.session: ClientSession = session
+        self.users: int = 0
+        self.unsub_close = None
+
+
+@callback
+def async_acquire_session(
+    hass: HomeAssistant,
+    domain: str,
+    pool_size: int,
+    keepalive_timeout: float,
+    dns_cache_ttl: int,
+) -> ClientSession:
+    """
+    Return the dedicated session for domain, the first config entry creates it
+    with its pool settings.
+    """
+    sessions: dict[str, _PortalSession] = hass.data.setdefault(DATA_SESSIONS, {})
+    portal = sessions.get(domain)
+    if portal is None:
+        _LOGGER.debug(
+            "Creating session for %s, pool size %d, keep-alive %ss, DNS cache %ss",
+            domain,
+            pool_size,
+            keepalive_timeout,
+            dns_cache_ttl,
+        )
+        connector = TCPConnector(
+            limit=pool_size,
+            keepalive_timeout=keepalive_timeout,
+            ttl_dns_cache=dns_cache_ttl,
+            # Same TLS settings as Home Assistant's shared session
+            ssl=client_context(),
+        )
+        portal = _PortalSession(ClientSession(connector=connector))
+
+        async def _async_close(_: Event) -> None:
+            # The listener removed itself
+            portal.unsub_close = None
+            await portal.session.close()
+
+        portal.unsub_close = hass.bus.async_listen_once(EVENT_HOMEASSISTANT_CLOSE, _async_close)
+        sessions[domain] = portal
+    portal.users += 1
+    return portal.session
+
+
+async def async_release_session(hass: HomeAssistant, domain: str) -> None:
+    """Close the session for domain once the last config entry using it is unloaded"""
+    sessions: dict[str, _PortalSession] = hass.data.get(DATA_SESSIONS, {})
+    portal = sessions.get(domain)
+    if portal is None:
+        return
+    portal.users -= 1
+    if portal.users <= 0:
+        _LOGGER.debug("Closing session for %s", domain)
+        del sessions[domain]
+        if portal.unsub_close is not None:
+            portal.unsub_close()
+            portal.unsub_close = None
+        await portal.session.close()
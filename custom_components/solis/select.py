@@ -1,4 +1,3 @@
-import asyncio
 import logging
 from datetime import datetime
 
@@ -8,11 +7,9 @@ from homeassistant.core import HomeAssistant
 
 from .const import DOMAIN, LAST_UPDATED
 from .control_const import (
-    ALL_CONTROLS,
-    RETRIES,
-    RETRY_WAIT,
     SolisBaseControlEntity,
     SolisSelectEntityDescription,
+    async_add_control_entities,
 )
 from .service import InverterService, ServiceSubscriber
 
@@ -27,42 +24,23 @@ async def async_setup_entry(hass: HomeAssistant, config_entry: ConfigEntry, asyn
     service = hass.data[DOMAIN][config_entry.entry_id]
 
     _LOGGER.info(f"Waiting for discovery of controls for plant {plant_id}")
-    await asyncio.sleep(RETRY_WAIT)
-    attempts = 0
-    while (attempts < RETRIES) and (not service.has_controls):
-        _LOGGER.debug(f"    Attempt {attempts} failed")
-        await asyncio.sleep(RETRY_WAIT)
-        attempts += 1
-
-    _LOGGER.debug(f"    Attempt {attempts} succeeded")
+    # Don't block the setup, entities are added as soon as discovery completes
+    config_entry.async_create_background_task(
+        hass,
+        _async_add_controls(service, config_entry, async_add_entities),
+        f"{DOMAIN} select controls {plant_id}",
+    )
+    return True
 
-    if service.has_controls:
-        entities = []
-        _LOGGER.debug(f"Plant ID {plant_id} has controls:")
-        for inverter_sn in service.controls:
-            for cid, index, entity, button, initial_value in service.controls[inverter_sn]["select"]:
-                entities.append(
-                    SolisSelectEntity(
-                        service,
-                        config_entry.data["name"],
-                        inverter_sn,
-                        cid,
-                        entity,
-                        index,
-                        initial_value,
-                    )
-                )
 
-        if len(entities) > 0:
-            _LOGGER.debug(f"Creating {len(entities)} sensor entities")
-            async_add_entities(entities)
-        else:
-            _LOGGER.debug(f"No select controls found for Plant ID {plant_id}")
+async def _async_add_controls(service: InverterService, config_entry: ConfigEntry, async_add_entities) -> None:
+    """Add the entities once discovery completed, revalidation can add or remove them later"""
+    name = config_entry.data["name"]
 
-    else:
-        _LOGGER.debug(f"No controls found for Plant ID {plant_id}")
+    def create_entity(inverter_sn, cid, index, description, button, initial_value):
+        return SolisSelectEntity(service, name, inverter_sn, cid, description, index, initial_value)
 
-    return True
+    await async_add_control_entities(service, "select", create_entity, async_add_entities)
 
 
 class SolisSelectEntity(SolisBaseControlEntity, ServiceSubscriber, SelectEntity):
@@ -109,6 +87,7 @@ class SolisSelectEntity(SolisBaseControlEntity, ServiceSubscriber, SelectEntity)
         self._attr_current_option = self._option_dict.get(option, self._attr_current_option)
         self._attributes[LAST_UPDATED] = datetime.now()
         self.async_write_ha_state()
+        self.state_changed_locally()
         value = self._reverse_dict.get(option, None)
         if value is not None:
             await self.write_control_data(str(value))
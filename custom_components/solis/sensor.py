@@ -47,6 +47,9 @@ LAST_UPDATED = "Last updated"
 SERIAL = "Inverter serial"
 API_NAME = "API Name"
 
+# Give Home Assistant time to add the entities before publishing
+FIRST_UPDATE_DELAY = timedelta(seconds=5)
+
 EMPTY_ATTR: dict[str, Any] = {
     LAST_UPDATED: None,
     SERIAL: None,
@@ -153,8 +156,8 @@ def on_discovered(capabilities, cookie):
     # Create the sensors
     hass_sensors = create_sensors(discovered_sensors, cookie["service"], cookie["name"])
     cookie["async_add_entities"](hass_sensors)
-    # schedule the first update in 1 minute from now:
-    cookie["service"].schedule_update(timedelta(minutes=1))
+    # schedule the first update shortly, it publishes the data fetched at login
+    cookie["service"].schedule_update(FIRST_UPDATE_DELAY)
 
 
 class SolisSensor(ServiceSubscriber, SensorEntity):
@@ -6,18 +6,22 @@ For more information: https://github.com/hultenvp/solis-sensor/
 
 from __future__ import annotations
 
+import asyncio
 import logging
 import time
 from abc import ABC, abstractmethod
 from datetime import datetime, timedelta
-from typing import Any, final
+from typing import Any, AsyncIterator, Awaitable, Callable, final
 
+from aiohttp import ClientSession
 from homeassistant.core import HomeAssistant
 from homeassistant.helpers.aiohttp_client import async_get_clientsession
 from homeassistant.helpers.event import async_track_point_in_utc_time
+from homeassistant.helpers.storage import Store
 from homeassistant.util import dt as dt_util
 
-from .control_const import ALL_CONTROLS, CONTROL_TYPES
+from .const import DOMAIN
+from .control_const import CONTROL_TYPES, control_catalog
 from .ginlong_base import BaseAPI, GinlongData, PortalConfig
 from .soliscloud_const import (
     INVERTER_ACPOWER,
@@ -33,17 +37,21 @@ _LOGGER = logging.getLogger(__name__)
 # VERSION
 VERSION = "1.0.3"
 
-# Don't login every time
-HRS_BETWEEN_LOGIN = timedelta(hours=2)
-
 # Autodiscover
 RETRY_DELAY_SECONDS = 60
 MAX_RETRY_DELAY_SECONDS = 900
 
+# Discovery cache
+STORAGE_VERSION = 1
+STORAGE_KEY = f"{DOMAIN}.discovery"
+
 # Status constants
 ONLINE = "Online"
 OFFLINE = "Offline"
 
+# Attribute missing from a measurement, None can be a valid value
+_MISSING = object()
+
 
 class ServiceSubscriber(ABC):
     """Subscriber base class."""
@@ -77,20 +85,45 @@ class InverterService:
     """Serves all plantId's and inverters on a Ginlong account"""
 
     def __init__(
-        self, portal_config: PortalConfig, hass: HomeAssistant, refresh_ok: int = 300, refresh_nok: int = 60
+        self,
+        portal_config: PortalConfig,
+        hass: HomeAssistant,
+        refresh_ok: int = 300,
+        refresh_nok: int = 60,
+        max_concurrency: int = 1,
+        bulk_polling: bool = False,
+        session: ClientSession | None = None,
     ) -> None:
         self._schedule_ok: int = refresh_ok
         self._schedule_nok: int = refresh_nok
+        self._max_concurrency: int = max(1, max_concurrency)
+        self._bulk_polling: bool = bulk_polling
+        # Dedicated session for the portal domain, Home Assistant's shared one if None
+        self._session: ClientSession | None = session
         self._last_updated: datetime | None = None
         self._logintime: datetime | None = None
         self._subscriptions: dict[str, dict[str, ServiceSubscriber]] = {}
+        # Subscribed attributes per inverter in dispatch order, state first
+        self._dispatch_order: dict[str, list[str]] = {}
+        # Last value published per inverter and attribute
+        self._published: dict[str, dict[str, Any]] = {}
         self._hass: HomeAssistant = hass
         self._discovery_callback = None
         self._discovery_cookie: dict[str, Any] = {}
-        self._discovery_complete: bool = False
+        # Set once entities can be created, from cache or from the portal
+        self._discovery_complete = asyncio.Event()
         self._retry_delay_seconds = 0
         self._controllable: bool = False
         self._controls: dict[str, dict[str, list[tuple]]] = {}
+        # Capabilities entities were created for, None until first discovery
+        self._discovered: dict[str, list[str]] | None = None
+        self._unsub_update = None
+        self._login_lock = asyncio.Lock()
+        self._store: Store | None = None
+        # Called with the added and removed controls when revalidation changes them
+        self._control_listeners: list[Callable[[dict, dict], Awaitable[None]]] = []
+        if hass is not None:
+            self._store = Store(hass, STORAGE_VERSION, f"{STORAGE_KEY}.{portal_config.plant_id}")
         # self._active_times: dict[str, dict] = {}
         if isinstance(portal_config, SoliscloudConfig):
             self._api = SoliscloudAPI(portal_config)
@@ -124,7 +157,11 @@ class InverterService:
 
     @property
     def discovery_complete(self) -> bool:
-        return self._discovery_complete
+        return self._discovery_complete.is_set()
+
+    async def async_wait_for_discovery(self) -> None:
+        """Wait until discovery completed"""
+        await self._discovery_complete.wait()
 
     # def set_active_times(self, inverter_sn, cid, index, times: tuple):
     #     if inverter_sn not in self._active_times:
@@ -136,11 +173,13 @@ class InverterService:
     #     self._active_times[inverter_sn][cid][id]= times
 
     async def _login(self) -> bool:
-        if not self._api.is_online:
-            if await self._api.login(async_get_clientsession(self._hass)):
-                self._logintime = datetime.now()
-                if isinstance(self._api, SoliscloudAPI):
-                    self._controllable = self._api._token != ""
+        # Discovery and the first update can ask at the same time, login once
+        async with self._login_lock:
+            if not self._api.is_online:
+                if await self._api.login(self._session or async_get_clientsession(self._hass)):
+                    self._logintime = datetime.now()
+                    if isinstance(self._api, SoliscloudAPI):
+                        self._controllable = self._api._token != ""
         return self._api.is_online
 
     async def _logout(self) -> None:
@@ -148,7 +187,13 @@ class InverterService:
         self._logintime = None
 
     async def async_discover(self, *_) -> None:
-        """Try to discover and retry if needed."""
+        """
+        Create entities from the discovery cache first, then (re)validate
+        against the portal and retry if needed.
+        """
+        if self._discovered is None:
+            await self._async_restore_discovery()
+
         capabilities: dict[str, list[str]] = {}
         capabilities = await self._do_discover()
 
@@ -157,10 +202,16 @@ class InverterService:
                 inverter_serials = list(capabilities.keys())
                 await self._discover_controls(inverter_serials)
 
-            if self._discovery_callback and self._discovery_cookie:
-                self._discovery_callback(capabilities, self._discovery_cookie)
+            if self._discovered is None:
+                added = capabilities
+            else:
+                added = self._added_capabilities(capabilities)
+            if added and self._discovery_callback and self._discovery_cookie:
+                self._discovery_callback(added, self._discovery_cookie)
+            self._discovered = capabilities
+            await self._async_save_discovery()
             self._retry_delay_seconds = 0
-            self._dicovery_complete = True
+            self._discovery_complete.set()
         else:
             self._retry_delay_seconds = min(MAX_RETRY_DELAY_SECONDS, self._retry_delay_seconds + RETRY_DELAY_SECONDS)
             _LOGGER.warning(
@@ -174,28 +225,118 @@ class InverterService:
                 self._retry_delay_seconds,
             )
 
+    def _added_capabilities(self, capabilities: dict[str, list[str]]) -> dict[str, list[str]]:
+        """Return what was discovered on top of the entities that already exist"""
+        added: dict[str, list[str]] = {}
+        for inverter_sn, attributes in capabilities.items():
+            known = self._discovered.get(inverter_sn, [])
+            new_attributes = [attribute for attribute in attributes if attribute not in known]
+            if new_attributes:
+                added[inverter_sn] = new_attributes
+        for inverter_sn in self._discovered:
+            if inverter_sn not in capabilities:
+                _LOGGER.info(f"Inverter SN {inverter_sn} is no longer found on the portal")
+        if added:
+            _LOGGER.info(f"Discovered new capabilities since last start: {added}")
+        return added
+
+    async def _async_restore_discovery(self) -> None:
+        """Create entities from the previous discovery, the portal is validated afterwards"""
+        if self._store is None:
+            return
+        cached = await self._store.async_load()
+        if not cached or not cached.get("capabilities"):
+            return
+        _LOGGER.debug("Restoring discovery from cache")
+        self._controllable = cached.get("controllable", False)
+        if self._controllable:
+            self._controls = {
+                inverter_sn: self._build_controls(
+                    inverter_sn, hmi_flag, cached.get("controls", {}).get(inverter_sn, {})
+                )
+                for inverter_sn, hmi_flag in cached.get("hmi_fb00", {}).items()
+            }
+        self._discovered = cached["capabilities"]
+        if self._discovery_callback and self._discovery_cookie:
+            self._discovery_callback(self._discovered, self._discovery_cookie)
+        self._discovery_complete.set()
+
+    async def _async_save_discovery(self) -> None:
+        if self._store is None:
+            return
+        hmi_fb00 = {inverter_sn: self._api.hmi_fb00(inverter_sn) for inverter_sn in self._controls}
+        controls = {
+            inverter_sn: {
+                cid: initial_value
+                for platform in self._controls[inverter_sn]
+                for cid, _, _, _, initial_value in self._controls[inverter_sn][platform]
+            }
+            for inverter_sn in self._controls
+        }
+        await self._store.async_save(
+            {
+                "capabilities": {
+                    inverter_sn: list(attributes) for inverter_sn, attributes in self._discovered.items()
+                },
+                "controllable": self._controllable,
+                "hmi_fb00": hmi_fb00,
+                "controls": controls,
+            }
+        )
+
     async def _discover_controls(self, inverter_serials: list[str]):
         _LOGGER.debug(f"Starting controls discovery")
         controls = {}
-        control_lookup = {CONTROL_TYPES[platform]: platform for platform in CONTROL_TYPES}
         for inverter_sn in inverter_serials:
-            controls[inverter_sn] = {platform: [] for platform in CONTROL_TYPES}
             hmi_flag = self._api.hmi_fb00(inverter_sn)
             _LOGGER.debug(f"Inverter SN {inverter_sn} HMI status {hmi_flag}")
-            control_desciptions = ALL_CONTROLS[hmi_flag]
-            for cid in control_desciptions:
-                button = len(control_desciptions[cid]) > 1
-                initial_value = await self._api.get_control_data(inverter_sn, cid)
-                initial_value = initial_value.get(cid, None)
-                for index, entity_description in enumerate(control_desciptions[cid]):
-                    entity_type = control_lookup[type(entity_description)]
-                    controls[inverter_sn][entity_type].append((cid, index, entity_description, button, initial_value))
-                    _LOGGER.debug(
-                        f"Adding {entity_type:s} entity {entity_description.name:s} for inverter Sn {inverter_sn:s} cid {cid:s} with index {index:d}"
-                    )
-
+            if hmi_flag is None:
+                continue
+            # Initial values for all cids of the inverter in one go, the first poll reuses them
+            initial_values = await self._api.get_cached_control_data(inverter_sn)
+            controls[inverter_sn] = self._build_controls(inverter_sn, hmi_flag, initial_values)
+
+        added = self._changed_controls(controls, self._controls)
+        removed = self._changed_controls(self._controls, controls)
         self._controls = controls
         _LOGGER.debug(f"Controls discovery complete")
+        if added or removed:
+            _LOGGER.info(f"Controls changed since last start for inverters: {sorted(set(added) | set(removed))}")
+            for listener in self._control_listeners:
+                await listener(added, removed)
+
+    @staticmethod
+    def _changed_controls(
+        controls: dict[str, dict[str, list[tuple]]], others: dict[str, dict[str, list[tuple]]]
+    ) -> dict[str, dict[str, list[tuple]]]:
+        """Return the controls per inverter and platform that are not in others"""
+        changed: dict[str, dict[str, list[tuple]]] = {}
+        for inverter_sn, platforms in controls.items():
+            known = {(entry[0], entry[2].key) for entries in others.get(inverter_sn, {}).values() for entry in entries}
+            missing = {
+                platform: [entry for entry in entries if (entry[0], entry[2].key) not in known]
+                for platform, entries in platforms.items()
+            }
+            if any(missing.values()):
+                changed[inverter_sn] = missing
+        return changed
+
+    def subscribe_controls(self, listener: Callable[[dict, dict], Awaitable[None]]) -> None:
+        """Have listener(added, removed) called when revalidating discovery changes the controls."""
+        self._control_listeners.append(listener)
+
+    def _build_controls(
+        self, inverter_sn: str, hmi_flag: bool, initial_values: dict[str, Any]
+    ) -> dict[str, list[tuple]]:
+        """Map the control catalog of the HMI version on entity descriptions per platform"""
+        controls: dict[str, list[tuple]] = {platform: [] for platform in CONTROL_TYPES}
+        for entity_type, entries in control_catalog().platforms[hmi_flag].items():
+            for cid, index, entity_description, button in entries:
+                controls[entity_type].append((cid, index, entity_description, button, initial_values.get(cid, None)))
+                _LOGGER.debug(
+                    f"Adding {entity_type:s} entity {entity_description.name:s} for inverter Sn {inverter_sn:s} cid {cid:s} with index {index:d}"
+                )
+        return controls
 
     async def _do_discover(self) -> dict[str, list[str]]:
         """Discover for all inverters the attributes it supports"""
@@ -205,8 +346,12 @@ class InverterService:
             inverters = self._api.inverters
             if inverters is None:
                 return capabilities
+            login_data = self._api.login_data if isinstance(self._api, SoliscloudAPI) else {}
             for inverter_serial in inverters:
-                data = await self._api.fetch_inverter_data(inverter_serial, controls=False)
+                # Login just fetched the same data
+                data = login_data.get(inverter_serial)
+                if data is None:
+                    data = await self._api.fetch_inverter_data(inverter_serial, controls=False)
                 if data is not None:
                     capabilities[inverter_serial] = data.keys()
         return capabilities
@@ -221,69 +366,146 @@ class InverterService:
         # Multiple controls can be subscribed to one attribute so make this a list
         if attribute not in self._subscriptions[serial]:
             self._subscriptions[serial][attribute] = [subscriber]
+            # State goes first to avoid race conditions for the energy today fix
+            order = self._dispatch_order.setdefault(serial, [])
+            if attribute == INVERTER_STATE:
+                order.insert(0, attribute)
+            else:
+                order.append(attribute)
         else:
             self._subscriptions[serial][attribute].append(subscriber)
+        # The new subscriber has not seen the current value yet
+        self.forget_published(serial, attribute)
+
+    def unsubscribe(self, subscriber: ServiceSubscriber, serial: str, attribute: str) -> None:
+        """Stop passing changes in 'attribute' from inverter 'serial' to subscriber."""
+        subscribers = self._subscriptions.get(serial, {}).get(attribute, [])
+        if subscriber in subscribers:
+            subscribers.remove(subscriber)
+
+    def forget_published(self, serial: str, attribute: str) -> None:
+        """A subscriber changed its own state, have the next update publish attribute again."""
+        self._published.get(serial, {}).pop(attribute, None)
+
+    def _publish(self, serial: str, attribute: str, value: Any, last_updated: datetime) -> None:
+        """Pass value to all subscribers of attribute and remember it once they all took it."""
+        subscribers = self._subscriptions[serial][attribute]
+        for subscriber in subscribers:
+            subscriber.data_updated(value, last_updated)
+        # Entities not yet added to Home Assistant ignore updates, keep offering the value
+        if all(getattr(subscriber, "hass", None) is not None for subscriber in subscribers):
+            self._published.setdefault(serial, {})[attribute] = value
 
     async def update_devices(self, data: GinlongData) -> None:
-        """Update all registered sensors."""
-        try:
-            serial = getattr(data, INVERTER_SERIAL)
-        except AttributeError:
-            return
+        """Update the subscribers of all attributes that changed since last published."""
+        serial = data.get(INVERTER_SERIAL)
         if serial not in self._subscriptions:
             return
-        for attribute in data.keys():
-            if attribute in self._subscriptions[serial]:
-                value = getattr(data, attribute)
-
-                if attribute == INVERTER_ACPOWER and getattr(data, INVERTER_STATE) == 2:
-                    # Overriding stale AC Power value when inverter is offline
-                    value = 0
-                elif attribute == INVERTER_ENERGY_TODAY:
-                    # Energy_today is not reset at midnight, but in the
-                    # morning at sunrise when the inverter switches back on. This
-                    # messes up the energy dashboard. Return 0 while inverter is
-                    # still off.
-                    is_am = datetime.now().hour < 12
-                    if getattr(data, INVERTER_STATE) == 2:
+        published = self._published.get(serial, {})
+        state = data.get(INVERTER_STATE)
+        for attribute in self._dispatch_order[serial]:
+            value = data.get(attribute, _MISSING)
+            if value is _MISSING:
+                continue
+            if attribute == INVERTER_ACPOWER and state == 2:
+                # Overriding stale AC Power value when inverter is offline
+                value = 0
+            elif attribute == INVERTER_ENERGY_TODAY:
+                # Energy_today is not reset at midnight, but in the
+                # morning at sunrise when the inverter switches back on. This
+                # messes up the energy dashboard. Return 0 while inverter is
+                # still off.
+                is_am = datetime.now().hour < 12
+                if state == 2:
+                    if is_am:
+                        value = 0
+                    else:
+                        continue
+                elif state == 1:
+                    last_updated_state = None
+                    try:
+                        last_updated_state = self._subscriptions[serial][INVERTER_STATE][0].measured
+                    except KeyError:
+                        pass
+                    if last_updated_state is not None:
                         if is_am:
-                            value = 0
+                            # Hybrid systems do not reset in the morning, but just after midnight.
+                            if last_updated_state.hour == 0 and last_updated_state.minute < 15:
+                                value = 0
+                            # Avoid race conditions when between state change in the morning and
+                            # energy today being reset by adding 5 min grace period and
+                            # skipping update
+                            elif last_updated_state + timedelta(minutes=5) > datetime.now():
+                                continue
                         else:
-                            continue
-                    elif getattr(data, INVERTER_STATE) == 1:
-                        last_updated_state = None
-                        try:
-                            last_updated_state = self._subscriptions[serial][INVERTER_STATE][0].measured
-                        except KeyError:
-                            pass
-                        if last_updated_state is not None:
-                            if is_am:
-                                # Hybrid systems do not reset in the morning, but just after midnight.
-                                if last_updated_state.hour == 0 and last_updated_state.minute < 15:
-                                    value = 0
-                                # Avoid race conditions when between state change in the morning and
-                                # energy today being reset by adding 5 min grace period and
-                                # skipping update
-                                elif last_updated_state + timedelta(minutes=5) > datetime.now():
-                                    continue
-                            else:
-                                if value == 0:
-                                    # SC sometimes produces zeros in the evening, ignore
-                                    continue
-                for subscriber in self._subscriptions[serial][attribute]:
-                    subscriber.data_updated(value, self.last_updated)
+                            if value == 0:
+                                # SC sometimes produces zeros in the evening, ignore
+                                continue
+            if published.get(attribute, _MISSING) != value:
+                self._publish(serial, attribute, value, self.last_updated)
+
+    async def write_control_data(self, inverter_serial: str, cid: str, value: str) -> bool:
+        """
+        Write a control value and publish the value read back to all subscribers of cid,
+        when not confirmed this reverts their optimistic state to the value on the inverter.
+        """
+        confirmed = await self._api.write_control_data(inverter_serial, cid, value)
+        # Subscribers may show an optimistic value, whatever the outcome
+        self.forget_published(inverter_serial, str(cid))
+        read_back = self._api.control_value(inverter_serial, str(cid))
+        if read_back is not None and str(cid) in self._subscriptions.get(inverter_serial, {}):
+            _LOGGER.debug(f"Publishing read back value {read_back} for cid {cid} of inverter {inverter_serial}")
+            self._publish(inverter_serial, str(cid), read_back, datetime.now())
+        return confirmed
+
+    async def _fetch_inverter_data(
+        self, semaphore: asyncio.Semaphore, inverter_serial: str
+    ) -> tuple[str, GinlongData | None]:
+        """Fetch data for one inverter, limited by the number of concurrent polls."""
+        async with semaphore:
+            return inverter_serial, await self._api.fetch_inverter_data(inverter_serial, skip_unchanged=True)
+
+    async def _poll_inverters(self, inverter_serials: list[str]) -> AsyncIterator[tuple[str, GinlongData | None]]:
+        """Yield (serial, data) per inverter as soon as it is available, data is None if polling failed."""
+        # Data fetched during login is published first, no need to poll it again
+        login_data = self._api.take_login_data()
+        for inverter_serial in [serial for serial in inverter_serials if serial in login_data]:
+            inverter_serials.remove(inverter_serial)
+            yield inverter_serial, login_data[inverter_serial]
+        if not inverter_serials:
+            return
+        if self._bulk_polling:
+            # One call per 100 inverters instead of one call per inverter
+            all_data = await self._api.fetch_all_inverter_data(skip_unchanged=True)
+            for inverter_serial in inverter_serials:
+                yield inverter_serial, all_data.get(inverter_serial)
+        else:
+            # Poll up to max_concurrency inverters in parallel, so a cycle takes about
+            # as long as the slowest inverter instead of the sum of all of them.
+            semaphore = asyncio.Semaphore(self._max_concurrency)
+            polls = [self._fetch_inverter_data(semaphore, inverter_serial) for inverter_serial in inverter_serials]
+            for poll in asyncio.as_completed(polls):
+                yield await poll
 
     async def async_update(self, *_) -> None:
         """Update the data from Ginlong portal."""
         update = timedelta(seconds=self._schedule_nok)
-        # Login using username and password, but only every HRS_BETWEEN_LOGIN hours
+        if not self._api.available:
+            # Portal is unhealthy, wait for the circuit breaker to allow a probe
+            self.schedule_update(update)
+            return
+        # Login using username and password, the session is kept until the portal rejects it
         if await self._login():
             inverters = self._api.inverters
             if inverters is None:
                 return
-            for inverter_serial in inverters:
-                data = await self._api.fetch_inverter_data(inverter_serial)
-
+            if not await self._api.probe():
+                # Still unhealthy, polling would only be refused
+                self.schedule_update(update)
+                return
+            await self._api.reload_config()
+            failed: list[str] = []
+            async for inverter_serial, data in self._poll_inverters(list(inverters)):
                 if data is not None:
                     # And finally get the inverter details
                     # default to updating after SCHEDULE_OK seconds;
@@ -296,25 +518,31 @@ class InverterService:
                             update = nxt - dt_util.utcnow()
                     except AttributeError:
                         pass  # no last_update found, so keep just using SCHEDULE_OK as a safe default
+                    if data.unchanged:
+                        # Nothing new since the last upload of the data logger
+                        continue
                     self._last_updated = datetime.now()
                     await self.update_devices(data)
                 else:
-                    update = timedelta(seconds=self._schedule_nok)
-                    # Reset session and try to login again next time
-                    await self._logout()
-
-        self.schedule_update(update)
+                    failed.append(inverter_serial)
 
-        if self._logintime is not None:
-            if (self._logintime + HRS_BETWEEN_LOGIN) < (datetime.now()):
-                # Time to login again
+            if failed:
+                update = timedelta(seconds=self._schedule_nok)
+            # Rejected control reads can require a new session while all inverters polled fine
+            if self._api.requires_relogin(failed) and not await self._api.refresh_session():
+                # Reset session and try to login again next time
                 await self._logout()
 
+        self.schedule_update(update)
+
     def schedule_update(self, td: timedelta) -> None:
         """Schedule an update after td time."""
         nxt = dt_util.utcnow() + td
         _LOGGER.debug("Scheduling next update in %s, at %s", str(td), nxt)
-        async_track_point_in_utc_time(self._hass, self.async_update, nxt)
+        # Only one update pending at a time, discovery can ask for an update more than once
+        if self._unsub_update is not None:
+            self._unsub_update()
+        self._unsub_update = async_track_point_in_utc_time(self._hass, self.async_update, nxt)
 
     def schedule_discovery(self, callback, cookie: dict[str, Any], seconds: int = 1):
         """Schedule a discovery after seconds seconds."""
@@ -326,6 +554,9 @@ class InverterService:
 
     async def shutdown(self):
         """Shutdown the service"""
+        if self._unsub_update is not None:
+            self._unsub_update()
+            self._unsub_update = None
         await self._logout()
 
     @property
@@ -16,15 +16,26 @@ import hmac
 import json
 import logging
 import math
-from datetime import datetime, timezone
+import os
+import time
+from datetime import date, datetime, timezone
+from functools import partial
 from http import HTTPStatus
-from typing import Any
+from typing import Any, Callable
 
-import aiofiles
 import async_timeout
 import yaml
-from aiohttp import ClientError, ClientSession
-
+from aiohttp import ClientError, ClientResponse, ClientSession
+
+from .api_utils import (
+    BREAKER_CLOSED,
+    JSON_DECODER_AUTO,
+    AdaptiveRateLimiter,
+    CircuitBreaker,
+    RetryPolicy,
+    SingleFlight,
+    json_decoder,
+)
 from .ginlong_base import BaseAPI, GinlongData, PortalConfig
 from .soliscloud_const import *
 
@@ -41,9 +52,42 @@ SUCCESS = "Success"
 CONTENT = "Content"
 STATUS_CODE = "StatusCode"
 MESSAGE = "Message"
+FAILURE = "Failure"
+
+# Failure classes, only transient failures are retried
+FAILURE_TRANSIENT = "transient"  # Timeouts, connection errors, 5xx and 429
+FAILURE_CLOCK_SKEW = "clock_skew"  # 408, the Date header is off
+FAILURE_AUTH = "auth"  # 401/403 or no session
+FAILURE_REQUEST = "request"  # Other 4xx
+FAILURE_API = "api"  # Portal responded with an error code
+FAILURE_CIRCUIT_OPEN = "circuit_open"  # Not sent, portal is unhealthy
+
+# Switch on/off SolisCloud workarounds
+WORKAROUNDS_FILE = os.path.join(os.path.dirname(__file__), "workarounds.yaml")
 
 CONTROL_DELAY = 0.1
-CONTROL_RETRIES = 3
+# Written values are polled back until confirmed or the deadline passes
+CONTROL_CONFIRM_TIMEOUT = 20  # seconds
+CONTROL_CONFIRM_MAX_DELAY = 4  # seconds
+
+# Control values are read far less often than telemetry
+DEFAULT_REFRESH_CONTROL = 900  # seconds
+# Retry delay after a refresh in which no control could be read, capped at refresh_control
+CONTROL_REFRESH_RETRY = 300  # seconds
+
+# Maximum number of control reads in flight
+DEFAULT_CONTROL_CONCURRENCY = 4
+
+# SolisCloud limits every interface to 2 calls per second
+DEFAULT_REQUESTS_PER_SECOND = 2.0
+# HTTP status codes SolisCloud answers with when it is overloaded
+RATE_LIMITED = (HTTPStatus.TOO_MANY_REQUESTS, HTTPStatus.BAD_GATEWAY)
+
+# Maximum number of records per page for the bulk endpoints
+BULK_PAGE_SIZE = 100
+
+# Station details are the same for all inverters of a plant, reuse them within a cycle
+STATION_DETAIL_MAX_AGE = 30  # seconds
 
 # VALUE_RECORD = '_from_record'
 # VALUE_ELEMENT = ''
@@ -51,13 +95,18 @@ CONTROL_RETRIES = 3
 VERB = "POST"
 
 INVERTER_DETAIL = "/v1/api/inverterDetail"
+INVERTER_DETAIL_LIST = "/v1/api/inverterDetailList"
 PLANT_DETAIL = "/v1/api/stationDetail"
 PLANT_LIST = "/v1/api/userStationList"
 AUTHENTICATE = "/v2/api/login"
 CONTROL = "/v2/api/control"
 AT_READ = "/v2/api/atRead"
+INVERTER_LIST = "/v1/api/inverterList"
 
-from .control_const import ALL_CONTROLS
+# Read-only endpoints, identical requests in flight share one response
+COALESCED = (INVERTER_LIST, INVERTER_DETAIL, INVERTER_DETAIL_LIST, PLANT_DETAIL, AT_READ)
+
+from .control_const import control_catalog
 
 InverterDataType = dict[str, dict[str, list]]
 
@@ -253,6 +302,80 @@ INVERTER_DATA: InverterDataType = {
     },
 }
 
+# Raw key holding the time the data logger uploaded the record
+DATA_TIMESTAMP = INVERTER_DATA[INVERTER_DETAIL][INVERTER_TIMESTAMP_UPDATE][0]
+
+"""((attribute, payload key, converter), ...)"""
+ExtractionPlan = tuple[tuple[str, str, Callable[[Any], str | int | float]], ...]
+
+
+def _to_int(data_raw: Any) -> int:
+    return int(float(data_raw))
+
+
+def _to_float(precision: int) -> Callable[[Any], float]:
+    def convert(data_raw: Any) -> float:
+        return round(float(data_raw), precision)
+
+    return convert
+
+
+def _compile_plan(attributes: dict[str, list], skip: tuple[str, ...] = ()) -> ExtractionPlan:
+    """Compile an INVERTER_DATA mapping into a flat list of extraction steps"""
+    plan = []
+    for dictkey, (key, type_, precision) in attributes.items():
+        if key is None or dictkey in skip:
+            continue
+        if type_ is int:
+            converter = _to_int
+        elif type_ is float:
+            converter = _to_float(precision)
+        else:
+            converter = type_
+        plan.append((dictkey, key, converter))
+    return tuple(plan)
+
+
+def _classify_status(status: int) -> str | None:
+    """Map a http status code on a failure class"""
+    if status == HTTPStatus.OK:
+        return None
+    if status in RATE_LIMITED or status >= HTTPStatus.INTERNAL_SERVER_ERROR:
+        return FAILURE_TRANSIENT
+    if status == HTTPStatus.REQUEST_TIMEOUT:
+        return FAILURE_CLOCK_SKEW
+    if status in (HTTPStatus.UNAUTHORIZED, HTTPStatus.FORBIDDEN):
+        return FAILURE_AUTH
+    return FAILURE_REQUEST
+
+
+def _same_control_value(read_back: str, written: str) -> bool:
+    """Compare control values per comma separated part, numbers by value ("50" == "50.0", "05" == "5")"""
+    read_parts = str(read_back).split(",")
+    written_parts = str(written).split(",")
+    if len(read_parts) != len(written_parts):
+        return False
+    for read_part, written_part in zip(read_parts, written_parts):
+        try:
+            if not math.isclose(float(read_part), float(written_part)):
+                return False
+        except ValueError:
+            if read_part.strip() != written_part.strip():
+                return False
+    return True
+
+
+def _read_workarounds(path: str, mtime: float | None) -> tuple[float | None, dict[str, Any]] | None:
+    """Parse the workarounds file, None if it did not change since mtime"""
+    try:
+        new_mtime = os.path.getmtime(path)
+    except OSError:
+        return None if mtime is None else (None, {})
+    if new_mtime == mtime:
+        return None
+    with open(path, encoding="utf-8") as file:
+        return new_mtime, yaml.safe_load(file) or {}
+
 
 class SoliscloudConfig(PortalConfig):
     """Portal configuration data"""
@@ -265,6 +388,10 @@ class SoliscloudConfig(PortalConfig):
         portal_secret: bytes,
         portal_plantid: str,
         portal_password: str,
+        requests_per_second: float = DEFAULT_REQUESTS_PER_SECOND,
+        control_concurrency: int = DEFAULT_CONTROL_CONCURRENCY,
+        refresh_control: int = DEFAULT_REFRESH_CONTROL,
+        json_decoder: str = JSON_DECODER_AUTO,
     ) -> None:
         super().__init__(
             portal_domain,
@@ -273,17 +400,42 @@ class SoliscloudConfig(PortalConfig):
         )
         self._key_id: str = portal_key_id
         self._secret: bytes = portal_secret
+        # Keyed once, copied for every signature
+        self._signer = hmac.new(portal_secret, digestmod=hashlib.sha1)
         self._workarounds = {}
+        self._workarounds_mtime: float | None = None
+        self._energy_today_from_plant: bool = False
+        self._correct_daily_on_grid_energy: bool = False
+        self._compile_plans()
         self._password: str = portal_password
-
-    async def load_workarounds(self):
-        try:
-            async with aiofiles.open("/config/custom_components/solis/workarounds.yaml", "r") as file:
-                content = await file.read()
-                self._workarounds = yaml.safe_load(content)
-                _LOGGER.debug("workarounds: %s", self._workarounds)
-        except FileNotFoundError:
-            pass
+        self._requests_per_second: float = requests_per_second
+        self._control_concurrency: int = max(1, control_concurrency)
+        self._refresh_control: int = refresh_control
+        self._json_decoder: str = json_decoder
+
+    async def load_workarounds(self) -> None:
+        """(Re)load the workarounds in the executor, only when the file changed"""
+        loaded = await asyncio.get_running_loop().run_in_executor(
+            None, _read_workarounds, WORKAROUNDS_FILE, self._workarounds_mtime
+        )
+        if loaded is None:
+            return
+        self._workarounds_mtime, self._workarounds = loaded
+        _LOGGER.debug("workarounds: %s", self._workarounds)
+        self._compile_plans()
+
+    def _compile_plans(self) -> None:
+        """Resolve the workarounds and compile the payload mappings once"""
+        self._energy_today_from_plant = bool(self._workarounds.get("use_energy_today_from_plant", False))
+        self._correct_daily_on_grid_energy = bool(self._workarounds.get("correct_daily_on_grid_energy_enabled", False))
+        if self._energy_today_from_plant:
+            _LOGGER.debug("Using stationDetail for energy_today")
+            self._inverter_plan = _compile_plan(INVERTER_DATA[INVERTER_DETAIL], skip=(INVERTER_ENERGY_TODAY,))
+            self._plant_plan = _compile_plan(INVERTER_DATA[PLANT_DETAIL])
+        else:
+            _LOGGER.debug("Using inverterDetail for energy_today")
+            self._inverter_plan = _compile_plan(INVERTER_DATA[INVERTER_DETAIL])
+            self._plant_plan = _compile_plan(INVERTER_DATA[PLANT_DETAIL], skip=(INVERTER_ENERGY_TODAY,))
 
     @property
     def key_id(self) -> str:
@@ -295,11 +447,56 @@ class SoliscloudConfig(PortalConfig):
         """API Key."""
         return self._secret
 
+    @property
+    def signer(self) -> hmac.HMAC:
+        """Return a fresh HMAC-SHA1 object keyed with the secret."""
+        return self._signer.copy()
+
+    @property
+    def json_decoder(self) -> str:
+        """Name of the decoder used for responses."""
+        return self._json_decoder
+
+    @property
+    def requests_per_second(self) -> float:
+        """Maximum number of API calls per second."""
+        return self._requests_per_second
+
+    @property
+    def control_concurrency(self) -> int:
+        """Maximum number of control reads in flight."""
+        return self._control_concurrency
+
+    @property
+    def refresh_control(self) -> int:
+        """Seconds between two reads of all control values."""
+        return self._refresh_control
+
     @property
     def workarounds(self) -> dict[str, Any]:
         """Return all workaround settings"""
         return self._workarounds
 
+    @property
+    def energy_today_from_plant(self) -> bool:
+        """Take energy today from stationDetail instead of inverterDetail"""
+        return self._energy_today_from_plant
+
+    @property
+    def correct_daily_on_grid_energy(self) -> bool:
+        """SolisCloud returns daily on grid energy a factor 10 off"""
+        return self._correct_daily_on_grid_energy
+
+    @property
+    def inverter_plan(self) -> ExtractionPlan:
+        """Compiled mapping for inverterDetail payloads"""
+        return self._inverter_plan
+
+    @property
+    def plant_plan(self) -> ExtractionPlan:
+        """Compiled mapping for stationDetail payloads"""
+        return self._plant_plan
+
 
 class SoliscloudAPI(BaseAPI):
     """Class with functions for reading data from the Soliscloud Portal."""
@@ -308,10 +505,35 @@ class SoliscloudAPI(BaseAPI):
         self._config: SoliscloudConfig = config
         self._session: ClientSession | None = None
         self._is_online: bool = False
-        self._data: dict[str, str | int | float] = {}
         self._inverter_list: dict[str, str] | None = None
         self._token = ""
         self._hmi_fb00 = {}
+        self._rate_limiter = AdaptiveRateLimiter(config.requests_per_second)
+        self._decode = json_decoder(config.json_decoder)
+        self._retry_policy = RetryPolicy()
+        self._breaker = CircuitBreaker()
+        self._single_flight = SingleFlight()
+        self._write_locks: dict[str, asyncio.Lock] = {}
+        self._token_lock = asyncio.Lock()
+        self._token_generation: int = 0
+        # Final failure class of the last request per endpoint, None on success
+        self._last_failure: dict[str, str | None] = {}
+        # Failure class of the last poll per inverter, None on success
+        self._inverter_failure: dict[str, str | None] = {}
+        # Inverters whose last control refresh was rejected as a whole
+        self._control_failure: dict[str, str] = {}
+        self._station_details: dict[str, tuple[float, asyncio.Future]] = {}
+        self._control_reads = asyncio.Semaphore(config.control_concurrency)
+        self._control_data: dict[str, dict[str, Any]] = {}
+        # Monotonic time the controls of an inverter are due for a refresh
+        self._control_due: dict[str, float] = {}
+        # Bumped when a write to an inverter starts and ends, with the generation per written cid
+        self._write_generation: dict[str, int] = {}
+        self._written_cids: dict[str, dict[str, int]] = {}
+        self._last_timestamp: dict[str, tuple[Any, date]] = {}
+        self._unpublished_timestamp: dict[str, tuple[Any, date]] = {}
+        # Data fetched while validating inverters at login, reused until the first update
+        self._login_data: dict[str, GinlongData] = {}
 
     @property
     def api_name(self) -> str:
@@ -331,10 +553,59 @@ class SoliscloudAPI(BaseAPI):
         """Returns if we are logged in."""
         return self._is_online
 
+    @property
+    def available(self) -> bool:
+        """Returns False while the circuit breaker keeps requests from the portal."""
+        return self._breaker.available
+
+    async def probe(self) -> bool:
+        """
+        Let the circuit breaker probe the portal with the cheap inverterList
+        call, instead of with the first of many concurrent polls.
+        """
+        if self._breaker.state == BREAKER_CLOSED:
+            return True
+        _LOGGER.debug("Probing portal")
+        await self.fetch_inverter_list(self.config.plant_id)
+        return self._breaker.state == BREAKER_CLOSED
+
+    @property
+    def login_data(self) -> dict[str, GinlongData]:
+        """Data fetched during login that was not handed out for publication yet"""
+        return self._login_data
+
+    def take_login_data(self) -> dict[str, GinlongData]:
+        """Hand out the data fetched during login once, from then on it counts as published"""
+        login_data, self._login_data = self._login_data, {}
+        for inverter_serial in login_data:
+            if inverter_serial in self._unpublished_timestamp:
+                self._last_timestamp[inverter_serial] = self._unpublished_timestamp.pop(inverter_serial)
+        return login_data
+
+    def last_failure(self, endpoint: str) -> str | None:
+        """Return the failure class of the last request to endpoint, None if it succeeded."""
+        return self._last_failure.get(endpoint)
+
+    def inverter_failure(self, inverter_serial: str) -> str | None:
+        """Return the failure class of the last poll of inverter_serial, None if it succeeded."""
+        return self._inverter_failure.get(inverter_serial)
+
+    def requires_relogin(self, inverter_serials: list[str]) -> bool:
+        """Only failures that persist after retrying warrant a new session, also of control reads"""
+        return FAILURE_AUTH in self._control_failure.values() or any(
+            self._inverter_failure.get(serial) not in (None, FAILURE_TRANSIENT, FAILURE_CIRCUIT_OPEN)
+            for serial in inverter_serials
+        )
+
+    async def reload_config(self) -> None:
+        """Workarounds are re-read when the file changed, without restarting the integration"""
+        await self._config.load_workarounds()
+
     async def login(self, session: ClientSession) -> bool:
         """See if we can build a list of inverters"""
         self._session = session
         self._inverter_list = None
+        self._login_data = {}
 
         # Load workarounds
         await self._config.load_workarounds()
@@ -352,6 +623,7 @@ class SoliscloudAPI(BaseAPI):
                 data = await self.fetch_inverter_data(inv)
                 try:
                     self._plant_name = getattr(data, INVERTER_PLANT_NAME)
+                    self._login_data[inv] = data
                 except AttributeError:
                     _LOGGER.info("No access to inverter %s, removing", inv)
                     del self._inverter_list[inv]
@@ -382,6 +654,12 @@ class SoliscloudAPI(BaseAPI):
         self._session = None
         self._is_online = False
         self._inverter_list = None
+        self._station_details = {}
+        self._control_due = {}
+        self._last_failure = {}
+        self._inverter_failure = {}
+        self._control_failure = {}
+        self._login_data = {}
 
     async def fetch_inverter_list(self, plant_id: str) -> dict[str, str]:
         """
@@ -391,7 +669,7 @@ class SoliscloudAPI(BaseAPI):
         device_ids = {}
 
         params = {"stationId": plant_id}
-        result = await self._post_data_json("/v1/api/inverterList", params)
+        result = await self._post_data_json(INVERTER_LIST, params)
 
         if result[SUCCESS] is True:
             result_json: dict = result[CONTENT]
@@ -410,59 +688,122 @@ class SoliscloudAPI(BaseAPI):
                     device_ids[serial] = device_id
             except TypeError:
                 _LOGGER.debug("Response contains unexpected data: %s", result_json)
-        elif result[STATUS_CODE] == 408:
-            now = datetime.now().strftime("%d-%m-%Y %H:%M GMT")
-            _LOGGER.warning(
-                "Your system time must be set correctly for this integration \
-            to work, your time is %s",
-                now,
-            )
         return device_ids
 
-    async def fetch_inverter_data(self, inverter_serial: str, controls=True) -> GinlongData | None:
+    async def fetch_inverter_data(
+        self, inverter_serial: str, controls=True, skip_unchanged=False
+    ) -> GinlongData | None:
         """
         Fetch data for given inverter.
         Collect available data from payload and store as GinlongData object
+        With skip_unchanged the data is only collected when the portal received new data
         """
         _LOGGER.debug("Fetching data for serial: %s", inverter_serial)
-        self._data = {}
-        control_data = {}
         if self.is_online:
             if self._inverter_list is not None and inverter_serial in self._inverter_list:
                 device_id = self._inverter_list[inverter_serial]
-                # Throttle http calls to avoid 502 error
-                await asyncio.sleep(1)
                 payload = await self._get_inverter_details(device_id, inverter_serial)
-                await asyncio.sleep(1)
-                payload_detail = await self._get_station_details(self.config.plant_id)
-                if payload is not None:
-                    self._collect_inverter_data(payload)
-                    if inverter_serial not in self._hmi_fb00:
-                        hmi_flag = self._data[HMI_VERSION_ALL]
-                        self._hmi_fb00[inverter_serial] = int(hmi_flag, 16) >= int("4b00", 16)
-                        if self._hmi_fb00[inverter_serial]:
-                            _LOGGER.debug(
-                                f"HMI firmware version ({hmi_flag}) >=4B00 for Inverter SN {inverter_serial} "
-                            )
-                        else:
-                            _LOGGER.debug(
-                                f"HMI firmware version ({hmi_flag}) <4B00 for Inverter SN {inverter_serial} "
-                            )
-
-                if (self._token != "") and controls:
-                    _LOGGER.debug(f"Fetching control data for SN:{inverter_serial}")
-                    control_data = await self.get_control_data(inverter_serial)
-
-                if payload_detail is not None:
-                    self._collect_plant_data(payload_detail)
-
-                if self._data is not None and INVERTER_SERIAL in self._data:
-                    self._post_process()
-                    return GinlongData(self._data | control_data)
-
-                _LOGGER.debug("Unexpected response from server: %s", payload)
+                record = payload["data"] if payload is not None else None
+                data = await self._process_inverter_record(inverter_serial, record, controls, skip_unchanged)
+                if data is None and self._inverter_failure.get(inverter_serial) is None:
+                    # Answered, but without usable data
+                    self._inverter_failure[inverter_serial] = FAILURE_API
+                return data
+        return None
+
+    async def fetch_all_inverter_data(self, controls=True, skip_unchanged=False) -> dict[str, GinlongData]:
+        """
+        Fetch data for all inverters in bulk, 100 inverters per call.
+        Returns { inverter serial : GinlongData } for every inverter with valid data
+        """
+        _LOGGER.debug("Fetching data for all inverters")
+        all_data: dict[str, GinlongData] = {}
+        if self.is_online and self._inverter_list is not None:
+            records = await self._get_inverter_detail_list(set(self._inverter_list))
+            serials = [serial for serial in records if serial in self._inverter_list]
+            results = await asyncio.gather(
+                *[
+                    self._process_inverter_record(serial, records[serial], controls, skip_unchanged)
+                    for serial in serials
+                ]
+            )
+            for serial, data in zip(serials, results):
+                if data is not None:
+                    all_data[serial] = data
+            # Inverters missing from the list share the failure of the last page
+            failure = self._last_failure.get(INVERTER_DETAIL_LIST) or FAILURE_API
+            for serial in self._inverter_list:
+                self._inverter_failure[serial] = None if serial in all_data else failure
+        return all_data
+
+    async def _process_inverter_record(
+        self, inverter_serial: str, record: dict[str, Any] | None, controls: bool, skip_unchanged: bool = False
+    ) -> GinlongData | None:
+        """Combine an inverter record with plant and control data."""
+        control_data = {}
+        if skip_unchanged and record is not None and self._is_unchanged(inverter_serial, record, controls):
+            _LOGGER.debug("No new data for serial: %s", inverter_serial)
+            return GinlongData(
+                {
+                    INVERTER_SERIAL: inverter_serial,
+                    INVERTER_TIMESTAMP_UPDATE: float(record[DATA_TIMESTAMP]) / 1000,
+                },
+                unchanged=True,
+            )
+
+        payload_detail = await self._get_cached_station_details(self.config.plant_id)
+        if record is not None and inverter_serial not in self._hmi_fb00:
+            self._detect_hmi_version(inverter_serial, record)
+
+        if (self._token != "") and controls:
+            control_data = await self.get_cached_control_data(inverter_serial)
+
+        # Collect into a buffer owned by this call, so concurrent fetches don't interfere
+        data: dict[str, str | int | float] = {}
+        if record is not None:
+            self._collect_inverter_data(record, data)
+
+        if payload_detail is not None:
+            self._collect_plant_data(payload_detail, data)
+
+        if INVERTER_SERIAL in data:
+            self._post_process(data)
+            if record is not None:
+                # Only remember records that are passed on for publication
+                timestamp = (record.get(DATA_TIMESTAMP), date.today())
+                if skip_unchanged:
+                    self._last_timestamp[inverter_serial] = timestamp
+                else:
+                    self._unpublished_timestamp[inverter_serial] = timestamp
+            return GinlongData(data, control_data)
+
+        _LOGGER.debug("Unexpected response from server: %s", record)
         return None
 
+    def _is_unchanged(self, inverter_serial: str, record: dict[str, Any], controls: bool) -> bool:
+        """True if the data logger did not upload since the last processed record."""
+        timestamp = record.get(DATA_TIMESTAMP)
+        if timestamp is None or self._last_timestamp.get(inverter_serial) != (timestamp, date.today()):
+            # Also process the first record of a new day, energy today depends on it
+            return False
+        if controls and self._token != "":
+            # Don't postpone control data that is due for a refresh
+            due = self._control_due.get(inverter_serial)
+            return due is not None and time.monotonic() < due
+        return True
+
+    def _detect_hmi_version(self, inverter_serial: str, record: dict[str, Any]) -> None:
+        """Determine if inverter runs HMI firmware 4B00 or newer."""
+        key, type_, precision = INVERTER_DATA[INVERTER_DETAIL][HMI_VERSION_ALL]
+        hmi_flag = self._get_value(record, key, type_, precision)
+        if hmi_flag is None:
+            return
+        self._hmi_fb00[inverter_serial] = int(hmi_flag, 16) >= int("4b00", 16)
+        if self._hmi_fb00[inverter_serial]:
+            _LOGGER.debug(f"HMI firmware version ({hmi_flag}) >=4B00 for Inverter SN {inverter_serial} ")
+        else:
+            _LOGGER.debug(f"HMI firmware version ({hmi_flag}) <4B00 for Inverter SN {inverter_serial} ")
+
     async def _get_inverter_details(self, device_id: str, device_serial: str) -> dict[str, Any] | None:
         """
         Update inverter details
@@ -472,6 +813,7 @@ class SoliscloudAPI(BaseAPI):
         params = {"id": device_id, "sn": device_serial}
 
         result = await self._post_data_json(INVERTER_DETAIL, params)
+        self._inverter_failure[device_serial] = result[FAILURE]
 
         jsondata = None
         if result[SUCCESS] is True:
@@ -488,60 +830,90 @@ class SoliscloudAPI(BaseAPI):
             _LOGGER.info("Unable to fetch details for device with ID: %s", device_id)
         return jsondata
 
-    def _collect_inverter_data(self, payload: dict[str, Any]) -> None:
+    def _collect_inverter_data(self, record: dict[str, Any], data: dict[str, Any]) -> None:
         """Fetch dynamic properties"""
-        jsondata = payload["data"]
-        attributes = INVERTER_DATA[INVERTER_DETAIL]
-        collect_energy_today = True
-        try:
-            collect_energy_today = not self.config.workarounds["use_energy_today_from_plant"]
-        except KeyError:
-            pass
-        if collect_energy_today:
-            _LOGGER.debug("Using inverterDetail for energy_today")
+        self._extract(self.config.inverter_plan, record, data)
 
-        for dictkey in attributes:
-            key = attributes[dictkey][0]
-            type_ = attributes[dictkey][1]
-            precision = attributes[dictkey][2]
-            if key is not None:
-                value = None
-                if dictkey != INVERTER_ENERGY_TODAY or collect_energy_today:
-                    value = self._get_value(jsondata, key, type_, precision)
-                if value is not None:
-                    self._data[dictkey] = value
+    async def get_cached_control_data(self, inverter_serial: str) -> dict[str, Any]:
+        """
+        Control values only change when written, read them every refresh_control seconds.
+        A refresh in which nothing could be read is retried sooner, but not every cycle.
+        """
+        due = self._control_due.get(inverter_serial)
+        if due is None or time.monotonic() >= due:
+            _LOGGER.debug(f"Fetching control data for SN:{inverter_serial}")
+            generation = self._write_generation.get(inverter_serial, 0)
+            token_generation = self._token_generation
+            control_data, failures = await self._read_controls(inverter_serial)
+            if self._write_generation.get(inverter_serial, 0) != generation:
+                # A write overlapped this refresh, keep its read back and refresh again next cycle
+                written = self._written_cids.get(inverter_serial, {})
+                control_data = {cid: value for cid, value in control_data.items() if written.get(cid, 0) <= generation}
+                self._control_data.setdefault(inverter_serial, {}).update(control_data)
+                return self._control_data.get(inverter_serial, {})
+            interval = self.config.refresh_control
+            rejected = self._control_failure.pop(inverter_serial, None)
+            if control_data:
+                self._control_data.setdefault(inverter_serial, {}).update(control_data)
+            else:
+                interval = min(interval, CONTROL_REFRESH_RETRY)
+                if failures and all(failure in (FAILURE_API, FAILURE_AUTH) for failure in failures):
+                    # An expired token is not always reported with 401/403, only in the JSON body.
+                    # Renew the token and retry once, if that is rejected too a new session is needed.
+                    if rejected is None and await self._renew_token(token_generation):
+                        self._control_failure[inverter_serial] = FAILURE_API
+                        interval = 0
+                    else:
+                        self._control_failure[inverter_serial] = FAILURE_AUTH
+                _LOGGER.info(f"No control data for SN:{inverter_serial}, retrying in {interval} seconds")
+            self._control_due[inverter_serial] = time.monotonic() + interval
+        return self._control_data.get(inverter_serial, {})
 
     async def get_control_data(self, device_serial: str, cid="") -> dict[str, Any] | None:
+        control_data, _ = await self._read_controls(device_serial, cid)
+        return control_data
+
+    async def _read_controls(self, device_serial: str, cid="") -> tuple[dict[str, Any], list[str | None]]:
+        """Read cid, or all cids of the inverter, with the failure class of every failed read"""
         control_data = {}
+        failures = []
 
         if device_serial in self._hmi_fb00:
             if cid == "":
-                controls = ALL_CONTROLS[self._hmi_fb00[device_serial]]
+                controls = control_catalog().cids[self._hmi_fb00[device_serial]]
             else:
                 controls = [cid]
-            for cid in controls:
-                params = {"inverterSn": str(device_serial), "cid": str(cid)}
-                attempts = 0
-                valid = False
-                while (attempts < CONTROL_RETRIES) and not valid:
-                    attempts += 1
-                    result = await self._post_data_json(AT_READ, params, csrf=True)
-                    if result[SUCCESS] is True:
-                        jsondata = result[CONTENT]
-                        if jsondata["code"] == "0":
-                            _LOGGER.debug(f"    cid: {str(cid):5s} - {jsondata.get('data',{}).get('msg','')}")
-                            control_data[str(cid)] = jsondata.get("data", {}).get("msg", "")
-                            valid = True
-                        else:
-                            error = f"    cid: {str(cid):5s} - {AT_READ} responded with error: {jsondata['code']}:{jsondata['msg']}"
+            # Read all cids in parallel, bounded by the number of control reads in flight
+            results = await asyncio.gather(*[self._read_control_result(device_serial, cid) for cid in controls])
+            for cid, (value, failure) in zip(controls, results):
+                if value is not None:
+                    control_data[str(cid)] = value
+                else:
+                    failures.append(failure)
 
-                    else:
-                        error = f"  cid: {str(cid):5s} - {AT_READ} responded with error: {result[MESSAGE]}"
+        return control_data, failures
 
-                if not valid:
-                    _LOGGER.info(error)
+    async def _read_control(self, device_serial: str, cid: str) -> str | None:
+        """Read a single cid"""
+        value, _ = await self._read_control_result(device_serial, cid)
+        return value
 
-        return control_data
+    async def _read_control_result(self, device_serial: str, cid: str) -> tuple[str | None, str | None]:
+        """Read a single cid, returns the value or the failure class"""
+        params = {"inverterSn": str(device_serial), "cid": str(cid)}
+        async with self._control_reads:
+            result = await self._post_data_json(AT_READ, params, csrf=True)
+        if result[SUCCESS] is True:
+            jsondata = result[CONTENT]
+            if jsondata["code"] == "0":
+                _LOGGER.debug(f"    cid: {str(cid):5s} - {jsondata.get('data',{}).get('msg','')}")
+                return jsondata.get("data", {}).get("msg", ""), None
+            _LOGGER.info(
+                f"    cid: {str(cid):5s} - {AT_READ} responded with error: {jsondata['code']}:{jsondata['msg']}"
+            )
+        else:
+            _LOGGER.info(f"  cid: {str(cid):5s} - {AT_READ} responded with error: {result[MESSAGE]}")
+        return None, result[FAILURE] or FAILURE_API
 
     async def _get_station_details(self, plant_id: str) -> dict[str, str] | None:
         """
@@ -566,110 +938,134 @@ class SoliscloudAPI(BaseAPI):
             _LOGGER.info("Unable to fetch details for Station with ID: %s", plant_id)
         return None
 
-    def _collect_station_list_data(self, payload: dict[str, Any]) -> None:
-        """Fetch dynamic properties"""
-        jsondata = payload
-        attributes = INVERTER_DATA[PLANT_LIST]
-        collect_energy_today = False
-        try:
-            collect_energy_today = self.config.workarounds["use_energy_today_from_plant"]
-        except KeyError:
-            pass
-        if collect_energy_today:
-            _LOGGER.debug("Using stationDetail for energy_today")
+    async def _get_inverter_detail_list(self, serials: set[str]) -> dict[str, dict[str, Any]]:
+        """
+        Page through inverterDetailList until all requested inverters are found
+        """
 
-        for dictkey in attributes:
-            key = attributes[dictkey][0]
-            type_ = attributes[dictkey][1]
-            precision = attributes[dictkey][2]
-            if key is not None:
-                value = None
-                if dictkey != INVERTER_ENERGY_TODAY or collect_energy_today:
-                    value = self._get_value(jsondata, key, type_, precision)
-                if value is not None:
-                    self._data[dictkey] = value
+        records: dict[str, dict[str, Any]] = {}
+        page_no = 1
+        while True:
+            params = {"pageNo": page_no, "pageSize": BULK_PAGE_SIZE}
+            result = await self._post_data_json(INVERTER_DETAIL_LIST, params)
+            if result[SUCCESS] is not True:
+                _LOGGER.info("Unable to fetch page %d of inverter details", page_no)
+                break
+            jsondata = result[CONTENT]
+            if jsondata["code"] != "0":
+                _LOGGER.info(
+                    "%s responded with error: %s:%s",
+                    INVERTER_DETAIL_LIST,
+                    jsondata["code"],
+                    jsondata["msg"],
+                )
+                break
+            try:
+                page = jsondata["data"]
+                # Records are either listed directly or wrapped in a page object
+                page = page.get("page", page)
+                page_records = page["records"]
+                for record in page_records:
+                    records[record.get("sn")] = record
+            except (KeyError, TypeError, AttributeError):
+                _LOGGER.debug("Response contains unexpected data: %s", jsondata)
+                break
+            if len(page_records) < BULK_PAGE_SIZE or serials.issubset(records):
+                break
+            page_no += 1
+        return records
+
+    async def _get_cached_station_details(self, plant_id: str) -> dict[str, str] | None:
+        """
+        Fetch Station Details once for all inverters polled in the same cycle
+        """
 
-    def _collect_plant_data(self, payload: dict[str, Any]) -> None:
+        now = time.monotonic()
+        cached = self._station_details.get(plant_id)
+        if cached is None or now - cached[0] > STATION_DETAIL_MAX_AGE:
+            # Concurrent callers share the request that is in flight
+            cached = (now, asyncio.ensure_future(self._get_station_details(plant_id)))
+            self._station_details[plant_id] = cached
+        payload = await asyncio.shield(cached[1])
+        if payload is None and self._station_details.get(plant_id) is cached:
+            # Don't hold on to failures, the next inverter tries again
+            del self._station_details[plant_id]
+        return payload
+
+    def _collect_plant_data(self, payload: dict[str, Any], data: dict[str, Any]) -> None:
         """Fetch dynamic properties"""
-        jsondata = payload["data"]
-        attributes = INVERTER_DATA[PLANT_DETAIL]
-        collect_energy_today = False
-        try:
-            collect_energy_today = self.config.workarounds["use_energy_today_from_plant"]
-        except KeyError:
-            pass
-        if collect_energy_today:
-            _LOGGER.debug("Using stationDetail for energy_today")
-
-        for dictkey in attributes:
-            key = attributes[dictkey][0]
-            type_ = attributes[dictkey][1]
-            precision = attributes[dictkey][2]
-            if key is not None:
-                value = None
-                if dictkey != INVERTER_ENERGY_TODAY or collect_energy_today:
-                    value = self._get_value(jsondata, key, type_, precision)
-                if value is not None:
-                    self._data[dictkey] = value
+        self._extract(self.config.plant_plan, payload["data"], data)
+
+    @staticmethod
+    def _extract(plan: ExtractionPlan, jsondata: dict[str, Any], data: dict[str, Any]) -> None:
+        """Run a compiled extraction plan against a payload"""
+        for dictkey, key, converter in plan:
+            data_raw = jsondata.get(key)
+            if data_raw is not None:
+                try:
+                    data[dictkey] = converter(data_raw)
+                except ValueError:
+                    _LOGGER.debug(
+                        "Failed to convert %s, raw value = %s",
+                        key,
+                        data_raw,
+                    )
 
-    def _post_process(self) -> None:
+    def _post_process(self, data: dict[str, Any]) -> None:
         """Cleanup received data."""
-        if self._data:
+        if data:
             # Fix timestamps
             try:
-                self._data[INVERTER_TIMESTAMP_UPDATE] = float(self._data[INVERTER_TIMESTAMP_UPDATE]) / 1000
+                data[INVERTER_TIMESTAMP_UPDATE] = float(data[INVERTER_TIMESTAMP_UPDATE]) / 1000
             except KeyError:
                 pass
 
             # Convert kW into W, etc. depending on unit returned from API.
-            self._fix_units(GRID_TOTAL_POWER, GRID_TOTAL_POWER_STR)
-            self._fix_units(BAT_POWER, BAT_POWER_STR)
-            self._fix_units(BAT_CURRENT, BAT_CURRENT_STR)
-            self._fix_units(BAT_VOLTAGE, BAT_VOLTAGE_STR)
-            self._fix_units(BAT_DAILY_ENERGY_CHARGED, BAT_DAILY_ENERGY_CHARGED_STR)
-            self._fix_units(BAT_DAILY_ENERGY_DISCHARGED, BAT_DAILY_ENERGY_DISCHARGED_STR)
-            self._fix_units(BAT_MONTHLY_ENERGY_CHARGED, BAT_MONTHLY_ENERGY_CHARGED_STR)
-            self._fix_units(BAT_MONTHLY_ENERGY_DISCHARGED, BAT_MONTHLY_ENERGY_DISCHARGED_STR)
-            self._fix_units(BAT_YEARLY_ENERGY_CHARGED, BAT_YEARLY_ENERGY_CHARGED_STR)
-            self._fix_units(BAT_YEARLY_ENERGY_DISCHARGED, BAT_YEARLY_ENERGY_DISCHARGED_STR)
-            self._fix_units(BAT_TOTAL_ENERGY_CHARGED, BAT_TOTAL_ENERGY_CHARGED_STR)
-            self._fix_units(BAT_TOTAL_ENERGY_DISCHARGED, BAT_TOTAL_ENERGY_DISCHARGED_STR)
-            self._fix_units(GRID_TOTAL_CONSUMPTION_POWER, GRID_TOTAL_CONSUMPTION_POWER_STR)
-            self._fix_units(PLANT_TOTAL_CONSUMPTION_POWER, PLANT_TOTAL_CONSUMPTION_POWER_STR)
-            self._fix_units(GRID_TOTAL_ENERGY_USED, GRID_TOTAL_ENERGY_USED_STR)
-            self._fix_units(INVERTER_ACPOWER, INVERTER_ACPOWER_STR)
-            self._fix_units(INVERTER_ENERGY_THIS_MONTH, INVERTER_ENERGY_THIS_MONTH_STR)
-            self._fix_units(INVERTER_ENERGY_THIS_YEAR, INVERTER_ENERGY_THIS_YEAR_STR)
-            self._fix_units(INVERTER_ENERGY_TOTAL_LIFE, INVERTER_ENERGY_TOTAL_LIFE_STR)
-            self._fix_units(GRID_TOTAL_ENERGY_PURCHASED, GRID_TOTAL_ENERGY_PURCHASED_STR)
-            self._fix_units(GRID_DAILY_ON_GRID_ENERGY, GRID_DAILY_ON_GRID_ENERGY_STR)
-            self._fix_units(GRID_MONTHLY_ON_GRID_ENERGY, GRID_MONTHLY_ON_GRID_ENERGY_STR)
-            self._fix_units(GRID_YEARLY_ON_GRID_ENERGY, GRID_YEARLY_ON_GRID_ENERGY_STR)
-            self._fix_units(GRID_TOTAL_ON_GRID_ENERGY, GRID_TOTAL_ON_GRID_ENERGY_STR)
-            self._fix_units(GRID_DAILY_ENERGY_PURCHASED, GRID_DAILY_ENERGY_PURCHASED_STR)
-            self._fix_units(GRID_MONTHLY_ENERGY_PURCHASED, GRID_MONTHLY_ENERGY_PURCHASED_STR)
-            self._fix_units(GRID_YEARLY_ENERGY_PURCHASED, GRID_YEARLY_ENERGY_PURCHASED_STR)
-            self._fix_units(GRID_DAILY_ENERGY_USED, GRID_DAILY_ENERGY_USED_STR)
-            self._fix_units(BYPASS_LOAD_POWER, BYPASS_LOAD_POWER_STR)
+            self._fix_units(data, GRID_TOTAL_POWER, GRID_TOTAL_POWER_STR)
+            self._fix_units(data, BAT_POWER, BAT_POWER_STR)
+            self._fix_units(data, BAT_CURRENT, BAT_CURRENT_STR)
+            self._fix_units(data, BAT_VOLTAGE, BAT_VOLTAGE_STR)
+            self._fix_units(data, BAT_DAILY_ENERGY_CHARGED, BAT_DAILY_ENERGY_CHARGED_STR)
+            self._fix_units(data, BAT_DAILY_ENERGY_DISCHARGED, BAT_DAILY_ENERGY_DISCHARGED_STR)
+            self._fix_units(data, BAT_MONTHLY_ENERGY_CHARGED, BAT_MONTHLY_ENERGY_CHARGED_STR)
+            self._fix_units(data, BAT_MONTHLY_ENERGY_DISCHARGED, BAT_MONTHLY_ENERGY_DISCHARGED_STR)
+            self._fix_units(data, BAT_YEARLY_ENERGY_CHARGED, BAT_YEARLY_ENERGY_CHARGED_STR)
+            self._fix_units(data, BAT_YEARLY_ENERGY_DISCHARGED, BAT_YEARLY_ENERGY_DISCHARGED_STR)
+            self._fix_units(data, BAT_TOTAL_ENERGY_CHARGED, BAT_TOTAL_ENERGY_CHARGED_STR)
+            self._fix_units(data, BAT_TOTAL_ENERGY_DISCHARGED, BAT_TOTAL_ENERGY_DISCHARGED_STR)
+            self._fix_units(data, GRID_TOTAL_CONSUMPTION_POWER, GRID_TOTAL_CONSUMPTION_POWER_STR)
+            self._fix_units(data, PLANT_TOTAL_CONSUMPTION_POWER, PLANT_TOTAL_CONSUMPTION_POWER_STR)
+            self._fix_units(data, GRID_TOTAL_ENERGY_USED, GRID_TOTAL_ENERGY_USED_STR)
+            self._fix_units(data, INVERTER_ACPOWER, INVERTER_ACPOWER_STR)
+            self._fix_units(data, INVERTER_ENERGY_THIS_MONTH, INVERTER_ENERGY_THIS_MONTH_STR)
+            self._fix_units(data, INVERTER_ENERGY_THIS_YEAR, INVERTER_ENERGY_THIS_YEAR_STR)
+            self._fix_units(data, INVERTER_ENERGY_TOTAL_LIFE, INVERTER_ENERGY_TOTAL_LIFE_STR)
+            self._fix_units(data, GRID_TOTAL_ENERGY_PURCHASED, GRID_TOTAL_ENERGY_PURCHASED_STR)
+            self._fix_units(data, GRID_DAILY_ON_GRID_ENERGY, GRID_DAILY_ON_GRID_ENERGY_STR)
+            self._fix_units(data, GRID_MONTHLY_ON_GRID_ENERGY, GRID_MONTHLY_ON_GRID_ENERGY_STR)
+            self._fix_units(data, GRID_YEARLY_ON_GRID_ENERGY, GRID_YEARLY_ON_GRID_ENERGY_STR)
+            self._fix_units(data, GRID_TOTAL_ON_GRID_ENERGY, GRID_TOTAL_ON_GRID_ENERGY_STR)
+            self._fix_units(data, GRID_DAILY_ENERGY_PURCHASED, GRID_DAILY_ENERGY_PURCHASED_STR)
+            self._fix_units(data, GRID_MONTHLY_ENERGY_PURCHASED, GRID_MONTHLY_ENERGY_PURCHASED_STR)
+            self._fix_units(data, GRID_YEARLY_ENERGY_PURCHASED, GRID_YEARLY_ENERGY_PURCHASED_STR)
+            self._fix_units(data, GRID_DAILY_ENERGY_USED, GRID_DAILY_ENERGY_USED_STR)
+            self._fix_units(data, BYPASS_LOAD_POWER, BYPASS_LOAD_POWER_STR)
 
             # Just temporary till SolisCloud is fixed
-            try:
-                if self.config.workarounds["correct_daily_on_grid_energy_enabled"]:
-                    self._data[GRID_DAILY_ON_GRID_ENERGY] = float(self._data[GRID_DAILY_ON_GRID_ENERGY]) * 10
-            except KeyError:
-                pass
+            if self.config.correct_daily_on_grid_energy and GRID_DAILY_ON_GRID_ENERGY in data:
+                data[GRID_DAILY_ON_GRID_ENERGY] = float(data[GRID_DAILY_ON_GRID_ENERGY]) * 10
 
             # turn batteryPower negative when discharging (fix for https://github.com/hultenvp/solis-sensor/issues/158)
             try:
-                self._data[BAT_POWER] = math.copysign(self._data[BAT_POWER], self._data[BAT_CURRENT])
+                data[BAT_POWER] = math.copysign(data[BAT_POWER], data[BAT_CURRENT])
             except KeyError:
                 pass
 
             # Unused phases are still in JSON payload as 0.0, remove them
             # FIXME: use acOutputType
-            self._purge_if_unused(0.0, PHASE1_CURRENT, PHASE1_VOLTAGE)
-            self._purge_if_unused(0.0, PHASE2_CURRENT, PHASE2_VOLTAGE)
-            self._purge_if_unused(0.0, PHASE3_CURRENT, PHASE3_VOLTAGE)
+            self._purge_if_unused(data, 0.0, PHASE1_CURRENT, PHASE1_VOLTAGE)
+            self._purge_if_unused(data, 0.0, PHASE2_CURRENT, PHASE2_VOLTAGE)
+            self._purge_if_unused(data, 0.0, PHASE3_CURRENT, PHASE3_VOLTAGE)
 
             # Unused PV chains are still in JSON payload as 0, remove them
             # FIXME: use dcInputtype (NB num + 1) Unfortunately so are chains that are
@@ -678,39 +1074,39 @@ class SoliscloudAPI(BaseAPI):
             # needs to be fixed at some point in time, but this works.
             try:
                 for i, stringlist in enumerate(STRING_LISTS):
-                    if i > int(self._data[STRING_COUNT]):
-                        self._purge_if_unused(0, *stringlist)
+                    if i > int(data[STRING_COUNT]):
+                        self._purge_if_unused(data, 0, *stringlist)
             except KeyError:
                 # Ignore offline inverters
                 pass
 
-    def _fix_units(self, num_key: str, units_key: str) -> None:
+    def _fix_units(self, data: dict[str, Any], num_key: str, units_key: str) -> None:
         """Convert numeric values according to the units reported by the API."""
         try:
-            if self._data[units_key] == "kW":
-                self._data[num_key] = float(self._data[num_key]) * 1000
-                self._data[units_key] = "W"
+            if data[units_key] == "kW":
+                data[num_key] = float(data[num_key]) * 1000
+                data[units_key] = "W"
 
-            elif self._data[units_key] == "MWh":
-                self._data[num_key] = float(self._data[num_key]) * 1000
-                self._data[units_key] = "kWh"
+            elif data[units_key] == "MWh":
+                data[num_key] = float(data[num_key]) * 1000
+                data[units_key] = "kWh"
 
-            elif self._data[units_key] == "GWh":
-                self._data[num_key] = float(self._data[num_key]) * 1000 * 1000
-                self._data[units_key] = "kWh"
+            elif data[units_key] == "GWh":
+                data[num_key] = float(data[num_key]) * 1000 * 1000
+                data[units_key] = "kWh"
 
         except KeyError:
             pass
 
-    def _purge_if_unused(self, value: Any, *elements: str) -> None:
+    def _purge_if_unused(self, data: dict[str, Any], value: Any, *elements: str) -> None:
         for element in elements:
             try:
-                if self._data[element] != value:
+                if data[element] != value:
                     return
             except KeyError:
                 return
         for element in elements:
-            self._data.pop(element)
+            data.pop(element)
 
     def _get_value(self, data: dict[str, Any], key: str, type_: type, precision: int = 2) -> str | int | float | None:
         """Retrieve 'key' from 'data' as type 'type_' with precision 'precision'"""
@@ -747,14 +1143,14 @@ class SoliscloudAPI(BaseAPI):
                 resp = await self._session.get(url, params=params)
 
                 result[STATUS_CODE] = resp.status
-                result[CONTENT] = await resp.json()
+                result[CONTENT] = await self._read_json(resp)
                 if resp.status == HTTPStatus.OK:
                     result[SUCCESS] = True
                     result[MESSAGE] = "OK"
                 else:
                     result[MESSAGE] = "Got http statuscode: %d" % (resp.status)
                 return result
-        except (asyncio.TimeoutError, ClientError) as err:
+        except (asyncio.TimeoutError, ClientError, ValueError) as err:
             result[MESSAGE] = "Exception: %s" % err.__class__
             _LOGGER.debug("Error: %s", result[MESSAGE])
             return result
@@ -762,10 +1158,15 @@ class SoliscloudAPI(BaseAPI):
             if resp is not None:
                 await resp.release()
 
-    def _prepare_header(self, body: dict[str, str], canonicalized_resource: str) -> dict[str, str]:
-        content_md5 = base64.b64encode(
-            hashlib.md5(json.dumps(body, separators=(",", ":")).encode("utf-8")).digest()
-        ).decode("utf-8")
+    async def _read_json(self, resp: ClientResponse) -> Any:
+        """Read the raw body once and decode it."""
+        body = await resp.read()
+        if not body.strip():
+            return None
+        return self._decode(body)
+
+    def _prepare_header(self, body: bytes, canonicalized_resource: str) -> dict[str, str]:
+        content_md5 = base64.b64encode(hashlib.md5(body).digest()).decode("utf-8")
 
         content_type = "application/json"
 
@@ -773,7 +1174,8 @@ class SoliscloudAPI(BaseAPI):
         date = now.strftime("%a, %d %b %Y %H:%M:%S GMT")
 
         encrypt_str = VERB + "\n" + content_md5 + "\n" + content_type + "\n" + date + "\n" + canonicalized_resource
-        hmac_obj = hmac.new(self.config.secret, msg=encrypt_str.encode("utf-8"), digestmod=hashlib.sha1)
+        hmac_obj = self.config.signer
+        hmac_obj.update(encrypt_str.encode("utf-8"))
         sign = base64.b64encode(hmac_obj.digest())
         authorization = "API " + self.config.key_id + ":" + sign.decode("utf-8")
 
@@ -790,35 +1192,137 @@ class SoliscloudAPI(BaseAPI):
     ) -> dict[str, Any]:
         """Http-post data to specified domain/canonicalized_resource."""
 
-        header: dict[str, str] = self._prepare_header(params, canonicalized_resource)
+        # Canonical body, sorted keys make it usable as key for identical requests
+        body = json.dumps(params, sort_keys=True, separators=(",", ":")).encode("utf-8")
+        if canonicalized_resource in COALESCED:
+            return await self._single_flight.run(
+                (canonicalized_resource, body, csrf),
+                partial(self._post_with_retries, canonicalized_resource, body, csrf),
+            )
+        return await self._post_with_retries(canonicalized_resource, body, csrf)
+
+    async def _post_with_retries(self, canonicalized_resource: str, body: bytes, csrf: bool) -> dict[str, Any]:
+        """Http-post body, retry transient failures."""
+
+        if self._session is None:
+            return {SUCCESS: False, MESSAGE: None, STATUS_CODE: None, FAILURE: FAILURE_AUTH}
+        if not self._breaker.allow():
+            _LOGGER.debug("Circuit open, not sending %s", canonicalized_resource)
+            return {
+                SUCCESS: False,
+                MESSAGE: "Portal unavailable",
+                STATUS_CODE: None,
+                FAILURE: FAILURE_CIRCUIT_OPEN,
+            }
+
+        token_generation = self._token_generation
+        for attempt in range(self._retry_policy.attempts):
+            if attempt > 0:
+                delay = self._retry_policy.backoff(attempt - 1)
+                _LOGGER.debug("Retrying %s in %.2f seconds", canonicalized_resource, delay)
+                await asyncio.sleep(delay)
+            result = await self._post_once(canonicalized_resource, body, csrf)
+            if result[FAILURE] != FAILURE_TRANSIENT:
+                break
+        if csrf and result[FAILURE] == FAILURE_AUTH and await self._renew_token(token_generation):
+            # CSRF token expired, try once more with the new one
+            result = await self._post_once(canonicalized_resource, body, csrf)
+        if result[FAILURE] == FAILURE_TRANSIENT:
+            self._breaker.failed()
+        elif result[STATUS_CODE] is not None:
+            # Any answer, even an error, means the portal is alive
+            self._breaker.succeeded()
+        self._last_failure[canonicalized_resource] = result[FAILURE]
+        if result[FAILURE] == FAILURE_CLOCK_SKEW:
+            now = datetime.now().strftime("%d-%m-%Y %H:%M GMT")
+            _LOGGER.warning(
+                "Your system time must be set correctly for this integration \
+            to work, your time is %s",
+                now,
+            )
+        return result
+
+    async def _post_once(self, canonicalized_resource: str, body: bytes, csrf: bool) -> dict[str, Any]:
+        """Single http-post, the result is tagged with the class of failure."""
+
+        header: dict[str, str] = self._prepare_header(body, canonicalized_resource)
         if csrf and self._token != "":
             header["token"] = self._token
 
         # _LOGGER.debug(f"header: {header}")
-        result: dict[str, Any] = {SUCCESS: False, MESSAGE: None, STATUS_CODE: None}
+        result: dict[str, Any] = {SUCCESS: False, MESSAGE: None, STATUS_CODE: None, FAILURE: FAILURE_AUTH}
         resp = None
         if self._session is None:
             return result
+        result[FAILURE] = None
+        # Throttle http calls to avoid 502 error
+        await self._rate_limiter.acquire()
         try:
             async with async_timeout.timeout(10):
                 url = f"{self.config.domain}{canonicalized_resource}"
-                resp = await self._session.post(url, json=params, headers=header)
+                resp = await self._session.post(url, data=body, headers=header)
 
+                if resp.status in RATE_LIMITED:
+                    self._rate_limiter.throttled()
+                elif resp.status == HTTPStatus.OK:
+                    self._rate_limiter.succeeded()
                 result[STATUS_CODE] = resp.status
-                result[CONTENT] = await resp.json()
+                result[FAILURE] = _classify_status(resp.status)
+                result[CONTENT] = await self._read_json(resp)
                 if resp.status == HTTPStatus.OK:
                     result[SUCCESS] = True
                     result[MESSAGE] = "OK"
+                    if isinstance(result[CONTENT], dict) and result[CONTENT].get("code", "0") != "0":
+                        result[FAILURE] = FAILURE_API
                 else:
                     result[MESSAGE] = "Got http statuscode: %d" % (resp.status)
-        except (asyncio.TimeoutError, ClientError) as err:
+        except (asyncio.TimeoutError, ClientError, ValueError) as err:
+            result[SUCCESS] = False
             result[MESSAGE] = f"{repr(err)}"
+            # A body that can't be decoded keeps the class of the http status,
+            # only a missing or garbled healthy answer is worth retrying
+            if result[STATUS_CODE] is None or result[FAILURE] is None:
+                result[FAILURE] = FAILURE_TRANSIENT
             _LOGGER.debug("Error from URI (%s) : %s", canonicalized_resource, result[MESSAGE])
         finally:
             if resp is not None:
                 await resp.release()
             return result
 
+    async def _renew_token(self, stale_generation: int) -> bool:
+        """Fetch a new CSRF token, unless another request already renewed the stale one"""
+        if not self.config._password:
+            return False
+        async with self._token_lock:
+            if self._token_generation != stale_generation:
+                return self._token != ""
+            _LOGGER.debug("Renewing CSRF token")
+            self._token = await self._fetch_token(self.config.username, self.config._password)
+            self._token_generation += 1
+            return self._token != ""
+
+    async def refresh_session(self) -> bool:
+        """
+        Recover from an auth error without a full login: re-check the
+        inverter list and renew the CSRF token.
+        """
+        _LOGGER.debug("Refreshing session")
+        inverter_list = await self.fetch_inverter_list(self.config.plant_id)
+        if len(inverter_list) == 0 or self._inverter_list is None:
+            return False
+        # Inverters validated at login only, new ones are picked up by the next full login
+        self._inverter_list = {
+            serial: device_id for serial, device_id in inverter_list.items() if serial in self._inverter_list
+        }
+        if len(self._inverter_list) == 0:
+            return False
+        if self._token != "":
+            await self._renew_token(self._token_generation)
+        self._last_failure = {}
+        self._inverter_failure = {}
+        self._control_failure = {}
+        return True
+
     async def _fetch_token(self, username: str, password: str) -> str:
         """
         Fetch CSRF token for station control
@@ -839,9 +1343,36 @@ class SoliscloudAPI(BaseAPI):
             _LOGGER.info("Unable to fetch authentication token with username and password")
         return ""
 
-    async def write_control_data(self, device_serial: str, cid: str, value: str):
+    def control_value(self, device_serial: str, cid: str) -> str | None:
+        """Return the last value read for cid"""
+        return self._control_data.get(device_serial, {}).get(str(cid))
+
+    async def write_control_data(self, device_serial: str, cid: str, value: str) -> bool:
+        """
+        Write value to cid and poll it back until the inverter confirms it.
+        Writes to the same inverter are serialized, different inverters are written in parallel.
+        """
+        async with self._write_locks.setdefault(device_serial, asyncio.Lock()):
+            self._mark_written(device_serial, str(cid))
+            try:
+                if not await self._send_control(device_serial, str(cid), value):
+                    return False
+                confirmed = await self._confirm_control(device_serial, str(cid), value)
+                # A write can change other settings as well, refresh all controls next cycle
+                self._control_due[device_serial] = 0
+                return confirmed
+            finally:
+                self._mark_written(device_serial, str(cid))
+
+    def _mark_written(self, device_serial: str, cid: str) -> None:
+        """Make control refreshes that overlap a write skip the written cid"""
+        generation = self._write_generation.get(device_serial, 0) + 1
+        self._write_generation[device_serial] = generation
+        self._written_cids.setdefault(device_serial, {})[cid] = generation
+
+    async def _send_control(self, device_serial: str, cid: str, value: str) -> bool:
         _LOGGER.debug(f"Writing value {value} for cid {cid} to inverter {device_serial}")
-        params = {"inverterSn": str(device_serial), "cid": str(cid), "value": value}
+        params = {"inverterSn": str(device_serial), "cid": cid, "value": value}
         result = await self._post_data_json(CONTROL, params, csrf=True)
 
         if result[SUCCESS] is True:
@@ -850,16 +1381,34 @@ class SoliscloudAPI(BaseAPI):
                 jsondata = jsondata["data"][0]
                 if str(jsondata["code"]) == "0":
                     _LOGGER.debug(f"Set code returned OK. Reading code back.")
-                    await asyncio.sleep(CONTROL_DELAY)
-                    control_data = await self.get_control_data(device_serial, cid=str(cid))
-                    _LOGGER.debug(f"Data read back: {control_data.get(str(cid), None)}")
+                    return True
                 else:
                     _LOGGER.info(
-                        f"cid: {str(cid):5s} - {CONTROL} responded with error: {jsondata['code']}:{jsondata.get('msg',None)}"
+                        f"cid: {cid:5s} - {CONTROL} responded with error: {jsondata['code']}:{jsondata.get('msg',None)}"
                     )
             else:
                 _LOGGER.info(
-                    f"cid: {str(cid):5s} - {CONTROL} responded with error: {jsondata['code']}:{jsondata.get('msg',None)}"
+                    f"cid: {cid:5s} - {CONTROL} responded with error: {jsondata['code']}:{jsondata.get('msg',None)}"
                 )
         else:
-            _LOGGER.info(f"  cid: {str(cid):5s} - {CONTROL} responded with error: {result[MESSAGE]}")
+            _LOGGER.info(f"  cid: {cid:5s} - {CONTROL} responded with error: {result[MESSAGE]}")
+        return False
+
+    async def _confirm_control(self, device_serial: str, cid: str, value: str) -> bool:
+        """Read cid back with increasing delays until it matches value or the deadline passes"""
+        deadline = time.monotonic() + CONTROL_CONFIRM_TIMEOUT
+        delay = CONTROL_DELAY
+        while True:
+            await asyncio.sleep(delay)
+            read_back = await self._read_control(device_serial, cid)
+            _LOGGER.debug(f"Data read back: {read_back}")
+            if read_back is not None:
+                self._control_data.setdefault(device_serial, {})[cid] = read_back
+                if _same_control_value(read_back, value):
+                    return True
+            delay = min(CONTROL_CONFIRM_MAX_DELAY, delay * 2)
+            if time.monotonic() + delay > deadline:
+                _LOGGER.warning(
+                    f"cid: {cid:5s} - inverter {device_serial} did not confirm value {value}, last read: {read_back}"
+                )
+                return False
@@ -1,4 +1,3 @@
-import asyncio
 import logging
 from datetime import datetime
 
@@ -8,11 +7,9 @@ from homeassistant.core import HomeAssistant
 
 from .const import DOMAIN, LAST_UPDATED
 from .control_const import (
-    ALL_CONTROLS,
-    RETRIES,
-    RETRY_WAIT,
     SolisBaseControlEntity,
     SolisTimeEntityDescription,
+    async_add_control_entities,
 )
 from .service import InverterService, ServiceSubscriber
 
@@ -31,45 +28,25 @@ async def async_setup_entry(hass: HomeAssistant, config_entry: ConfigEntry, asyn
     service = hass.data[DOMAIN][config_entry.entry_id]
 
     _LOGGER.info(f"Waiting for discovery of controls for plant {plant_id}")
-    await asyncio.sleep(RETRY_WAIT)
-    attempts = 0
-    while (attempts < RETRIES) and (not service.has_controls):
-        _LOGGER.debug(f"    Attempt {attempts} failed")
-        await asyncio.sleep(RETRY_WAIT)
-        attempts += 1
-
-    _LOGGER.debug(f"    Attempt {attempts} succeeded")
-
-    if service.has_controls:
-        entities = []
-        _LOGGER.debug(f"Plant ID {plant_id} has controls:")
-        for inverter_sn in service.controls:
-            for cid, index, entity, button, initial_value in service.controls[inverter_sn]["time"]:
-                # service.set_active_times(inverter_sn, cid, index, (None, None)
-                entities.append(
-                    SolisTimeEntity(
-                        service,
-                        config_entry.data["name"],
-                        inverter_sn,
-                        cid,
-                        entity,
-                        index,
-                        initial_value,
-                    )
-                )
-
-        if len(entities) > 0:
-            _LOGGER.debug(f"Creating {len(entities)} time entities")
-            async_add_entities(entities)
-        else:
-            _LOGGER.debug(f"No time controls found for Plant ID {plant_id}")
-
-    else:
-        _LOGGER.debug(f"No time found for Plant ID {plant_id}")
-
+    # Don't block the setup, entities are added as soon as discovery completes
+    config_entry.async_create_background_task(
+        hass,
+        _async_add_controls(service, config_entry, async_add_entities),
+        f"{DOMAIN} time controls {plant_id}",
+    )
     return True
 
 
+async def _async_add_controls(service: InverterService, config_entry: ConfigEntry, async_add_entities) -> None:
+    """Add the entities once discovery completed, revalidation can add or remove them later"""
+    name = config_entry.data["name"]
+
+    def create_entity(inverter_sn, cid, index, description, button, initial_value):
+        return SolisTimeEntity(service, name, inverter_sn, cid, description, index, initial_value)
+
+    await async_add_control_entities(service, "time", create_entity, async_add_entities)
+
+
 class SolisTimeEntity(SolisBaseControlEntity, ServiceSubscriber, TimeEntity):
     def __init__(
         self,
@@ -138,4 +115,5 @@ class SolisTimeEntity(SolisBaseControlEntity, ServiceSubscriber, TimeEntity):
         self._attr_native_value = value
         self._attributes[LAST_UPDATED] = datetime.now()
         self.async_write_ha_state()
+        self.state_changed_locally()
         # await self.write_control_data(str(value))
@@ -0,0 +1,58 @@
+"""Compare per-key attribute lookup with the compiled extraction plan.
+
+Run from the repository root with Home Assistant installed:
+    python test/bench_extraction.py [number]
+"""
+
+import json
+import os
+import sys
+import timeit
+
+sys.path.insert(0, os.path.join(os.path.dirname(__file__), ".."))
+
+from custom_components.solis.soliscloud_api import (  # noqa: E402
+    INVERTER_DATA,
+    INVERTER_DETAIL,
+    SoliscloudAPI,
+    SoliscloudConfig,
+)
+
+PAYLOAD = os.path.join(os.path.dirname(__file__), "payloads", "inverter_detail.json")
+
+
+def legacy(api, record):
+    data = {}
+    attributes = INVERTER_DATA[INVERTER_DETAIL]
+    for dictkey in attributes:
+        key = attributes[dictkey][0]
+        type_ = attributes[dictkey][1]
+        precision = attributes[dictkey][2]
+        if key is not None:
+            value = api._get_value(record, key, type_, precision)
+            if value is not None:
+                data[dictkey] = value
+    return data
+
+
+def compiled(api, record):
+    data = {}
+    api._collect_inverter_data(record, data)
+    return data
+
+
+def main():
+    number = int(sys.argv[1]) if len(sys.argv) > 1 else 10000
+    with open(PAYLOAD, encoding="utf-8") as f:
+        record = json.load(f)["data"]
+    config = SoliscloudConfig("https://www.soliscloud.com:13333", "user", "key", b"secret", "1", "password")
+    api = SoliscloudAPI(config)
+
+    assert legacy(api, record) == compiled(api, record)
+    for name, func in (("legacy", legacy), ("compiled", compiled)):
+        elapsed = timeit.timeit(lambda: func(api, record), number=number)
+        print(f"{name:>8}: {elapsed / number * 1e6:.1f} us per record")
+
+
+if __name__ == "__main__":
+    main()
@@ -0,0 +1,42 @@
+"""Compare response decoders on a recorded inverterDetail payload.
+
+Run from the repository root:
+    python test/bench_json.py [number]
+"""
+
+import json
+import os
+import sys
+import timeit
+
+sys.path.insert(0, os.path.join(os.path.dirname(__file__), ".."))
+
+from custom_components.solis.api_utils import (  # noqa: E402
+    JSON_DECODER_ORJSON,
+    JSON_DECODER_STDLIB,
+    json_decoder,
+)
+
+PAYLOAD = os.path.join(os.path.dirname(__file__), "payloads", "inverter_detail.json")
+
+
+def main():
+    number = int(sys.argv[1]) if len(sys.argv) > 1 else 10000
+    with open(PAYLOAD, "rb") as f:
+        body = f.read()
+
+    # What aiohttp's resp.json() does: decode the bytes to text, then parse
+    candidates = {"resp.json()": lambda: json.loads(body.decode("utf-8"))}
+    for name in (JSON_DECODER_STDLIB, JSON_DECODER_ORJSON):
+        decode = json_decoder(name)
+        candidates[f"{name} ({decode.__module__})"] = lambda decode=decode: decode(body)
+
+    expected = json.loads(body)
+    for name, func in candidates.items():
+        assert func() == expected
+        elapsed = timeit.timeit(func, number=number)
+        print(f"{name:>16}: {elapsed / number * 1e6:.1f} us per payload")
+
+
+if __name__ == "__main__":
+    main()
@@ -0,0 +1,84 @@
+"""Check that a control refresh overlapping a confirmed write keeps the written value.
+
+Run from the repository root with Home Assistant installed:
+    python test/check_control_refresh.py
+"""
+
+import asyncio
+import json
+import os
+import sys
+
+sys.path.insert(0, os.path.join(os.path.dirname(__file__), ".."))
+
+from custom_components.solis.control_const import control_catalog  # noqa: E402
+from custom_components.solis.soliscloud_api import (  # noqa: E402
+    SoliscloudAPI,
+    SoliscloudConfig,
+)
+
+SERIAL = "SN001"
+CID = "157"
+# The written cid answers fast, the other reads keep the refresh in flight until after the write
+READ_LATENCY = 0.5  # seconds
+
+
+class FakeResponse:
+    def __init__(self, body):
+        self.status = 200
+        self._body = json.dumps(body).encode("utf-8")
+
+    async def read(self):
+        return self._body
+
+    async def release(self):
+        pass
+
+
+class FakeSession:
+    """Portal that answers atRead with the value at the time the read arrived"""
+
+    def __init__(self):
+        self.controls = {}
+
+    async def post(self, url, data=None, headers=None):
+        params = json.loads(data)
+        if url.endswith("/v2/api/control"):
+            self.controls[params["cid"]] = params["value"]
+            return FakeResponse({"code": "0", "data": [{"code": "0"}]})
+        value = self.controls.get(params["cid"], "10")
+        await asyncio.sleep(0.01 if params["cid"] == CID else READ_LATENCY)
+        return FakeResponse({"code": "0", "data": {"msg": value}})
+
+
+async def main():
+    config = SoliscloudConfig(
+        "https://www.soliscloud.com:13333",
+        "user",
+        "key",
+        b"secret",
+        "1",
+        "password",
+        requests_per_second=1000,
+        control_concurrency=100,
+    )
+    api = SoliscloudAPI(config)
+    api._session = FakeSession()
+    api._token = "token"
+    api._hmi_fb00[SERIAL] = True
+    assert CID in control_catalog().cids[True]
+
+    refresh = asyncio.ensure_future(api.get_cached_control_data(SERIAL))
+    await asyncio.sleep(0.05)
+    confirmed = await api.write_control_data(SERIAL, CID, "55")
+    assert not refresh.done(), "refresh finished before the write, no overlap"
+    await refresh
+
+    assert confirmed, "write was not confirmed"
+    assert api.control_value(SERIAL, CID) == "55", f"refresh overwrote the write: {api.control_value(SERIAL, CID)}"
+    assert api._control_due[SERIAL] == 0, "overlapping refresh postponed the next one"
+    print("OK: overlapping refresh kept the written value")
+
+
+if __name__ == "__main__":
+    asyncio.run(main())